@@ -0,0 +1,64 @@
+import threading
+from enum import Enum
+
+import pytest
+
+from tracker import AggregatingEventHandler, IAggregateSink, TrackerEvent
+
+EMITS_PER_THREAD = 1000
+
+
+class BenchmarkEvents(Enum):
+    PAYMENT_APPROVED = "payment_approved"
+
+
+EVENT = TrackerEvent(
+    event=BenchmarkEvents.PAYMENT_APPROVED,
+    tags={"method": "pix", "bank": "a", "amount": 10.5},
+)
+
+
+class NullSink(IAggregateSink):
+    def write(self, records):
+        pass
+
+
+def make_handler(value_keys=()):
+    return AggregatingEventHandler(
+        NullSink(),
+        AggregatingEventHandler.AggregationConfig(interval=None, value_keys=value_keys),
+    )
+
+
+@pytest.mark.benchmark(group="aggregation-capture")
+@pytest.mark.parametrize("value_keys", [(), ("amount",)], ids=["counter", "values"])
+def test_aggregate_capture_event(benchmark, value_keys):
+    handler = make_handler(value_keys)
+
+    benchmark(handler.capture_event, EVENT)
+
+
+@pytest.mark.benchmark(group="aggregation-contention")
+@pytest.mark.parametrize("threads", [1, 4, 16])
+def test_aggregate_contention(benchmark, threads):
+    handler = make_handler(("amount",))
+
+    def emit():
+        for _ in range(EMITS_PER_THREAD):
+            handler.capture_event(EVENT)
+
+    def run():
+        workers = [threading.Thread(target=emit) for _ in range(threads)]
+
+        for worker in workers:
+            worker.start()
+
+        for worker in workers:
+            worker.join()
+
+        handler.flush()
+
+    benchmark.pedantic(run, rounds=10, warmup_rounds=1)
+    benchmark.extra_info["emits_per_second"] = (
+        threads * EMITS_PER_THREAD / benchmark.stats.stats.mean
+    )
@@ -0,0 +1,50 @@
+import itertools
+from enum import Enum
+
+import pytest
+
+from tracker import CardinalityGuard, Tracker, TrackerEvent
+
+
+class BenchmarkEvents(Enum):
+    CREATED = "created"
+
+
+class NullHandler:
+    def capture_event(self, tracker_event):
+        pass
+
+    def shared_core(self):
+        return self
+
+
+def make_guard():
+    return CardinalityGuard(CardinalityGuard.CardinalityConfig(max_values_per_key=100))
+
+
+@pytest.mark.benchmark(group="cardinality-limit")
+def test_cardinality_known_values(benchmark):
+    guard = make_guard()
+    tags = {"method": "pix", "bank": "a", "attempt": 1}
+
+    benchmark(guard.limit, tags)
+
+
+@pytest.mark.benchmark(group="cardinality-limit")
+def test_cardinality_hostile_values(benchmark):
+    # Every call brings a never-seen user id, past the per-key limit.
+    guard = make_guard()
+    user_ids = itertools.count()
+
+    benchmark(lambda: guard.limit({"method": "pix", "user_id": next(user_ids)}))
+
+
+@pytest.mark.benchmark(group="cardinality-emit")
+@pytest.mark.parametrize("guarded", [False, True])
+def test_emit_event_cardinality(benchmark, guarded):
+    tracker = Tracker(
+        event_handlers=[NullHandler()], cardinality=make_guard() if guarded else None
+    )
+    event = TrackerEvent(event=BenchmarkEvents.CREATED, tags={"method": "pix"})
+
+    benchmark(tracker.emit_event, event)
@@ -0,0 +1,68 @@
+import tracemalloc
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+import pytest
+
+from tracker.dtos import FrozenTrackerEvent, TrackerEvent
+from tracker.registry import enum_registry, enum_value
+from tracker.types import Contexts, Tags
+
+
+@dataclass
+class DictTrackerEvent:
+    event: Enum
+    tags: Optional[Tags] = None
+    contexts: Optional[Contexts] = None
+
+
+class BenchmarkEvents(Enum):
+    CREATED = "created"
+
+
+DTO_CLASSES = {
+    "dict": DictTrackerEvent,
+    "slotted": TrackerEvent,
+    "frozen-slotted": FrozenTrackerEvent,
+}
+
+
+def _bytes_per_instance(dto_class, count=10000):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [dto_class(event=BenchmarkEvents.CREATED) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del instances
+    return allocated / count
+
+
+@pytest.mark.benchmark(group="dto-construction")
+@pytest.mark.parametrize("name", DTO_CLASSES)
+def test_dto_construction(benchmark, name):
+    dto_class = DTO_CLASSES[name]
+    benchmark.extra_info["bytes_per_instance"] = _bytes_per_instance(dto_class)
+
+    benchmark(dto_class, event=BenchmarkEvents.CREATED, tags={"a": 1})
+
+
+def test_slotted_dtos_use_less_memory():
+    assert _bytes_per_instance(TrackerEvent) < _bytes_per_instance(DictTrackerEvent)
+
+
+@pytest.mark.benchmark(group="enum-value")
+def test_enum_value_attribute(benchmark):
+    benchmark(getattr, BenchmarkEvents.CREATED, "value")
+
+
+@pytest.mark.benchmark(group="enum-value")
+def test_enum_value_registry(benchmark):
+    benchmark(enum_registry.value, BenchmarkEvents.CREATED)
+
+
+@pytest.mark.benchmark(group="enum-value")
+def test_enum_value_getter(benchmark):
+    benchmark(enum_value, BenchmarkEvents.CREATED)
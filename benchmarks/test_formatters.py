@@ -0,0 +1,115 @@
+import json
+import logging
+import sys
+
+import pytest
+
+from tracker.formatters import TrackerJSONFormatter
+from tracker.scopes import EMPTY_SCOPE
+from tracker.tracebacks import TracebackCache
+
+AMBIENT_TAGS = EMPTY_SCOPE.push(
+    {
+        "service": "payments",
+        "version": "v1.2.3",
+        "environment": "production",
+        "region": "us-east-1",
+        "canary": False,
+    }
+).flatten()
+
+AMBIENT_CONTEXTS = EMPTY_SCOPE.push(
+    {
+        "app": {"version": "1.2.3", "build_number": 456},
+        "server": {"region": "us-east-1", "instance_id": "i-1234567890abcdef0"},
+    }
+).flatten()
+
+
+class StdlibJSONFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps(
+            {
+                "timestamp": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                "tags": record.tags,
+                "contexts": record.contexts,
+            },
+            default=str,
+        )
+
+
+def make_record(tags):
+    record = logging.LogRecord(
+        name="Tracker.LoggerCore",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="checkout_success",
+        args=(),
+        exc_info=None,
+    )
+    record.tags = tags
+    record.contexts = AMBIENT_CONTEXTS
+    return record
+
+
+FORMATTERS = {
+    "stdlib-json": StdlibJSONFormatter(),
+    "tracker-stdlib": TrackerJSONFormatter(use_orjson=False),
+    "tracker-orjson": TrackerJSONFormatter(use_orjson=True),
+}
+
+
+@pytest.mark.benchmark(group="json-formatter-ambient-scope")
+@pytest.mark.parametrize("name", FORMATTERS)
+def test_format_record_with_ambient_scope(benchmark, name):
+    record = make_record(AMBIENT_TAGS)
+
+    benchmark(FORMATTERS[name].format, record)
+
+
+@pytest.mark.benchmark(group="json-formatter-local-tags")
+@pytest.mark.parametrize("name", FORMATTERS)
+def test_format_record_with_local_tags(benchmark, name):
+    formatter = FORMATTERS[name]
+    records = [
+        make_record({**AMBIENT_TAGS, "partner": "premium", "attempt": i})
+        for i in range(2)
+    ]
+
+    def format_records():
+        for record in records:
+            formatter.format(record)
+
+    benchmark(format_records)
+
+
+def fail(depth):
+    if depth == 0:
+        raise ValueError("boom")
+
+    fail(depth - 1)
+
+
+TRACEBACK_FORMATTERS = {
+    "stdlib": logging.Formatter().formatException,
+    "cached": TracebackCache(TracebackCache.TracebackConfig()).format,
+    "cached-compact": TracebackCache(
+        TracebackCache.TracebackConfig(compact_frames=5)
+    ).format,
+}
+
+
+@pytest.mark.benchmark(group="traceback-repeated-failure")
+@pytest.mark.parametrize("depth", [5, 50])
+@pytest.mark.parametrize("name", TRACEBACK_FORMATTERS)
+def test_format_repeated_exception(benchmark, name, depth):
+    try:
+        fail(depth)
+    except ValueError:
+        exc_info = sys.exc_info()
+
+    benchmark(TRACEBACK_FORMATTERS[name], exc_info)
@@ -0,0 +1,81 @@
+import threading
+from enum import Enum
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tracker import HttpCore, PayloadFormat, TrackerEvent
+
+BATCH = 1000
+
+
+class BenchmarkEvents(Enum):
+    CREATED = "created"
+
+
+EVENT = TrackerEvent(
+    event=BenchmarkEvents.CREATED,
+    tags={"service": "payments", "region": "us-east-1"},
+    contexts={"order": {"id": "123", "amount": 10.5}},
+)
+
+
+class AcceptingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def collector_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AcceptingHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1/logs"
+    server.shutdown()
+    server.server_close()
+
+
+def events_per_second(benchmark):
+    benchmark.extra_info["events_per_second"] = BATCH / benchmark.stats.stats.mean
+
+
+@pytest.mark.benchmark(group="http-encode")
+@pytest.mark.parametrize(
+    "payload_format",
+    list(PayloadFormat),
+    ids=lambda payload_format: payload_format.value,
+)
+def test_http_encode(benchmark, collector_url, payload_format):
+    # Encoding and gzip run on a single exporter worker, so this is the
+    # per-core ceiling of the exporter.
+    core = HttpCore(
+        HttpCore.HttpConfig(url=collector_url, payload_format=payload_format)
+    )
+    records = [(0.0, "created", EVENT.tags, EVENT.contexts)] * BATCH
+
+    benchmark(core.encode, records)
+    events_per_second(benchmark)
+    core.close()
+
+
+@pytest.mark.benchmark(group="http-export")
+def test_http_export_end_to_end(benchmark, collector_url):
+    core = HttpCore(HttpCore.HttpConfig(url=collector_url, max_batch_size=BATCH))
+
+    def export():
+        for _ in range(BATCH):
+            core.export(EVENT)
+
+        core.flush()
+
+    benchmark.pedantic(export, rounds=20)
+    events_per_second(benchmark)
+    core.close()
@@ -0,0 +1,24 @@
+import pytest
+
+from tracker import ContextLimiter
+
+PAYLOADS = {
+    "typical": {
+        "order": {"id": "123", "amount": 10.5, "items": [{"sku": "a", "qty": 1}] * 5},
+        "request": {"method": "POST", "path": "/orders", "headers": {"x-id": "abc"}},
+    },
+    "oversized": {
+        "request": {
+            "body": "x" * 1_000_000,
+            "rows": [{"id": index} for index in range(5000)],
+        }
+    },
+}
+
+
+@pytest.mark.benchmark(group="context-limiter")
+@pytest.mark.parametrize("payload", list(PAYLOADS))
+def test_context_limiter(benchmark, payload):
+    limiter = ContextLimiter(ContextLimiter.LimiterConfig())
+
+    benchmark(limiter.limit, PAYLOADS[payload])
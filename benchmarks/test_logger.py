@@ -0,0 +1,92 @@
+import io
+import logging
+from enum import Enum
+
+import pytest
+
+from tracker import (
+    LoggerCore,
+    LoggerEventHandler,
+    LoggerExceptionHandler,
+    TrackerEvent,
+    TrackerException,
+    TrackerJSONFormatter,
+)
+
+
+class BenchmarkEvents(Enum):
+    CREATED = "created"
+
+
+EVENT = TrackerEvent(
+    event=BenchmarkEvents.CREATED,
+    tags={"service": "payments", "region": "us-east-1"},
+    contexts={"order": {"id": "123", "amount": 10.5}},
+)
+
+
+def sink_handler(sink, tmp_path):
+    if sink == "null":
+        return logging.NullHandler()
+
+    if sink == "stream":
+        return logging.StreamHandler(io.StringIO())
+
+    return logging.FileHandler(tmp_path / "tracker.log")
+
+
+@pytest.fixture
+def make_core(tmp_path):
+    # The logger is process-wide and LoggerCore keeps any handlers already
+    # attached, so each benchmark starts from a bare logger.
+    logger = logging.getLogger("Tracker.LoggerCore")
+    handlers, propagate, level = logger.handlers[:], logger.propagate, logger.level
+    logger.setLevel(logging.INFO)
+    cores = []
+
+    def make(sink, non_blocking=False):
+        logger.handlers.clear()
+        logger.propagate = False
+        core = LoggerCore(
+            LoggerCore.LoggerConfig(
+                logger_handler=sink_handler(sink, tmp_path),
+                formatter=TrackerJSONFormatter(),
+                non_blocking=non_blocking,
+            )
+        )
+        cores.append(core)
+        return core
+
+    yield make
+
+    for core in cores:
+        core.close()
+
+    for handler in logger.handlers:
+        handler.close()
+
+    logger.handlers[:] = handlers
+    logger.propagate = propagate
+    logger.setLevel(level)
+
+
+@pytest.mark.benchmark(group="logger-event")
+@pytest.mark.parametrize("sink", ["null", "stream", "file"])
+@pytest.mark.parametrize("non_blocking", [False, True], ids=["blocking", "queued"])
+def test_logger_event(benchmark, make_core, sink, non_blocking):
+    handler = LoggerEventHandler(make_core(sink, non_blocking))
+
+    benchmark(handler.capture_event, EVENT)
+
+
+@pytest.mark.benchmark(group="logger-exception")
+@pytest.mark.parametrize("sink", ["null", "stream", "file"])
+def test_logger_exception(benchmark, make_core, sink):
+    handler = LoggerExceptionHandler(make_core(sink))
+
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        exception = TrackerException(exception=e)
+
+    benchmark(handler.capture_exception, exception)
@@ -0,0 +1,29 @@
+from enum import Enum
+
+import pytest
+
+from tracker import Tracker, TrackerEvent, TrackerMetrics
+
+
+class BenchmarkEvents(Enum):
+    CREATED = "created"
+
+
+class NullHandler:
+    def capture_event(self, tracker_event):
+        pass
+
+    def shared_core(self):
+        return self
+
+
+@pytest.mark.benchmark(group="emit-instrumentation")
+@pytest.mark.parametrize("instrumented", [False, True])
+def test_emit_event_instrumentation(benchmark, instrumented):
+    tracker = Tracker(
+        event_handlers=[NullHandler()],
+        metrics=TrackerMetrics() if instrumented else None,
+    )
+    event = TrackerEvent(event=BenchmarkEvents.CREATED)
+
+    benchmark(tracker.emit_event, event)
@@ -0,0 +1,155 @@
+from enum import Enum
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+import sentry_sdk
+from sentry_sdk.transport import Transport
+
+from tracker import (
+    SentryCore,
+    SentryEventHandler,
+    SentryExceptionHandler,
+    SentryMessageHandler,
+    Tracker,
+    TrackerEvent,
+    TrackerException,
+    TrackerMessage,
+)
+
+
+class BenchmarkMessages(Enum):
+    PROCESSED = "processed"
+
+
+MESSAGE = TrackerMessage(
+    message=BenchmarkMessages.PROCESSED,
+    tags={"service": "payments", "region": "us-east-1"},
+    contexts={"order": {"id": "123", "amount": 10.5}},
+)
+
+
+class StubTransport(Transport):
+    # Serializes envelopes like the HTTP transport would, without the
+    # network, so the numbers cover the SDK's own event pipeline.
+    def __init__(self, options=None):
+        super().__init__(options)
+        self.envelopes = 0
+
+    def capture_envelope(self, envelope):
+        envelope.serialize()
+        self.envelopes += 1
+
+
+@pytest.fixture
+def sentry_core():
+    with patch.object(
+        sentry_sdk, "init", partial(sentry_sdk.init, transport=StubTransport)
+    ):
+        core = SentryCore(
+            SentryCore.SentryConfig(
+                dsn="https://key@localhost/1", environment="benchmark"
+            )
+        )
+
+    yield core
+
+    sentry_sdk.get_client().close()
+
+
+@pytest.mark.benchmark(group="sentry-capture")
+def test_sentry_message(benchmark, sentry_core):
+    handler = SentryMessageHandler(sentry_core)
+
+    benchmark(handler.capture_message, MESSAGE)
+
+
+@pytest.mark.benchmark(group="sentry-capture-tags")
+@pytest.mark.parametrize("count", [1, 10, 50])
+def test_sentry_message_tags(benchmark, sentry_core, count):
+    handler = SentryMessageHandler(sentry_core)
+    message = TrackerMessage(
+        message=BenchmarkMessages.PROCESSED,
+        tags={f"tag{index}": "value" for index in range(count)},
+        contexts={f"context{index}": {"id": index} for index in range(count)},
+    )
+
+    with (
+        patch.object(sentry_sdk, "set_tag", wraps=sentry_sdk.set_tag) as set_tag,
+        patch.object(
+            sentry_sdk, "set_context", wraps=sentry_sdk.set_context
+        ) as set_context,
+    ):
+        handler.capture_message(message)
+
+    benchmark.extra_info["scope_calls_per_capture"] = (
+        set_tag.call_count + set_context.call_count
+    )
+    benchmark(handler.capture_message, message)
+
+
+@pytest.mark.benchmark(group="sentry-capture")
+def test_sentry_exception(benchmark, sentry_core):
+    handler = SentryExceptionHandler(sentry_core)
+
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        exception = TrackerException(exception=e, tags=MESSAGE.tags)
+
+    benchmark(handler.capture_exception, exception)
+
+
+@pytest.mark.benchmark(group="sentry-scope-churn")
+@pytest.mark.parametrize("captures", [0, 1])
+def test_sentry_scope_churn(benchmark, sentry_core, captures):
+    tracker = Tracker(message_handlers=[SentryMessageHandler(sentry_core)])
+    message = TrackerMessage(message=BenchmarkMessages.PROCESSED)
+
+    def request():
+        with tracker.scope():
+            tracker.set_tags({"request_id": "abc", "region": "us"})
+            tracker.set_contexts({"user": {"id": 1, "plan": "pro"}})
+
+            for _ in range(captures):
+                tracker.emit_message(message)
+
+    benchmark(request)
+
+
+@pytest.mark.benchmark(group="sentry-breadcrumbs")
+def test_sentry_event_breadcrumb(benchmark, sentry_core):
+    handler = SentryEventHandler(sentry_core)
+    event = TrackerEvent(event=BenchmarkMessages.PROCESSED, tags=MESSAGE.tags)
+
+    with sentry_core.scope():
+        benchmark(handler.capture_event, event)
+
+
+@pytest.mark.benchmark(group="sentry-breadcrumbs")
+def test_sdk_add_breadcrumb(benchmark, sentry_core):
+    # What recording through the SDK would cost on every event instead.
+    with sentry_core.scope():
+        benchmark(
+            sentry_sdk.add_breadcrumb,
+            category="tracker.event",
+            message="processed",
+            data=MESSAGE.tags,
+        )
+
+
+@pytest.mark.benchmark(group="sentry-capture")
+def test_sentry_exception_with_breadcrumbs(benchmark, sentry_core):
+    handler = SentryExceptionHandler(sentry_core)
+    event = TrackerEvent(event=BenchmarkMessages.PROCESSED, tags=MESSAGE.tags)
+
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        exception = TrackerException(exception=e)
+
+    with sentry_core.scope():
+        for _ in range(100):
+            sentry_core.record_breadcrumb("tracker.event", event.event, event.tags)
+
+        benchmark(handler.capture_exception, exception)
@@ -0,0 +1,50 @@
+from enum import Enum
+from unittest.mock import Mock
+
+import pytest
+
+from tracker import FsyncPolicy, SpoolingHandler, TrackerEvent
+
+
+class BenchmarkEvents(Enum):
+    CREATED = "created"
+
+
+EVENT = TrackerEvent(
+    event=BenchmarkEvents.CREATED,
+    tags={"service": "payments", "region": "us-east-1"},
+    contexts={"order": {"id": "123", "amount": 10.5}},
+)
+
+
+@pytest.mark.benchmark(group="spool-append")
+@pytest.mark.parametrize("policy", list(FsyncPolicy), ids=lambda policy: policy.value)
+def test_spool_append(benchmark, tmp_path, policy):
+    handler = SpoolingHandler(
+        Mock(),
+        SpoolingHandler.SpoolConfig(
+            directory=str(tmp_path),
+            fsync_policy=policy,
+            replay_in_background=False,
+        ),
+    )
+
+    benchmark(handler.capture_event, EVENT)
+    handler.close()
+
+
+@pytest.mark.benchmark(group="spool-replay")
+def test_spool_replay(benchmark, tmp_path):
+    handler = SpoolingHandler(
+        Mock(),
+        SpoolingHandler.SpoolConfig(
+            directory=str(tmp_path), replay_in_background=False
+        ),
+    )
+
+    def setup():
+        for _ in range(1000):
+            handler.capture_event(EVENT)
+
+    benchmark.pedantic(handler.replay, setup=setup, rounds=20)
+    handler.close()
@@ -0,0 +1,143 @@
+import logging
+import threading
+from enum import Enum
+
+import pytest
+
+from tracker import (
+    BackgroundDispatcher,
+    LoggerCore,
+    LoggerEventHandler,
+    Tracker,
+    TrackerEvent,
+    TrackerException,
+    TrackerMessage,
+)
+
+HANDLER_COUNTS = [0, 1, 5]
+EMITS_PER_THREAD = 1000
+
+
+class BenchmarkEvents(Enum):
+    CREATED = "created"
+
+
+class BenchmarkMessages(Enum):
+    PROCESSED = "processed"
+
+
+class NullHandler:
+    def capture_exception(self, tracker_exception):
+        pass
+
+    def capture_message(self, tracker_message):
+        pass
+
+    def capture_event(self, tracker_event):
+        pass
+
+    def set_tags(self, tags):
+        pass
+
+    def set_contexts(self, contexts):
+        pass
+
+    def shared_core(self):
+        return self
+
+
+@pytest.fixture
+def logger_core():
+    # LoggerCore reuses whatever handlers the shared logger already has.
+    logger = logging.getLogger("Tracker.LoggerCore")
+    handlers, propagate, level = logger.handlers[:], logger.propagate, logger.level
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+    logger.propagate = False
+    yield LoggerCore(LoggerCore.LoggerConfig(logger_handler=logging.NullHandler()))
+    logger.handlers[:] = handlers
+    logger.propagate = propagate
+    logger.setLevel(level)
+
+
+def handlers(count):
+    return [NullHandler() for _ in range(count)]
+
+
+@pytest.mark.benchmark(group="tracker-emit-event")
+@pytest.mark.parametrize("count", HANDLER_COUNTS)
+def test_emit_event(benchmark, count):
+    tracker = Tracker(event_handlers=handlers(count))
+    event = TrackerEvent(event=BenchmarkEvents.CREATED, tags={"region": "us"})
+
+    benchmark(tracker.emit_event, event)
+
+
+@pytest.mark.benchmark(group="tracker-emit-message")
+@pytest.mark.parametrize("count", HANDLER_COUNTS)
+def test_emit_message(benchmark, count):
+    tracker = Tracker(message_handlers=handlers(count))
+    message = TrackerMessage(message=BenchmarkMessages.PROCESSED)
+
+    benchmark(tracker.emit_message, message)
+
+
+@pytest.mark.benchmark(group="tracker-emit-exception")
+@pytest.mark.parametrize("count", HANDLER_COUNTS)
+def test_emit_exception(benchmark, count):
+    tracker = Tracker(exception_handlers=handlers(count))
+    exception = TrackerException(exception=ValueError("boom"))
+
+    benchmark(tracker.emit_exception, exception)
+
+
+@pytest.mark.benchmark(group="tracker-scope-churn")
+def test_scope_churn(benchmark, logger_core):
+    # The per-request pattern: open a scope, set ambient tags and contexts,
+    # emit once and unwind.
+    tracker = Tracker(event_handlers=[LoggerEventHandler(logger_core)])
+    event = TrackerEvent(event=BenchmarkEvents.CREATED)
+
+    def request():
+        with tracker.scope():
+            tracker.set_tags({"request_id": "abc", "region": "us"})
+            tracker.set_contexts({"user": {"id": 1, "plan": "pro"}})
+            tracker.emit_event(event)
+
+    benchmark(request)
+
+
+@pytest.mark.benchmark(group="tracker-contention")
+@pytest.mark.parametrize("threads", [1, 4, 16])
+@pytest.mark.parametrize("background", [False, True], ids=["inline", "background"])
+def test_emit_contention(benchmark, logger_core, threads, background):
+    dispatcher = (
+        BackgroundDispatcher(BackgroundDispatcher.DispatcherConfig())
+        if background
+        else None
+    )
+    tracker = Tracker(
+        event_handlers=[LoggerEventHandler(logger_core)], dispatcher=dispatcher
+    )
+    event = TrackerEvent(event=BenchmarkEvents.CREATED, tags={"region": "us"})
+
+    def emit():
+        for _ in range(EMITS_PER_THREAD):
+            tracker.emit_event(event)
+
+    def run():
+        workers = [threading.Thread(target=emit) for _ in range(threads)]
+
+        for worker in workers:
+            worker.start()
+
+        for worker in workers:
+            worker.join()
+
+        tracker.flush()
+
+    benchmark.pedantic(run, rounds=10, warmup_rounds=1)
+    benchmark.extra_info["emits_per_second"] = (
+        threads * EMITS_PER_THREAD / benchmark.stats.stats.mean
+    )
+    tracker.close()
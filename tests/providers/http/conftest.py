@@ -0,0 +1,89 @@
+import gzip
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tracker.providers.http import HttpCore, _http_contexts, _http_tags
+from tracker.scopes import EMPTY_SCOPE
+
+
+class CollectorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), CollectorRequestHandler)
+        self.requests = []
+        # (status, headers) to answer with, in order; then 200.
+        self.responses = deque()
+        self.received = threading.Event()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/logs"
+
+
+class CollectorRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+
+        status, headers = (
+            self.server.responses.popleft() if self.server.responses else (200, {})
+        )
+        self.server.requests.append(
+            {
+                "path": self.path,
+                "headers": dict(self.headers),
+                "body": body,
+                "client": self.client_address,
+                "status": status,
+            }
+        )
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        self.server.received.set()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def collector_server():
+    server = CollectorServer()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def http_core(collector_server):
+    core = HttpCore(
+        HttpCore.HttpConfig(
+            url=collector_server.url, max_batch_age=0.01, backoff_base=0.001
+        )
+    )
+    yield core
+    core.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_http_contexts_and_tags():
+    _http_contexts.set(EMPTY_SCOPE)
+    _http_tags.set(EMPTY_SCOPE)
+    yield
+    _http_contexts.set(EMPTY_SCOPE)
+    _http_tags.set(EMPTY_SCOPE)
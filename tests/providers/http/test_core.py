@@ -0,0 +1,406 @@
+import json
+import logging
+import queue
+from enum import Enum
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tracker.dtos import TrackerEvent
+from tracker.providers.http import (
+    _STOP,
+    ConnectionPool,
+    ExportError,
+    HttpCore,
+    PayloadFormat,
+    encode_otlp,
+    parse_retry_after,
+)
+
+
+class ExportedEvents(Enum):
+    ORDER_PAID = "order_paid"
+
+
+def make_core(server, **overrides):
+    config = {"url": server.url, "max_batch_age": 0.01, "backoff_base": 0.001}
+    config.update(overrides)
+    return HttpCore(HttpCore.HttpConfig(**config))
+
+
+def event(tags=None, contexts=None):
+    return TrackerEvent(event=ExportedEvents.ORDER_PAID, tags=tags, contexts=contexts)
+
+
+def ndjson(request):
+    return [json.loads(line) for line in request["body"].decode().splitlines()]
+
+
+def test_http_core_exports_gzipped_ndjson(http_core, collector_server):
+    http_core.set_tags({"service": "payments"})
+    http_core.set_contexts({"order": {"id": "1"}})
+
+    with patch("tracker.providers.http.time.time", return_value=1700000000.5):
+        http_core.export(event(tags={"method": "pix"}))
+
+    assert http_core.flush(timeout=5) is True
+
+    (request,) = collector_server.requests
+    assert request["path"] == "/v1/logs"
+    assert request["headers"]["Content-Type"] == "application/x-ndjson"
+    assert request["headers"]["Content-Encoding"] == "gzip"
+    assert ndjson(request) == [
+        {
+            "timestamp": 1700000000.5,
+            "event": "order_paid",
+            "tags": {"service": "payments", "method": "pix"},
+            "contexts": {"order": {"id": "1"}},
+        }
+    ]
+    assert http_core.exported == 1
+
+
+def test_http_core_reuses_connections(http_core, collector_server):
+    http_core.export(event())
+    http_core.flush(timeout=5)
+    http_core.export(event())
+    http_core.flush(timeout=5)
+
+    first, second = collector_server.requests
+    assert first["client"] == second["client"]
+
+
+def test_http_core_batches_up_to_max_batch_size(collector_server):
+    core = make_core(collector_server, max_batch_size=2, max_batch_age=0.2)
+
+    for _ in range(5):
+        core.export(event())
+
+    core.flush(timeout=5)
+    core.close()
+
+    assert [len(ndjson(request)) for request in collector_server.requests] == [
+        2,
+        2,
+        1,
+    ]
+
+
+def test_http_core_exports_otlp_logs(collector_server):
+    core = make_core(
+        collector_server,
+        payload_format=PayloadFormat.OTLP,
+        service_name="payments",
+        compress=False,
+        headers={"Authorization": "Bearer token"},
+    )
+
+    with patch("tracker.providers.http.time.time", return_value=1.5):
+        core.export(event(tags={"paid": True}, contexts={"order": {"id": 1}}))
+
+    core.flush(timeout=5)
+    core.close()
+
+    (request,) = collector_server.requests
+    assert request["headers"]["Content-Type"] == "application/json"
+    assert request["headers"]["Authorization"] == "Bearer token"
+    assert "Content-Encoding" not in request["headers"]
+
+    (resource_logs,) = json.loads(request["body"])["resourceLogs"]
+    assert resource_logs["resource"] == {
+        "attributes": [{"key": "service.name", "value": {"stringValue": "payments"}}]
+    }
+    (scope_logs,) = resource_logs["scopeLogs"]
+    assert scope_logs["scope"] == {"name": "tracker"}
+    assert scope_logs["logRecords"] == [
+        {
+            "timeUnixNano": "1500000000",
+            "severityNumber": 9,
+            "severityText": "INFO",
+            "body": {"stringValue": "order_paid"},
+            "attributes": [
+                {"key": "paid", "value": {"boolValue": True}},
+                {
+                    "key": "context.order",
+                    "value": {
+                        "kvlistValue": {
+                            "values": [{"key": "id", "value": {"intValue": "1"}}]
+                        }
+                    },
+                },
+            ],
+        }
+    ]
+
+
+def test_encode_otlp_any_values():
+    records = [
+        (0.0, "event", {"none": None, "ratio": 0.5}, {"items": {"ids": [1, "a"]}})
+    ]
+
+    (log_record,) = json.loads(encode_otlp(records))["resourceLogs"][0]["scopeLogs"][0][
+        "logRecords"
+    ]
+
+    assert log_record["attributes"] == [
+        {"key": "none", "value": {}},
+        {"key": "ratio", "value": {"doubleValue": 0.5}},
+        {
+            "key": "context.items",
+            "value": {
+                "kvlistValue": {
+                    "values": [
+                        {
+                            "key": "ids",
+                            "value": {
+                                "arrayValue": {
+                                    "values": [
+                                        {"intValue": "1"},
+                                        {"stringValue": "a"},
+                                    ]
+                                }
+                            },
+                        }
+                    ]
+                }
+            },
+        },
+    ]
+    assert json.loads(encode_otlp(records))["resourceLogs"][0]["resource"] == {}
+
+
+def test_http_core_honours_retry_after(http_core, collector_server):
+    collector_server.responses.append((429, {"Retry-After": "0"}))
+
+    with patch.object(http_core, "retry_delay", wraps=http_core.retry_delay) as delay:
+        http_core.export(event())
+        http_core.flush(timeout=5)
+
+    assert [request["status"] for request in collector_server.requests] == [429, 200]
+    delay.assert_called_once_with(0, 0.0)
+    assert http_core.exported == 1
+    assert http_core.dropped == 0
+
+
+def test_http_core_drops_batch_after_retries(collector_server, caplog):
+    core = make_core(collector_server, max_retries=2)
+    collector_server.responses.extend([(503, {})] * 3)
+
+    with caplog.at_level(logging.ERROR):
+        core.export(event())
+        core.flush(timeout=5)
+
+    core.close()
+
+    assert len(collector_server.requests) == 3
+    assert core.dropped == 1
+    assert (
+        f"Error exporting 1 events to {collector_server.url}: HTTP 503" in caplog.text
+    )
+
+
+def test_http_core_does_not_retry_client_errors(http_core, collector_server):
+    collector_server.responses.append((400, {}))
+
+    http_core.export(event())
+    http_core.flush(timeout=5)
+
+    assert len(collector_server.requests) == 1
+    assert http_core.dropped == 1
+
+
+def test_http_core_retries_connection_errors(collector_server, caplog):
+    url = collector_server.url
+    collector_server.shutdown()
+    collector_server.server_close()
+    core = HttpCore(
+        HttpCore.HttpConfig(
+            url=url, max_batch_age=0.01, backoff_base=0.001, max_retries=1
+        )
+    )
+
+    with caplog.at_level(logging.ERROR):
+        core.export(event())
+        core.flush(timeout=5)
+
+    core.close()
+
+    assert core.dropped == 1
+    assert f"Error exporting 1 events to {url}" in caplog.text
+
+
+def test_http_core_retry_delay_uses_full_jitter(http_core):
+    with patch("tracker.providers.http.random.uniform", return_value=0.25) as uniform:
+        assert http_core.retry_delay(3) == 0.25
+
+    uniform.assert_called_once_with(0, 0.008)
+
+    with patch("tracker.providers.http.random.uniform") as uniform:
+        http_core.retry_delay(50)
+
+    uniform.assert_called_once_with(0, 30.0)
+
+
+def test_http_core_retry_delay_caps_retry_after(http_core):
+    assert http_core.retry_delay(0, 5.0) == 5.0
+    assert http_core.retry_delay(0, 120.0) == 30.0
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, None),
+        ("", None),
+        ("7", 7.0),
+        ("-3", 0.0),
+        ("Sat, 01 Jan 2000 00:00:10 GMT", 10.0),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    with patch("tracker.providers.http.time.time", return_value=946684800.0):
+        assert parse_retry_after(value) == expected
+
+
+def test_http_core_stops_retrying_when_closing(http_core, collector_server):
+    collector_server.responses.extend([(503, {})] * 2)
+
+    http_core._closing.set()
+    with pytest.raises(ExportError):
+        http_core.send([(0.0, "event", {}, {})])
+
+    assert len(collector_server.requests) == 1
+
+
+def test_http_core_stops_waiting_for_retry_when_closed(http_core, collector_server):
+    collector_server.responses.append((503, {}))
+    http_core._closing = Mock(is_set=Mock(return_value=False))
+    http_core._closing.wait.return_value = True
+
+    with pytest.raises(ExportError):
+        http_core.send([(0.0, "event", {}, {})])
+
+    assert len(collector_server.requests) == 1
+
+
+def test_http_core_reconnects_after_connection_close(http_core, collector_server):
+    collector_server.responses.append((200, {"Connection": "close"}))
+
+    http_core.export(event())
+    http_core.flush(timeout=5)
+    http_core.export(event())
+    http_core.flush(timeout=5)
+
+    first, second = collector_server.requests
+    assert first["client"] != second["client"]
+    assert http_core.exported == 2
+
+
+def test_http_core_drops_when_queue_is_full(collector_server):
+    core = make_core(collector_server, workers=0, max_queue_size=1)
+
+    core.export(event())
+    core.export(event())
+
+    assert core.queue_stats().depth == 1
+    assert core.queue_stats().dropped == 1
+    assert core.queue_stats().name == "HttpCore"
+    core.close(timeout=0.01)
+
+
+def test_http_core_drops_after_close(http_core, collector_server):
+    http_core.close()
+    http_core.close()
+
+    http_core.export(event())
+
+    assert http_core.dropped == 1
+    assert collector_server.requests == []
+
+
+def test_http_core_next_batch_stops_mid_batch(collector_server):
+    core = make_core(collector_server, workers=0, max_batch_age=0)
+    record = (0.0, "event", {}, {})
+
+    core._queue.put(record)
+    core._queue.put(record)
+    assert core._next_batch() == ([record, record], False)
+
+    core._queue.put(record)
+    core._queue.put(_STOP)
+    assert core._next_batch() == ([record], True)
+
+    core._queue = queue.Queue()
+    core.close(timeout=0.01)
+
+
+def test_http_core_scope_isolates_tags(http_core, collector_server):
+    http_core.set_tags({"outer": 1})
+
+    with http_core.scope():
+        http_core.set_tags({"inner": 1})
+        http_core.set_contexts({"request": {"id": "1"}})
+
+    http_core.export(event())
+    http_core.flush(timeout=5)
+
+    (record,) = ndjson(collector_server.requests[0])
+    assert record["tags"] == {"outer": 1}
+    assert record["contexts"] == {}
+
+
+def test_http_core_restarts_workers_after_fork(http_core, collector_server):
+    workers = http_core._workers
+
+    http_core._restart()
+    http_core.export(event())
+
+    assert http_core._workers is not workers
+    assert http_core.flush(timeout=5) is True
+    assert len(collector_server.requests) == 1
+
+    http_core.close()
+    http_core._restart()
+    assert not any(worker.is_alive() for worker in http_core._workers)
+
+
+def test_connection_pool_closes_connections_beyond_its_size():
+    pool = ConnectionPool("https://collector.example:4318/v1/logs?tenant=a", 1, 1.0)
+
+    assert pool.path == "/v1/logs?tenant=a"
+
+    with pool.connection() as first:
+        with pool.connection() as second:
+            pass
+
+    assert first is not second
+    assert type(first).__name__ == "HTTPSConnection"
+
+    with pool.connection() as reused:
+        assert reused is second
+
+    pool.close()
+
+
+def test_connection_pool_discards_connection_on_error():
+    pool = ConnectionPool("http://collector.example", 1, 1.0)
+
+    with pytest.raises(OSError):
+        with pool.connection() as connection:
+            raise OSError("reset")
+
+    assert pool.path == "/"
+
+    with pool.connection() as other:
+        assert other is not connection
+
+
+def test_http_core_resolves_lazy_values_on_export(http_core, collector_server):
+    http_core.set_contexts({"request": lambda: {"id": "1"}})
+
+    http_core.export(event(tags=lambda: {"method": "pix"}))
+    http_core.flush(timeout=5)
+
+    (record,) = ndjson(collector_server.requests[0])
+    assert record["tags"] == {"method": "pix"}
+    assert record["contexts"] == {"request": {"id": "1"}}
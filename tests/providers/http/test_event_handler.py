@@ -0,0 +1,44 @@
+from unittest.mock import Mock
+
+from tracker.providers.http import HttpEventHandler
+
+
+def test_http_event_handler_capture_event(tracker_event):
+    core = Mock()
+    handler = HttpEventHandler(core)
+
+    handler.capture_event(tracker_event)
+
+    core.export.assert_called_once_with(tracker_event)
+
+
+def test_http_event_handler_capture_events_batch(tracker_event):
+    core = Mock()
+    handler = HttpEventHandler(core)
+
+    handler.capture_events_batch([tracker_event, tracker_event])
+
+    assert core.export.call_count == 2
+
+
+def test_http_event_handler_delegates_to_core():
+    core = Mock()
+    handler = HttpEventHandler(core)
+
+    handler.set_tags({"tag": "value"})
+    handler.set_contexts({"context": {"key": "value"}})
+
+    core.set_tags.assert_called_once_with({"tag": "value"})
+    core.set_contexts.assert_called_once_with({"context": {"key": "value"}})
+    assert handler.scope() is core.scope.return_value
+    assert handler.shared_core() is core
+
+
+def test_http_event_handler_end_to_end(http_core, collector_server, tracker_event):
+    handler = HttpEventHandler(http_core)
+
+    handler.set_tags({"service": "payments"})
+    handler.capture_event(tracker_event)
+    http_core.flush(timeout=5)
+
+    assert b'"tags":{"service":"payments"}' in collector_server.requests[0]["body"]
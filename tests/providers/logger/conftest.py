@@ -1,6 +1,7 @@
 import pytest
 
 from tracker.providers.logger import LoggerCore, _logger_contexts, _logger_tags
+from tracker.scopes import EMPTY_SCOPE
 
 
 @pytest.fixture()
@@ -10,8 +11,8 @@ def logger_core():
 
 @pytest.fixture(autouse=True)
 def clear_logger_contexts_and_tags():
-    _logger_contexts.set({})
-    _logger_tags.set({})
+    _logger_contexts.set(EMPTY_SCOPE)
+    _logger_tags.set(EMPTY_SCOPE)
     yield
-    _logger_contexts.set({})
-    _logger_tags.set({})
+    _logger_contexts.set(EMPTY_SCOPE)
+    _logger_tags.set(EMPTY_SCOPE)
@@ -1,11 +1,27 @@
 import logging
+import queue
+import threading
+from enum import Enum
+from unittest.mock import Mock
 
-from tracker.providers.logger import LoggerCore, _logger_contexts, _logger_tags
+import pytest
+
+from tracker.dtos import TrackerEvent, TrackerException
+from tracker.limits import STRING_MARKER, ContextLimiter
+from tracker.providers.logger import (
+    LoggerCore,
+    LoggerEventHandler,
+    LoggerExceptionHandler,
+    TrackerQueueHandler,
+    _logger_contexts,
+    _logger_tags,
+)
+from tracker.tracebacks import TracebackCache
 
 
 def test_logger_core_context_vars_and_tags_initial_state():
-    assert _logger_tags.get() == {}
-    assert _logger_contexts.get() == {}
+    assert _logger_tags.get().flatten() == {}
+    assert _logger_contexts.get().flatten() == {}
 
 
 def test_logger_core_init_with_config():
@@ -42,15 +58,259 @@ def test_logger_core_set_multiple_tags(logger_core):
     logger_core.set_tags({"tag1": "value1", "tag2": "value2"})
     logger_core.set_tags({"tag3": "value3"})
 
-    assert _logger_tags.get() == {"tag1": "value1", "tag2": "value2", "tag3": "value3"}
+    assert _logger_tags.get().flatten() == {
+        "tag1": "value1",
+        "tag2": "value2",
+        "tag3": "value3",
+    }
 
 
 def test_logger_core_set_multiple_contexts(logger_core):
     logger_core.set_contexts({"context1": "value1", "context2": "value2"})
     logger_core.set_contexts({"context3": "value3"})
 
-    assert _logger_contexts.get() == {
+    assert _logger_contexts.get().flatten() == {
         "context1": "value1",
         "context2": "value2",
         "context3": "value3",
     }
+
+
+def test_logger_core_scope_discards_inner_tags_and_contexts(logger_core):
+    logger_core.set_tags({"outer": "value"})
+    logger_core.set_contexts({"outer": {"key": "value"}})
+
+    with logger_core.scope():
+        logger_core.set_tags({"inner": "value"})
+        logger_core.set_contexts({"inner": {"key": "value"}})
+
+        assert _logger_tags.get().flatten() == {"outer": "value", "inner": "value"}
+        assert _logger_contexts.get().flatten() == {
+            "outer": {"key": "value"},
+            "inner": {"key": "value"},
+        }
+
+    assert _logger_tags.get().flatten() == {"outer": "value"}
+    assert _logger_contexts.get().flatten() == {"outer": {"key": "value"}}
+
+
+def test_logger_core_extra_does_not_leak_local_values(logger_core):
+    logger_core.set_tags({"global_tag": "global_value"})
+
+    extra = logger_core.extra({"local_tag": "local_value"}, None)
+
+    assert extra["tags"] == {"global_tag": "global_value", "local_tag": "local_value"}
+    assert extra["contexts"] == {}
+    assert _logger_tags.get().flatten() == {"global_tag": "global_value"}
+
+
+def test_logger_core_extra_resolves_lazy_values(logger_core):
+    ambient = Mock(return_value={"id": "1"})
+    logger_core.set_contexts({"request": ambient})
+
+    extra = logger_core.extra(
+        {"local_tag": lambda: "local_value"}, lambda: {"order": {"id": "2"}}
+    )
+    logger_core.extra(None, None)
+
+    assert extra["tags"] == {"local_tag": "local_value"}
+    assert extra["contexts"] == {"request": {"id": "1"}, "order": {"id": "2"}}
+    # Bare callables set as ambient contexts are re-evaluated on every record.
+    assert ambient.call_count == 2
+
+
+def test_logger_core_init_with_formatter():
+    logger = logging.getLogger("Tracker.LoggerCore")
+    logger.handlers = []
+
+    formatter = logging.Formatter("%(message)s")
+    LoggerCore(LoggerCore.LoggerConfig(formatter=formatter))
+
+    logger = logging.getLogger("Tracker.LoggerCore")
+    assert logger.handlers[0].formatter is formatter
+
+
+@pytest.fixture()
+def isolated_logger():
+    logger = logging.getLogger("Tracker.LoggerCore")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = []
+
+    def emit(self, record):
+        self.threads.append(threading.get_ident())
+        self.records.append(record)
+
+
+class QueuedEvents(Enum):
+    QUEUED = "queued %s"
+
+
+def test_logger_core_non_blocking_routes_through_listener(isolated_logger):
+    isolated_logger.handlers = []
+    sink = RecordingHandler()
+
+    core = LoggerCore(LoggerCore.LoggerConfig(logger_handler=sink, non_blocking=True))
+    handler = LoggerEventHandler(core)
+
+    assert isinstance(isolated_logger.handlers[0], TrackerQueueHandler)
+
+    handler.capture_event(TrackerEvent(event=QueuedEvents.QUEUED, tags={"a": 1}))
+    assert core.queue_stats().name == "LoggerCore"
+    core.close()
+    core.close()
+    assert core.queue_stats() is None
+
+    assert [record.message for record in sink.records] == ["queued %s"]
+    assert sink.records[0].tags == {"a": 1}
+    assert sink.threads != [threading.get_ident()]
+    assert isolated_logger.handlers == [sink]
+
+
+def test_logger_core_non_blocking_renders_exception_on_listener(isolated_logger):
+    isolated_logger.handlers = []
+    sink = RecordingHandler()
+    sink.setFormatter(logging.Formatter())
+    sink.formatter.formatException = Mock(return_value="rendered traceback")
+
+    core = LoggerCore(LoggerCore.LoggerConfig(logger_handler=sink, non_blocking=True))
+
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        LoggerExceptionHandler(core).capture_exception(TrackerException(exception=e))
+
+    core.close()
+
+    assert sink.records[0].exc_text == "rendered traceback"
+
+
+def test_logger_core_non_blocking_uses_default_exception_formatter(isolated_logger):
+    isolated_logger.handlers = []
+    sink = RecordingHandler()
+
+    core = LoggerCore(LoggerCore.LoggerConfig(logger_handler=sink, non_blocking=True))
+
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        LoggerExceptionHandler(core).capture_exception(TrackerException(exception=e))
+
+    core.close()
+
+    assert sink.records[0].exc_text.endswith("ValueError: boom")
+
+
+def raise_boom(message):
+    raise ValueError(message)
+
+
+def capture_booms(core, count):
+    for index in range(count):
+        try:
+            raise_boom(f"boom {index}")
+        except ValueError as e:
+            LoggerExceptionHandler(core).capture_exception(
+                TrackerException(exception=e)
+            )
+
+
+def test_logger_core_traceback_cache_on_blocking_handler(isolated_logger):
+    isolated_logger.handlers = []
+    sink = RecordingHandler()
+    sink.setFormatter(logging.Formatter())
+    cache = TracebackCache(TracebackCache.TracebackConfig())
+
+    core = LoggerCore(
+        LoggerCore.LoggerConfig(logger_handler=sink, traceback_cache=cache)
+    )
+    capture_booms(core, 3)
+
+    assert sink.filters == [cache]
+    assert [record.exc_text.splitlines()[-1] for record in sink.records] == [
+        "ValueError: boom 0",
+        "ValueError: boom 1",
+        "ValueError: boom 2",
+    ]
+    assert (cache.misses, cache.hits) == (1, 2)
+
+
+def test_logger_core_traceback_cache_on_listener(isolated_logger):
+    isolated_logger.handlers = []
+    sink = RecordingHandler()
+    sink.setFormatter(logging.Formatter())
+    sink.formatter.formatException = Mock(return_value="rendered traceback")
+    cache = TracebackCache(TracebackCache.TracebackConfig())
+
+    core = LoggerCore(
+        LoggerCore.LoggerConfig(
+            logger_handler=sink, non_blocking=True, traceback_cache=cache
+        )
+    )
+    core._restart_listener()
+    assert core.listener.traceback_cache is cache
+
+    capture_booms(core, 2)
+    core.close()
+
+    assert sink.records[1].exc_text.endswith("ValueError: boom 1")
+    sink.formatter.formatException.assert_not_called()
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_logger_core_close_without_listener(logger_core):
+    logger_core.close()
+
+    assert logger_core.listener is None
+
+
+def test_tracker_queue_handler_drops_when_full():
+    log_queue = queue.Queue(1)
+    handler = TrackerQueueHandler(log_queue)
+    record = logging.LogRecord("name", logging.INFO, __file__, 1, "msg", (), None)
+
+    handler.emit(record)
+    handler.emit(record)
+
+    assert handler.dropped == 1
+    assert log_queue.get_nowait() is record
+
+
+def test_logger_core_restarts_listener_after_fork(isolated_logger):
+    isolated_logger.handlers = []
+    sink = logging.NullHandler()
+    core = LoggerCore(LoggerCore.LoggerConfig(logger_handler=sink, non_blocking=True))
+    listener = core.listener
+
+    core._restart_listener()
+
+    assert core.listener is not listener
+    assert core.listener.handlers == (sink,)
+    assert [type(handler) for handler in isolated_logger.handlers] == [
+        TrackerQueueHandler
+    ]
+
+    core.close()
+    listener.stop()
+    core._restart_listener()
+    assert core.listener is None
+
+
+def test_logger_core_extra_applies_context_limiter():
+    limiter = ContextLimiter(ContextLimiter.LimiterConfig(max_string_length=3))
+    core = LoggerCore(LoggerCore.LoggerConfig(context_limiter=limiter))
+    core.set_contexts({"request": {"body": "abcdef"}})
+
+    extra = core.extra(None, None)
+
+    assert extra["contexts"] == {"request": {"body": "abc" + STRING_MARKER}}
+    assert limiter.truncated_events == 1
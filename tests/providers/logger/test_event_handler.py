@@ -48,3 +48,40 @@ def test_logger_event_handler_capture_with_local_tags_and_contexts(
         "global_context": "global_value",
         "local_context": "local_value",
     }
+
+
+def test_logger_event_handler_local_values_do_not_leak(
+    logger_core, tracker_event, caplog
+):
+    event_handler = LoggerEventHandler(logger_core)
+
+    event_handler.set_tags({"global_tag": "global_value"})
+    tracker_event.tags = {"local_tag": "local_value"}
+    tracker_event.contexts = {"local_context": "local_value"}
+
+    with caplog.at_level(logging.INFO):
+        event_handler.capture_event(tracker_event)
+        tracker_event.tags = None
+        tracker_event.contexts = None
+        event_handler.capture_event(tracker_event)
+
+    assert caplog.records[1].tags == {"global_tag": "global_value"}
+    assert caplog.records[1].contexts == {}
+
+
+def test_logger_event_handler_scope(logger_core, tracker_event, caplog):
+    event_handler = LoggerEventHandler(logger_core)
+
+    with caplog.at_level(logging.INFO):
+        with event_handler.scope():
+            event_handler.set_tags({"scoped_tag": "scoped_value"})
+            event_handler.capture_event(tracker_event)
+
+        event_handler.capture_event(tracker_event)
+
+    assert caplog.records[0].tags == {"scoped_tag": "scoped_value"}
+    assert caplog.records[1].tags == {}
+
+
+def test_logger_event_handler_shared_core(logger_core):
+    assert LoggerEventHandler(logger_core).shared_core() is logger_core
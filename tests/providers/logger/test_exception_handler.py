@@ -62,3 +62,21 @@ def test_logger_exception_handler_capture_with_local_tags_and_contexts(
         "global_context": "global_value",
         "local_context": {"local_value": 123},
     }
+
+
+def test_logger_exception_handler_scope(logger_core, tracker_exception, caplog):
+    exception_handler = LoggerExceptionHandler(logger_core)
+
+    with caplog.at_level(logging.ERROR):
+        with exception_handler.scope():
+            exception_handler.set_contexts({"scoped": {"key": "value"}})
+            exception_handler.capture_exception(tracker_exception)
+
+        exception_handler.capture_exception(tracker_exception)
+
+    assert caplog.records[0].contexts == {"scoped": {"key": "value"}}
+    assert caplog.records[1].contexts == {}
+
+
+def test_logger_exception_handler_shared_core(logger_core):
+    assert LoggerExceptionHandler(logger_core).shared_core() is logger_core
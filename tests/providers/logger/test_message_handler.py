@@ -48,3 +48,40 @@ def test_logger_message_handler_capture_with_local_tags_and_contexts(
         "global_context": "global_value",
         "local_context": "local_value",
     }
+
+
+def test_logger_message_handler_local_values_do_not_leak(
+    logger_core, tracker_message, caplog
+):
+    message_handler = LoggerMessageHandler(logger_core)
+
+    message_handler.set_tags({"global_tag": "global_value"})
+    tracker_message.tags = {"local_tag": "local_value"}
+    tracker_message.contexts = {"local_context": "local_value"}
+
+    with caplog.at_level(logging.INFO):
+        message_handler.capture_message(tracker_message)
+        tracker_message.tags = None
+        tracker_message.contexts = None
+        message_handler.capture_message(tracker_message)
+
+    assert caplog.records[1].tags == {"global_tag": "global_value"}
+    assert caplog.records[1].contexts == {}
+
+
+def test_logger_message_handler_scope(logger_core, tracker_message, caplog):
+    message_handler = LoggerMessageHandler(logger_core)
+
+    with caplog.at_level(logging.INFO):
+        with message_handler.scope():
+            message_handler.set_tags({"scoped_tag": "scoped_value"})
+            message_handler.capture_message(tracker_message)
+
+        message_handler.capture_message(tracker_message)
+
+    assert caplog.records[0].tags == {"scoped_tag": "scoped_value"}
+    assert caplog.records[1].tags == {}
+
+
+def test_logger_message_handler_shared_core(logger_core):
+    assert LoggerMessageHandler(logger_core).shared_core() is logger_core
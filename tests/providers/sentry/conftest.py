@@ -2,6 +2,9 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from tracker.providers.sentry import _sentry_lazy_contexts, _sentry_lazy_tags
+from tracker.scopes import EMPTY_SCOPE
+
 
 @pytest.fixture(autouse=True)
 def mock_init():
@@ -9,6 +12,15 @@ def mock_init():
         yield mock_init
 
 
+@pytest.fixture(autouse=True)
+def clear_lazy_contexts_and_tags():
+    _sentry_lazy_contexts.set(EMPTY_SCOPE)
+    _sentry_lazy_tags.set(EMPTY_SCOPE)
+    yield
+    _sentry_lazy_contexts.set(EMPTY_SCOPE)
+    _sentry_lazy_tags.set(EMPTY_SCOPE)
+
+
 @pytest.fixture()
 def set_tag_mock():
     with patch("sentry_sdk.set_tag") as mock_set_tag:
@@ -1,4 +1,31 @@
-from tracker.providers.sentry import SentryCore
+import asyncio
+import threading
+from datetime import datetime, timezone
+from enum import Enum
+from unittest.mock import call, patch
+
+import sentry_sdk
+
+from tracker.async_core import AsyncTracker
+from tracker.core import Tracker
+from tracker.dispatchers import BackgroundDispatcher
+from tracker.dtos import TrackerEvent, TrackerException
+from tracker.lazy import LazyContext
+from tracker.limits import TRUNCATED_KEY, ContextLimiter
+from tracker.providers.sentry import (
+    BreadcrumbRing,
+    SentryCore,
+    SentryEventHandler,
+    SentryExceptionHandler,
+)
+
+
+class SentryTestEvents(Enum):
+    CREATED = "created"
+    DROPPED = "dropped"
+    INNER = "inner"
+    OUTER = "outer"
+    PROCESSED = "processed"
 
 
 def test_sentry_core_with_tracing_enabled(mock_init):
@@ -108,3 +135,331 @@ def test_sentry_core_set_contexts(set_context_mock):
     set_context_mock.assert_any_call("context2", {"fieldA": True})
     set_context_mock.assert_any_call("context3", {"fieldX": [1, 2, 3]})
     assert set_context_mock.call_count == 3
+
+
+def test_sentry_core_defers_lazy_tags_and_contexts_to_capture(
+    set_tag_mock, set_context_mock, capture_message_mock
+):
+    calls = []
+    core = SentryCore(
+        SentryCore.SentryConfig(
+            dsn="http://example.com",
+            environment="testing",
+        )
+    )
+
+    core.set_tags({"plain": "value", "lazy": lambda: calls.append("tag") or "1"})
+    core.set_contexts({"order": LazyContext(lambda: {"id": "1"})})
+
+    set_tag_mock.assert_called_once_with("plain", "value")
+    set_context_mock.assert_not_called()
+    assert calls == []
+
+    core.capture_message("Test message", {"key": "value"})
+
+    assert calls == ["tag"]
+    capture_message_mock.assert_called_once_with(
+        "Test message",
+        tags={"lazy": "1", "key": "value"},
+        contexts={"order": {"id": "1"}},
+    )
+
+
+def test_sentry_core_eager_tag_overrides_earlier_lazy_tag(
+    set_tag_mock, capture_message_mock
+):
+    core = SentryCore(
+        SentryCore.SentryConfig(dsn="http://example.com", environment="testing")
+    )
+
+    with core.scope():
+        core.set_tags({"user": lambda: "lazy"})
+        core.set_tags({"user": "eager"})
+        core.capture_message("Test message")
+
+    core.capture_message("Test message")
+
+    set_tag_mock.assert_not_called()
+    assert capture_message_mock.call_args_list == [
+        call("Test message", tags={"user": "eager"}),
+        call("Test message"),
+    ]
+
+
+def test_sentry_core_scope():
+    core = SentryCore(
+        SentryCore.SentryConfig(
+            dsn="http://example.com",
+            environment="testing",
+        )
+    )
+
+    with patch("sentry_sdk.isolation_scope") as isolation_scope_mock:
+        with core.scope():
+            isolation_scope_mock.return_value.__enter__.assert_called_once()
+
+    isolation_scope_mock.return_value.__exit__.assert_called_once()
+
+
+def test_sentry_core_scope_isolates_tags():
+    core = SentryCore(
+        SentryCore.SentryConfig(
+            dsn="http://example.com",
+            environment="testing",
+        )
+    )
+
+    with core.scope():
+        core.set_tags({"scoped_tag": "scoped_value"})
+        assert sentry_sdk.get_isolation_scope()._tags["scoped_tag"] == "scoped_value"
+
+    assert "scoped_tag" not in sentry_sdk.get_isolation_scope()._tags
+
+
+def test_sentry_core_reinitializes_after_fork(mock_init):
+    core = SentryCore(
+        SentryCore.SentryConfig(dsn="http://example.com", environment="testing")
+    )
+
+    core._init()
+
+    assert mock_init.call_count == 2
+    assert mock_init.call_args.kwargs["dsn"] == "http://example.com"
+    assert mock_init.call_args.kwargs["environment"] == "testing"
+
+
+def test_sentry_core_set_contexts_applies_context_limiter(set_context_mock):
+    limiter = ContextLimiter(ContextLimiter.LimiterConfig(max_items=1))
+    core = SentryCore(
+        SentryCore.SentryConfig(
+            dsn="http://example.com",
+            environment="testing",
+            context_limiter=limiter,
+        )
+    )
+
+    core.set_contexts({"order": {"id": "1", "total": 10}})
+
+    set_context_mock.assert_called_once_with("order", {"id": "1", TRUNCATED_KEY: 1})
+    assert limiter.truncated_events == 1
+
+
+def test_sentry_core_capture_message_with_tags_and_contexts(
+    capture_message_mock, set_tag_mock, set_context_mock
+):
+    core = SentryCore(
+        SentryCore.SentryConfig(dsn="http://example.com", environment="testing")
+    )
+
+    core.capture_message(
+        "Test message", {"key": "value"}, {"order": LazyContext(lambda: {"id": "1"})}
+    )
+
+    capture_message_mock.assert_called_once_with(
+        "Test message", tags={"key": "value"}, contexts={"order": {"id": "1"}}
+    )
+    set_tag_mock.assert_not_called()
+    set_context_mock.assert_not_called()
+
+
+def test_sentry_core_capture_exception_with_limited_contexts(capture_exception_mock):
+    limiter = ContextLimiter(ContextLimiter.LimiterConfig(max_items=1))
+    core = SentryCore(
+        SentryCore.SentryConfig(
+            dsn="http://example.com",
+            environment="testing",
+            context_limiter=limiter,
+        )
+    )
+    exception = Exception("Test exception")
+
+    core.capture_exception(exception, None, {"order": {"id": "1", "total": 10}})
+
+    capture_exception_mock.assert_called_once_with(
+        exception, contexts={"order": {"id": "1", TRUNCATED_KEY: 1}}
+    )
+    assert limiter.truncated_events == 1
+
+
+def test_sentry_core_capture_does_not_leak_tags_into_scope():
+    core = SentryCore(
+        SentryCore.SentryConfig(dsn="http://example.com", environment="testing")
+    )
+
+    core.capture_message("Test message", {"per_event": "value"}, {"order": {}})
+
+    assert "per_event" not in sentry_sdk.get_isolation_scope()._tags
+    assert "per_event" not in sentry_sdk.get_current_scope()._tags
+
+
+def test_breadcrumb_ring_keeps_the_most_recent_items_in_order():
+    ring = BreadcrumbRing(3)
+
+    assert ring.items() == []
+
+    for index in range(2):
+        ring.append((index, "tracker.event", index, None))
+
+    assert [crumb[0] for crumb in ring.items()] == [0, 1]
+
+    for index in range(2, 7):
+        ring.append((index, "tracker.event", index, None))
+
+    assert [crumb[0] for crumb in ring.items()] == [4, 5, 6]
+    assert len(ring.slots) == 3
+
+
+def test_sentry_core_capture_exception_without_breadcrumbs(capture_exception_mock):
+    core = SentryCore(
+        SentryCore.SentryConfig(dsn="http://example.com", environment="testing")
+    )
+    exception = Exception("Test exception")
+
+    with core.scope(), patch("sentry_sdk.new_scope") as new_scope_mock:
+        core.capture_exception(exception)
+
+    new_scope_mock.assert_not_called()
+    capture_exception_mock.assert_called_once_with(exception)
+
+
+def test_sentry_core_capture_exception_materializes_breadcrumbs(
+    capture_exception_mock,
+):
+    core = SentryCore(
+        SentryCore.SentryConfig(
+            dsn="http://example.com", environment="testing", breadcrumb_buffer_size=2
+        )
+    )
+    exception = Exception("Test exception")
+
+    with core.scope(), patch("tracker.providers.sentry.time.time", return_value=0):
+        core.record_breadcrumb("tracker.event", SentryTestEvents.DROPPED, None)
+        core.record_breadcrumb("tracker.event", SentryTestEvents.CREATED, None)
+        core.record_breadcrumb(
+            "tracker.message", SentryTestEvents.PROCESSED, lambda: {"order_id": "1"}
+        )
+
+        with patch("sentry_sdk.new_scope") as new_scope_mock:
+            core.capture_exception(exception, {"key": "value"})
+
+    timestamp = datetime.fromtimestamp(0, timezone.utc)
+    scope = new_scope_mock.return_value.__enter__.return_value
+    assert scope.add_breadcrumb.call_args_list == [
+        call(
+            {
+                "type": "default",
+                "category": "tracker.event",
+                "message": "created",
+                "level": "info",
+                "timestamp": timestamp,
+                "data": {},
+            }
+        ),
+        call(
+            {
+                "type": "default",
+                "category": "tracker.message",
+                "message": "processed",
+                "level": "info",
+                "timestamp": timestamp,
+                "data": {"order_id": "1"},
+            }
+        ),
+    ]
+    capture_exception_mock.assert_called_once_with(exception, tags={"key": "value"})
+
+
+def test_sentry_core_breadcrumbs_are_per_scope_and_not_shared():
+    events = []
+    core = SentryCore(
+        SentryCore.SentryConfig(dsn="http://example.com", environment="testing")
+    )
+    client = sentry_sdk.Client(
+        dsn="http://key@localhost/1",
+        before_send=lambda event, hint: events.append(event),
+        default_integrations=False,
+    )
+
+    with sentry_sdk.isolation_scope() as outer:
+        outer.set_client(client)
+        core.record_breadcrumb("tracker.event", SentryTestEvents.OUTER, None)
+
+        with core.scope():
+            core.record_breadcrumb("tracker.event", SentryTestEvents.INNER, None)
+            core.capture_exception(Exception("inner"))
+
+        core.capture_exception(Exception("outer"))
+
+        assert not outer._breadcrumbs
+
+    assert [
+        [crumb["message"] for crumb in event["breadcrumbs"]["values"]]
+        for event in events
+    ] == [["inner"], ["outer"]]
+
+
+def test_sentry_core_breadcrumbs_survive_async_tracker_offload():
+    core = SentryCore(
+        SentryCore.SentryConfig(dsn="http://example.com", environment="testing")
+    )
+    tracker = AsyncTracker(
+        event_handlers=[SentryEventHandler(core)],
+        exception_handlers=[SentryExceptionHandler(core)],
+    )
+
+    async def emit():
+        with tracker.scope():
+            await tracker.emit_event(TrackerEvent(SentryTestEvents.CREATED))
+            await tracker.emit_exception(TrackerException(Exception("boom")))
+
+    with (
+        patch("sentry_sdk.capture_exception"),
+        patch("sentry_sdk.new_scope") as new_scope_mock,
+    ):
+        asyncio.run(emit())
+
+    scope = new_scope_mock.return_value.__enter__.return_value
+    assert scope.add_breadcrumb.call_count == 1
+
+
+def test_sentry_core_breadcrumbs_survive_background_dispatcher():
+    core = SentryCore(
+        SentryCore.SentryConfig(dsn="http://example.com", environment="testing")
+    )
+    tracker = Tracker(
+        event_handlers=[SentryEventHandler(core)],
+        exception_handlers=[SentryExceptionHandler(core)],
+        dispatcher=BackgroundDispatcher(BackgroundDispatcher.DispatcherConfig()),
+    )
+
+    with (
+        patch("sentry_sdk.capture_exception"),
+        patch("sentry_sdk.new_scope") as new_scope_mock,
+    ):
+        with tracker.scope():
+            tracker.emit_event(TrackerEvent(SentryTestEvents.CREATED))
+            tracker.emit_event(TrackerEvent(SentryTestEvents.PROCESSED))
+            tracker.emit_exception(TrackerException(Exception("boom")))
+            assert tracker.flush(timeout=2)
+
+        tracker.close(timeout=2)
+
+    scope = new_scope_mock.return_value.__enter__.return_value
+    assert scope.add_breadcrumb.call_count == 2
+
+
+def test_breadcrumb_ring_appends_from_many_threads():
+    ring = BreadcrumbRing(1000)
+
+    def record():
+        for index in range(100):
+            ring.append((index, "tracker.event", index, None))
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert ring.position == 800
+    assert len(ring.items()) == 800
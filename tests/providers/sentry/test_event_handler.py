@@ -0,0 +1,45 @@
+from tracker.providers.sentry import SentryEventHandler
+
+
+def test_sentry_event_handler_records_events(sentry_core_mock, tracker_event):
+    event_handler = SentryEventHandler(sentry_core_mock)
+
+    event_handler.capture_event(tracker_event)
+
+    sentry_core_mock.record_breadcrumb.assert_called_once_with(
+        "tracker.event", tracker_event.event, tracker_event.tags
+    )
+
+
+def test_sentry_event_handler_records_messages(sentry_core_mock, tracker_message):
+    event_handler = SentryEventHandler(sentry_core_mock)
+
+    event_handler.capture_message(tracker_message)
+
+    sentry_core_mock.record_breadcrumb.assert_called_once_with(
+        "tracker.message", tracker_message.message, tracker_message.tags
+    )
+
+
+def test_sentry_event_handler_set_tags_and_contexts(sentry_core_mock):
+    event_handler = SentryEventHandler(sentry_core_mock)
+
+    event_handler.set_tags({"global_tag": "global_value"})
+    event_handler.set_contexts({"global_context": {"global_value": 123}})
+
+    sentry_core_mock.set_tags.assert_called_once_with({"global_tag": "global_value"})
+    sentry_core_mock.set_contexts.assert_called_once_with(
+        {"global_context": {"global_value": 123}}
+    )
+
+
+def test_sentry_event_handler_scope(sentry_core_mock):
+    event_handler = SentryEventHandler(sentry_core_mock)
+
+    assert event_handler.scope() is sentry_core_mock.scope.return_value
+
+
+def test_sentry_event_handler_shared_core(sentry_core_mock):
+    event_handler = SentryEventHandler(sentry_core_mock)
+
+    assert event_handler.shared_core() is sentry_core_mock
@@ -18,7 +18,7 @@ def test_sentry_exception_handler_capture(
         {"global_context": {"global_value": 123}}
     )
     sentry_core_mock.capture_exception.assert_called_once_with(
-        tracker_exception.exception
+        tracker_exception.exception, None, None
     )
 
 
@@ -37,16 +37,24 @@ def test_sentry_exception_handler_capture_with_tags_and_contexts(
 
     exception_handler.capture_exception(tracker_exception)
 
-    sentry_core_mock.set_tags.assert_any_call({"global_tag": "global_value"})
-    sentry_core_mock.set_tags.assert_any_call(tracker_exception.tags)
-    assert sentry_core_mock.set_tags.call_count == 2
-
-    sentry_core_mock.set_contexts.assert_any_call(
+    # Per-event values travel with the capture instead of being set on the
+    # shared scope.
+    sentry_core_mock.set_tags.assert_called_once_with({"global_tag": "global_value"})
+    sentry_core_mock.set_contexts.assert_called_once_with(
         {"global_context": {"global_value": 123}}
     )
-    sentry_core_mock.set_contexts.assert_any_call(tracker_exception.contexts)
-    assert sentry_core_mock.set_contexts.call_count == 2
-
     sentry_core_mock.capture_exception.assert_called_once_with(
-        tracker_exception.exception
+        tracker_exception.exception, tracker_exception.tags, tracker_exception.contexts
     )
+
+
+def test_sentry_exception_handler_scope(sentry_core_mock):
+    exception_handler = SentryExceptionHandler(sentry_core_mock)
+
+    assert exception_handler.scope() is sentry_core_mock.scope.return_value
+
+
+def test_sentry_exception_handler_shared_core(sentry_core_mock):
+    exception_handler = SentryExceptionHandler(sentry_core_mock)
+
+    assert exception_handler.shared_core() is sentry_core_mock
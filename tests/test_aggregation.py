@@ -0,0 +1,364 @@
+import logging
+import socket
+import threading
+import time
+from enum import Enum
+from unittest.mock import Mock
+
+import pytest
+
+from tracker import Tracker
+from tracker.aggregation import (
+    AggregateRecord,
+    AggregatingEventHandler,
+    Distribution,
+    HandlerSink,
+    IAggregateSink,
+    LoggerSink,
+    StatsdSink,
+    summary,
+)
+from tracker.dtos import TrackerEvent
+
+
+class AggregationEvents(Enum):
+    PAYMENT_APPROVED = "payment_approved"
+    PAYMENT_DECLINED = "payment_declined"
+
+
+class ListSink(IAggregateSink):
+    def __init__(self):
+        self.records = []
+
+    def write(self, records):
+        self.records.extend(records)
+
+
+def make_handler(sink=None, **config):
+    config.setdefault("interval", None)
+    return AggregatingEventHandler(
+        sink or ListSink(), AggregatingEventHandler.AggregationConfig(**config)
+    )
+
+
+def approved(**tags):
+    return TrackerEvent(event=AggregationEvents.PAYMENT_APPROVED, tags=tags or None)
+
+
+def by_tags(records):
+    return {tuple(sorted(record.tags.items())): record for record in records}
+
+
+def test_aggregating_handler_counts_by_event_and_tag_set():
+    sink = ListSink()
+    handler = make_handler(sink)
+
+    for _ in range(3):
+        handler.capture_event(approved(method="pix", bank="a"))
+
+    handler.capture_event(approved(bank="a", method="pix"))
+    handler.capture_event(approved(method="card"))
+    handler.capture_event(approved())
+    handler.capture_event(TrackerEvent(event=AggregationEvents.PAYMENT_DECLINED))
+
+    records = handler.flush()
+
+    assert sink.records == records
+    assert {
+        (record.event, tuple(sorted(record.tags.items())), record.count)
+        for record in records
+    } == {
+        (AggregationEvents.PAYMENT_APPROVED, (("bank", "a"), ("method", "pix")), 4),
+        (AggregationEvents.PAYMENT_APPROVED, (("method", "card"),), 1),
+        (AggregationEvents.PAYMENT_APPROVED, (), 1),
+        (AggregationEvents.PAYMENT_DECLINED, (), 1),
+    }
+    assert handler.flush() == []
+    assert len(sink.records) == 4
+
+
+def test_aggregating_handler_records_value_keys_as_distributions():
+    handler = make_handler(value_keys=("amount",))
+
+    handler.capture_event(approved(method="pix", amount=10.0))
+    handler.capture_event(approved(method="pix", amount=2.5))
+    handler.capture_event(approved(method="pix", amount=30))
+    handler.capture_event(approved(method="pix"))
+    handler.capture_event(approved(amount=1))
+
+    records = by_tags(handler.flush())
+    pix = records[(("method", "pix"),)]
+
+    assert pix.count == 4
+    amount = pix.values["amount"]
+    assert (amount.count, amount.total, amount.min, amount.max) == (3, 42.5, 2.5, 30)
+    assert records[()].values["amount"].total == 1
+
+
+def test_aggregating_handler_skips_non_numeric_values(caplog):
+    sink = ListSink()
+    handler = make_handler(sink, value_keys=("amount", "items"))
+
+    with caplog.at_level(logging.ERROR):
+        handler.capture_event(approved(amount="n/a", items="2"))
+        handler.capture_event(approved(amount=10))
+
+    handler.flush()
+
+    (aggregate,) = sink.records
+    assert aggregate.count == 2
+    assert aggregate.values["amount"].count == 1
+    assert aggregate.values["amount"].total == 10
+    assert aggregate.values["items"].total == 2
+    assert "Ignoring non-numeric value 'n/a' of amount" in caplog.text
+
+
+def test_aggregating_handler_resolves_lazy_tags():
+    handler = make_handler()
+
+    handler.capture_event(
+        TrackerEvent(
+            event=AggregationEvents.PAYMENT_APPROVED,
+            tags=lambda: {"method": "pix"},
+        )
+    )
+
+    (record,) = handler.flush()
+    assert record.tags == {"method": "pix"}
+
+
+def test_aggregating_handler_ignores_ambient_tags_and_contexts():
+    sink = ListSink()
+    handler = make_handler(sink)
+    tracker = Tracker(event_handlers=[handler])
+
+    with tracker.scope():
+        tracker.set_tags({"request_id": "abc"})
+        tracker.set_contexts({"request": {"id": "abc"}})
+        tracker.emit_event(approved(method="pix"))
+
+    handler.flush()
+    assert sink.records[0].tags == {"method": "pix"}
+
+
+def test_aggregating_handler_merges_thread_shards():
+    handler = make_handler(value_keys=("amount",))
+    barrier = threading.Barrier(4)
+
+    def emit():
+        barrier.wait()
+
+        for index in range(1000):
+            handler.capture_event(approved(method="pix", amount=index))
+
+    threads = [threading.Thread(target=emit) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    (record,) = handler.flush()
+
+    assert record.count == 4000
+    assert record.values["amount"].count == 4000
+    assert record.values["amount"].max == 999
+    # Shards of finished threads are released once drained.
+    assert handler._shards == []
+
+
+def test_aggregating_handler_flushes_periodically_and_on_close():
+    sink = ListSink()
+    handler = make_handler(sink, interval=0.01)
+
+    handler.capture_event(approved())
+    deadline = time.monotonic() + 5
+
+    while not sink.records and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert sink.records[0].count == 1
+    assert sink.records[0].interval > 0
+
+    handler.capture_event(approved())
+    handler.close()
+    handler.close()
+
+    assert sum(record.count for record in sink.records) == 2
+    assert not handler._flusher.is_alive()
+
+
+def test_aggregating_handler_logs_sink_errors(caplog):
+    sink = Mock(spec=IAggregateSink)
+    sink.write.side_effect = ValueError("sink down")
+    handler = make_handler(sink)
+
+    handler.capture_event(approved())
+
+    with caplog.at_level(logging.ERROR):
+        records = handler.flush()
+
+    assert len(records) == 1
+    assert "Error writing 1 aggregates to sink" in caplog.text
+    assert "sink down" in caplog.text
+
+
+def test_aggregating_handler_restarts_after_fork():
+    handler = make_handler(interval=60)
+    handler.capture_event(approved())
+    flusher = handler._flusher
+
+    handler._restart()
+    assert handler._flusher is not flusher
+    assert handler._flusher.is_alive()
+    # Counts recorded before the fork belong to the parent.
+    assert handler.flush() == []
+
+    handler.close()
+    handler._restart()
+    assert not handler._flusher.is_alive()
+
+
+def test_distribution_merge():
+    left, right, empty = Distribution(), Distribution(), Distribution()
+    left.record(5)
+    right.record(1)
+    right.record(9)
+
+    left.merge(right)
+    left.merge(empty)
+
+    assert (left.count, left.total, left.min, left.max) == (3, 15, 1, 9)
+
+
+def test_distribution_rejects_non_numeric_value_unchanged():
+    distribution = Distribution()
+    distribution.record(5)
+
+    with pytest.raises(ValueError):
+        distribution.record("n/a")
+
+    assert (distribution.count, distribution.total) == (1, 5)
+
+
+@pytest.fixture
+def record():
+    distribution = Distribution()
+    distribution.record(10.5)
+    return AggregateRecord(
+        event=AggregationEvents.PAYMENT_APPROVED,
+        tags={"method": "pix"},
+        count=3,
+        values={"amount": distribution},
+        interval=10.0,
+    )
+
+
+def test_summary(record):
+    assert summary(record) == {
+        "count": 3,
+        "interval": 10.0,
+        "values": {"amount": {"count": 1, "sum": 10.5, "min": 10.5, "max": 10.5}},
+    }
+
+
+def test_logger_sink(record, caplog):
+    sink = LoggerSink()
+
+    with caplog.at_level(logging.INFO, logger="Tracker.Aggregates"):
+        sink.write([record])
+
+    (log_record,) = caplog.records
+    assert log_record.getMessage() == "payment_approved"
+    assert log_record.tags == {"method": "pix"}
+    assert log_record.contexts == {"aggregate": summary(record)}
+
+
+def test_handler_sink(record):
+    inner = Mock()
+    sink = HandlerSink(inner)
+
+    sink.write([record])
+
+    inner.capture_event.assert_called_once_with(
+        TrackerEvent(
+            event=AggregationEvents.PAYMENT_APPROVED,
+            tags={"method": "pix"},
+            contexts={"aggregate": summary(record)},
+        )
+    )
+
+
+@pytest.fixture
+def statsd_server():
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    server.settimeout(5)
+    yield server
+    server.close()
+
+
+def test_statsd_sink_sends_dogstatsd_lines(record, statsd_server):
+    sink = StatsdSink(
+        StatsdSink.StatsdConfig(port=statsd_server.getsockname()[1], prefix="payments.")
+    )
+    untagged = AggregateRecord(
+        event=AggregationEvents.PAYMENT_DECLINED,
+        tags={},
+        count=1,
+        values={},
+        interval=10.0,
+    )
+
+    sink.write([record, untagged])
+    sink.close()
+
+    assert statsd_server.recv(65536).decode().split("\n") == [
+        "payments.payment_approved:3|c|#method:pix",
+        "payments.payment_approved.amount.count:1|c|#method:pix",
+        "payments.payment_approved.amount.sum:10.5|c|#method:pix",
+        "payments.payment_approved.amount.min:10.5|g|#method:pix",
+        "payments.payment_approved.amount.max:10.5|g|#method:pix",
+        "payments.payment_declined:1|c",
+    ]
+
+
+def test_statsd_sink_escapes_reserved_characters():
+    sink = StatsdSink(StatsdSink.StatsdConfig())
+    distribution = Distribution()
+    distribution.record(1)
+    record = AggregateRecord(
+        event=AggregationEvents.PAYMENT_APPROVED,
+        tags={"route|v:2": "a,b|c:d\ne"},
+        count=1,
+        values={"amount:x": distribution},
+        interval=10.0,
+    )
+
+    lines = sink.lines(record)
+    sink.close()
+
+    assert lines[0] == "payment_approved:1|c|#route_v_2:a_b_c_d_e"
+    assert lines[1].startswith("payment_approved.amount_x.count:1|c|#")
+
+
+def test_statsd_sink_splits_packets(record):
+    sink = StatsdSink(StatsdSink.StatsdConfig(max_packet_size=80))
+
+    packets = sink.packets([record])
+    sink.close()
+
+    assert all(len(packet) <= 80 for packet in packets)
+    assert b"\n".join(packets).decode().split("\n") == sink.lines(record)
+    assert len(packets) == 4
+
+
+def test_statsd_sink_counts_dropped_packets(record):
+    sink = StatsdSink(StatsdSink.StatsdConfig())
+    sink._socket = Mock()
+    sink._socket.sendto.side_effect = OSError
+
+    sink.write([record])
+
+    assert sink.dropped == 1
@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import threading
+from contextvars import ContextVar
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from tracker.async_core import AsyncTracker
+from tracker.lazy import resolve_mapping
+
+_request_id = ContextVar("request_id", default=None)
+
+
+def test_async_tracker_emit_without_handlers(
+    tracker_message, tracker_exception, tracker_event
+):
+    tracker = AsyncTracker()
+
+    asyncio.run(tracker.emit_event(tracker_event))
+    asyncio.run(tracker.emit_message(tracker_message))
+    asyncio.run(tracker.emit_exception(tracker_exception))
+
+
+def test_async_tracker_emit_with_async_handlers(
+    tracker_message, tracker_exception, tracker_event
+):
+    message_handler = AsyncMock()
+    exception_handler = AsyncMock()
+    event_handler = AsyncMock()
+
+    tracker = AsyncTracker(
+        message_handlers=[message_handler],
+        exception_handlers=[exception_handler],
+        event_handlers=[event_handler],
+    )
+
+    asyncio.run(tracker.emit_message(tracker_message))
+    asyncio.run(tracker.emit_exception(tracker_exception))
+    asyncio.run(tracker.emit_event(tracker_event))
+
+    message_handler.capture_message.assert_awaited_once_with(tracker_message)
+    exception_handler.capture_exception.assert_awaited_once_with(tracker_exception)
+    event_handler.capture_event.assert_awaited_once_with(tracker_event)
+
+
+def test_async_tracker_offloads_sync_handlers(tracker_event):
+    loop_thread = []
+    handler_thread = []
+    seen_request_ids = []
+
+    sync_handler = Mock()
+    sync_handler.capture_event.side_effect = lambda event: (
+        handler_thread.append(threading.get_ident()),
+        seen_request_ids.append(_request_id.get()),
+    )
+
+    tracker = AsyncTracker(event_handlers=[sync_handler])
+
+    async def emit():
+        loop_thread.append(threading.get_ident())
+        _request_id.set("abc")
+        await tracker.emit_event(tracker_event)
+
+    asyncio.run(emit())
+
+    sync_handler.capture_event.assert_called_once_with(tracker_event)
+    assert handler_thread != loop_thread
+    assert seen_request_ids == ["abc"]
+
+
+def test_async_tracker_runs_handlers_concurrently(tracker_event):
+    started = []
+
+    async def slow_capture(event):
+        started.append(event)
+        await asyncio.sleep(0.05)
+
+    handler_one = AsyncMock()
+    handler_one.capture_event.side_effect = slow_capture
+    handler_two = AsyncMock()
+    handler_two.capture_event.side_effect = slow_capture
+
+    tracker = AsyncTracker(event_handlers=[handler_one, handler_two])
+
+    async def emit():
+        task = asyncio.ensure_future(tracker.emit_event(tracker_event))
+        await asyncio.sleep(0.01)
+        assert len(started) == 2
+        await task
+
+    asyncio.run(emit())
+
+
+def test_async_tracker_handler_timeout(tracker_message, caplog):
+    async def slow_capture(message):
+        await asyncio.sleep(1)
+
+    slow_handler = AsyncMock()
+    slow_handler.capture_message.side_effect = slow_capture
+    fast_handler = AsyncMock()
+
+    tracker = AsyncTracker(
+        message_handlers=[slow_handler, fast_handler], handler_timeout=0.01
+    )
+
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(tracker.emit_message(tracker_message))
+
+    fast_handler.capture_message.assert_awaited_once_with(tracker_message)
+    assert (
+        caplog.records[0].message
+        == f"Timeout emitting message for handler {slow_handler}"
+    )
+
+
+def test_async_tracker_emit_when_handler_raises(tracker_exception, caplog):
+    failing_handler = AsyncMock()
+    failing_handler.capture_exception.side_effect = Exception("Handler Error")
+    sync_handler = Mock()
+
+    tracker = AsyncTracker(exception_handlers=[failing_handler, sync_handler])
+
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(tracker.emit_exception(tracker_exception))
+
+    sync_handler.capture_exception.assert_called_once_with(tracker_exception)
+    assert (
+        caplog.records[0].message
+        == f"Error emitting exception for handler {failing_handler}: Handler Error"
+    )
+
+
+def test_async_tracker_set_tags_and_contexts(caplog):
+    message_handler = AsyncMock()
+    exception_handler = Mock()
+    event_handler = Mock()
+    event_handler.set_tags = Mock(side_effect=Exception("Tags Error"))
+    event_handler.set_contexts = Mock(side_effect=Exception("Contexts Error"))
+    message_handler.set_tags = Mock()
+    message_handler.set_contexts = Mock()
+    message_handler.shared_core = Mock(return_value=message_handler)
+
+    tracker = AsyncTracker(
+        message_handlers=[message_handler],
+        exception_handlers=[exception_handler],
+        event_handlers=[event_handler],
+    )
+
+    tags = {"key": "value"}
+    contexts = {"context": {"detail": "info"}}
+
+    with caplog.at_level(logging.ERROR):
+        tracker.set_tags(tags)
+        tracker.set_contexts(contexts)
+
+    message_handler.set_tags.assert_called_once_with(tags)
+    exception_handler.set_tags.assert_called_once_with(tags)
+    message_handler.set_contexts.assert_called_once_with(contexts)
+    exception_handler.set_contexts.assert_called_once_with(contexts)
+    assert [record.message for record in caplog.records] == [
+        f"Error setting tags for handler {event_handler}: Tags Error",
+        f"Error setting contexts for handler {event_handler}: Contexts Error",
+    ]
+
+
+def test_async_tracker_scope(caplog):
+    handler = MagicMock()
+    failing_handler = MagicMock()
+    failing_handler.scope.side_effect = Exception("Scope Error")
+
+    tracker = AsyncTracker(event_handlers=[handler, failing_handler])
+
+    with caplog.at_level(logging.ERROR):
+        with tracker.scope():
+            handler.scope.return_value.__enter__.assert_called_once()
+
+    handler.scope.return_value.__exit__.assert_called_once()
+    assert (
+        caplog.records[0].message
+        == f"Error opening scope for handler {failing_handler}: Scope Error"
+    )
+
+
+def test_async_tracker_resolves_lazy_contexts_once_across_handlers(tracker_event):
+    factory = Mock(return_value={"id": "1"})
+    resolved = []
+
+    async def serialize(event):
+        resolved.append(resolve_mapping(event.contexts))
+
+    async_handler = MagicMock()
+    async_handler.capture_event = serialize
+    sync_handler = Mock()
+    sync_handler.capture_event.side_effect = lambda event: resolved.append(
+        resolve_mapping(event.contexts)
+    )
+    tracker_event.contexts = {"order": factory}
+
+    tracker = AsyncTracker(event_handlers=[async_handler, sync_handler])
+    asyncio.run(tracker.emit_event(tracker_event))
+
+    assert resolved == [{"order": {"id": "1"}}] * 2
+    factory.assert_called_once_with()
+
+
+def test_async_tracker_awaits_async_callable_objects(tracker_event):
+    seen = []
+
+    class AsyncCapture:
+        async def __call__(self, event):
+            seen.append((threading.get_ident(), event))
+
+    handler = Mock()
+    handler.capture_event = AsyncCapture()
+
+    tracker = AsyncTracker(event_handlers=[handler])
+
+    async def emit():
+        await tracker.emit_event(tracker_event)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(emit())
+
+    assert seen == [(loop_thread, tracker_event)]
+
+
+def test_async_tracker_awaits_callables_marked_as_coroutine_functions(
+    tracker_event,
+):
+    seen = []
+
+    async def record(event):
+        seen.append(event)
+
+    class MarkedCapture:
+        # The marker asyncio.iscoroutinefunction looks for; AsyncMock sets
+        # it too, but inspect only recognizes AsyncMock from 3.10.
+        _is_coroutine = asyncio.coroutines._is_coroutine
+
+        def __call__(self, event):
+            return record(event)
+
+    handler = Mock()
+    handler.capture_event = MarkedCapture()
+
+    asyncio.run(AsyncTracker(event_handlers=[handler]).emit_event(tracker_event))
+
+    assert seen == [tracker_event]
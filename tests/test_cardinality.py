@@ -0,0 +1,152 @@
+import logging
+import os
+import subprocess
+import sys
+from enum import Enum
+
+import pytest
+
+from tracker.cardinality import OVERFLOW_VALUE, CardinalityGuard, HyperLogLog
+from tracker.dtos import TrackerEvent
+from tracker.lazy import LazyContext, resolve
+
+
+class CardinalityEvents(Enum):
+    CREATED = "created"
+
+
+def make_guard(**config):
+    return CardinalityGuard(CardinalityGuard.CardinalityConfig(**config))
+
+
+@pytest.mark.parametrize("count", [0, 10, 1000, 50000])
+def test_hyperloglog_estimate(count):
+    sketch = HyperLogLog()
+
+    for index in range(count):
+        sketch.add(index)
+        sketch.add(index)
+
+    assert sketch.estimate() == pytest.approx(count, rel=0.05)
+
+
+def test_hyperloglog_is_the_same_in_every_process():
+    code = (
+        "from tracker.cardinality import HyperLogLog; sketch = HyperLogLog(); "
+        "[sketch.add(value) for value in ('pix', (int, 1), (float, 2.5))]; "
+        "print(sketch.registers.hex())"
+    )
+    registers = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+        ).stdout
+        for seed in range(3)
+    }
+
+    assert len(registers) == 1
+
+
+def test_guard_returns_tags_within_limits_unchanged():
+    guard = make_guard()
+    tags = {"method": "pix", "attempt": 1, "retry": True, "region": None}
+
+    assert guard.limit(tags) is tags
+    assert guard.limit(tags) is tags
+    assert guard.limit(None) is None
+    assert guard.limit({}) == {}
+    assert guard.overflowed() == {}
+
+
+def test_guard_interns_values_without_copying_tags():
+    guard = make_guard()
+    first = "".join(["p", "ix"])
+    second = "".join(["p", "ix"])
+    assert first is not second
+
+    guard.limit({"method": first, "bank": "a"})
+    tags = {"bank": "a", "method": second}
+
+    assert guard.limit(tags) is tags
+    assert guard.value("method", second) is guard.value("method", first)
+
+
+def test_guard_keeps_types_of_equal_values_apart():
+    guard = make_guard()
+
+    guard.limit({"flag": 1})
+
+    assert guard.limit({"flag": True})["flag"] is True
+
+
+def test_guard_collapses_values_past_the_limit(caplog):
+    guard = make_guard(max_values_per_key=3)
+
+    with caplog.at_level(logging.WARNING):
+        limited = [
+            guard.limit({"user_id": index, "method": "pix"}) for index in range(6)
+        ]
+
+    assert [tags["user_id"] for tags in limited] == [0, 1, 2] + [OVERFLOW_VALUE] * 3
+    assert all(tags["method"] == "pix" for tags in limited)
+    # Values admitted before the limit keep passing through.
+    assert guard.limit({"user_id": 1})["user_id"] == 1
+    assert guard.overflowed() == {"user_id": 6}
+    assert caplog.text.count("Tag 'user_id' exceeded 3 distinct values") == 1
+
+
+def test_guard_memory_stays_bounded():
+    guard = make_guard(max_values_per_key=100, max_keys=10)
+
+    for index in range(20000):
+        guard.limit({"request_id": f"req-{index}", f"key-{index % 50}": index})
+
+    assert len(guard._keys) == 10
+    assert all(len(state.values) <= 100 for state in guard._keys.values())
+    assert guard.overflowed()["request_id"] == pytest.approx(20000, rel=0.1)
+
+
+def test_guard_drops_keys_past_the_key_limit(caplog):
+    guard = make_guard(max_keys=2)
+
+    with caplog.at_level(logging.WARNING):
+        limited = guard.limit({"a": 1, "b": 2, "c": 3, "d": 4})
+
+    assert limited == {"a": 1, "b": 2}
+    assert guard.dropped_keys == 2
+    assert caplog.text.count("Tag key limit of 2 reached") == 1
+    assert "'c'" in caplog.text
+
+
+def test_guard_keeps_lazy_tags_lazy():
+    guard = make_guard(max_values_per_key=1, max_keys=1)
+    calls = []
+
+    def tags():
+        calls.append(1)
+        return {"user_id": "a"}
+
+    limited = guard.limit(tags)
+    assert isinstance(limited, LazyContext)
+    assert calls == []
+    assert resolve(limited) == {"user_id": "a"}
+
+    values = guard.limit({"user_id": lambda: "b", "other": LazyContext(lambda: "c")})
+    assert resolve(values["user_id"]) == OVERFLOW_VALUE
+    # The key limit is only known once the value resolves.
+    assert resolve(values["other"]) == OVERFLOW_VALUE
+
+
+def test_guard_limit_item():
+    guard = make_guard(max_values_per_key=1)
+    first = TrackerEvent(event=CardinalityEvents.CREATED, tags={"user_id": "a"})
+    second = TrackerEvent(event=CardinalityEvents.CREATED, tags={"user_id": "b"})
+
+    assert guard.limit_item(first) is first
+
+    limited = guard.limit_item(second)
+    assert limited.tags == {"user_id": OVERFLOW_VALUE}
+    assert second.tags == {"user_id": "b"}
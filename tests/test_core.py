@@ -1,6 +1,19 @@
 import logging
+from enum import Enum
+from unittest.mock import MagicMock, Mock, call
 
+from tracker.cardinality import OVERFLOW_VALUE, CardinalityGuard
 from tracker.core import Tracker
+from tracker.dispatchers import BackgroundDispatcher
+from tracker.dtos import TrackerEvent, TrackerException, TrackerMessage
+from tracker.filtering import TrackerFilter
+from tracker.interfaces import ITrackerHandlerEvent
+from tracker.lazy import resolve_mapping
+from tracker.metrics import QueueStats, TrackerMetrics, TrackerStats
+from tracker.plan import HandlerKind
+from tracker.providers.logger import LoggerCore, LoggerEventHandler
+from tracker.sampling import TokenBucketSampler
+from tracker.wrappers import BatchingHandler
 
 
 def test_tracker_emit_without_handlers(
@@ -238,3 +251,432 @@ def test_tracker_set_contexts_when_handler_raises(handlers_mocks, caplog):
         log_record.message
         == f"Error setting contexts for handler {message_handler}: Handler Error"
     )
+
+
+def test_tracker_flush_and_close_without_dispatcher():
+    tracker = Tracker()
+
+    assert tracker.flush(timeout=1) is True
+    assert tracker.close(timeout=1) is True
+
+
+def test_tracker_emit_with_dispatcher(
+    tracker_message, tracker_exception, tracker_event, handlers_mocks
+):
+    message_handler = handlers_mocks["message_handlers"][0]
+    exception_handler = handlers_mocks["exception_handlers"][0]
+    event_handler = handlers_mocks["event_handlers"][0]
+
+    tracker = Tracker(
+        message_handlers=[message_handler],
+        exception_handlers=[exception_handler],
+        event_handlers=[event_handler],
+        dispatcher=BackgroundDispatcher(BackgroundDispatcher.DispatcherConfig()),
+    )
+
+    tracker.emit_message(tracker_message)
+    tracker.emit_exception(tracker_exception)
+    tracker.emit_event(tracker_event)
+
+    assert tracker.flush(timeout=5) is True
+    assert tracker.close(timeout=5) is True
+
+    message_handler.capture_message.assert_called_once_with(tracker_message)
+    exception_handler.capture_exception.assert_called_once_with(tracker_exception)
+    event_handler.capture_event.assert_called_once_with(tracker_event)
+
+
+def test_tracker_scope_enters_and_exits_handler_scopes(handlers_mocks):
+    handler = MagicMock()
+    shared_handler = MagicMock()
+
+    tracker = Tracker(
+        message_handlers=[handler, shared_handler],
+        exception_handlers=[shared_handler],
+    )
+
+    with tracker.scope():
+        handler.scope.return_value.__enter__.assert_called_once()
+        handler.scope.return_value.__exit__.assert_not_called()
+
+    handler.scope.return_value.__exit__.assert_called_once()
+    shared_handler.scope.assert_called_once_with()
+
+
+def test_tracker_scope_when_handler_raises(caplog):
+    handler = MagicMock()
+    handler.scope.side_effect = Exception("Scope Error")
+
+    tracker = Tracker(event_handlers=[handler])
+
+    with caplog.at_level(logging.ERROR):
+        with tracker.scope():
+            pass
+
+    assert (
+        caplog.records[0].message
+        == f"Error opening scope for handler {handler}: Scope Error"
+    )
+
+
+def test_tracker_scope_with_default_handler_scope():
+    class Handler(ITrackerHandlerEvent):
+        def set_tags(self, tags):
+            pass
+
+        def set_contexts(self, contexts):
+            pass
+
+        def capture_event(self, tracker_event):
+            pass
+
+    tracker = Tracker(event_handlers=[Handler()])
+
+    with tracker.scope():
+        pass
+
+
+def test_tracker_sampler_discards_before_handlers(
+    tracker_message, tracker_exception, tracker_event, handlers_mocks
+):
+    message_handler = handlers_mocks["message_handlers"][0]
+    exception_handler = handlers_mocks["exception_handlers"][0]
+    event_handler = handlers_mocks["event_handlers"][0]
+    sampler = Mock()
+    sampler.should_sample.return_value = False
+
+    tracker = Tracker(
+        message_handlers=[message_handler],
+        exception_handlers=[exception_handler],
+        event_handlers=[event_handler],
+        sampler=sampler,
+    )
+
+    tracker.emit_message(tracker_message)
+    tracker.emit_exception(tracker_exception)
+    tracker.emit_event(tracker_event)
+
+    message_handler.capture_message.assert_not_called()
+    exception_handler.capture_exception.assert_not_called()
+    event_handler.capture_event.assert_not_called()
+    assert sampler.should_sample.call_args_list == [
+        call(tracker_message.message, tracker_message.tags),
+        call(Exception, tracker_exception.tags),
+        call(tracker_event.event, tracker_event.tags),
+    ]
+
+
+def test_tracker_sampler_keeps_sampled_items(tracker_event, handlers_mocks):
+    event_handler = handlers_mocks["event_handlers"][0]
+    sampler = Mock()
+    sampler.should_sample.return_value = True
+
+    tracker = Tracker(event_handlers=[event_handler], sampler=sampler)
+    tracker.emit_event(tracker_event)
+
+    event_handler.capture_event.assert_called_once_with(tracker_event)
+
+
+def test_tracker_applies_tags_and_contexts_once_per_shared_core():
+    core = Mock()
+    message_handler = Mock(**{"shared_core.return_value": core})
+    exception_handler = Mock(**{"shared_core.return_value": core})
+
+    tracker = Tracker(
+        message_handlers=[message_handler], exception_handlers=[exception_handler]
+    )
+    tracker.set_tags({"key": "value"})
+    tracker.set_contexts({"context": {"detail": "info"}})
+
+    with tracker.scope():
+        pass
+
+    exception_handler.set_tags.assert_called_once_with({"key": "value"})
+    exception_handler.set_contexts.assert_called_once_with(
+        {"context": {"detail": "info"}}
+    )
+    exception_handler.scope.assert_called_once_with()
+    message_handler.set_tags.assert_not_called()
+    message_handler.set_contexts.assert_not_called()
+    message_handler.scope.assert_not_called()
+
+
+def test_tracker_add_and_remove_handler(tracker_event, handlers_mocks):
+    event_handler = handlers_mocks["event_handlers"][0]
+    tracker = Tracker()
+
+    tracker.add_handler(HandlerKind.EVENT, event_handler)
+    tracker.emit_event(tracker_event)
+    tracker.set_tags({"key": "value"})
+
+    tracker.remove_handler(HandlerKind.EVENT, event_handler)
+    tracker.emit_event(tracker_event)
+
+    event_handler.capture_event.assert_called_once_with(tracker_event)
+    event_handler.set_tags.assert_called_once_with({"key": "value"})
+
+
+def test_tracker_stats_without_metrics():
+    assert Tracker().stats() == TrackerStats(handlers=[], queues=[])
+
+
+def test_tracker_stats_reports_handlers_and_queues(
+    tracker_message, tracker_exception, handlers_mocks, caplog
+):
+    message_handler = handlers_mocks["message_handlers"][0]
+    exception_handler = handlers_mocks["exception_handlers"][0]
+    exception_handler.capture_exception.side_effect = Exception("Handler Error")
+    batching_handler = BatchingHandler(
+        Mock(), BatchingHandler.BatchingConfig(max_batch_age=None)
+    )
+    dispatcher = BackgroundDispatcher(BackgroundDispatcher.DispatcherConfig())
+
+    tracker = Tracker(
+        message_handlers=[message_handler],
+        exception_handlers=[exception_handler],
+        event_handlers=[batching_handler],
+        dispatcher=dispatcher,
+        metrics=TrackerMetrics(),
+    )
+
+    with caplog.at_level(logging.ERROR):
+        tracker.emit_message(tracker_message)
+        tracker.emit_exception(tracker_exception)
+        tracker.flush(timeout=5)
+
+    tracker.add_handler(HandlerKind.MESSAGE, Mock())
+    stats = tracker.stats()
+    tracker.close(timeout=5)
+
+    assert {
+        (item.kind, item.handler): (item.calls, item.errors) for item in stats.handlers
+    } == {
+        ("message", message_handler): (1, 0),
+        ("exception", exception_handler): (1, 1),
+    }
+    assert stats.queues == [
+        QueueStats(name="BackgroundDispatcher", depth=0, dropped=0),
+        QueueStats(name="BatchingHandler", depth=0, dropped=0),
+    ]
+    assert (
+        caplog.records[0].message
+        == f"Error emitting exception for handler {exception_handler}: Handler Error"
+    )
+
+
+class FilteredEvents(Enum):
+    PAID = "paid"
+    HEALTH_CHECK = "health_check"
+
+
+def test_tracker_filters_disabled_kinds(
+    tracker_message, tracker_exception, handlers_mocks
+):
+    sampler = Mock()
+    tracker = Tracker(
+        **handlers_mocks,
+        sampler=sampler,
+        filters=TrackerFilter(disabled_kinds=[HandlerKind.MESSAGE]),
+    )
+    sampler.should_sample.return_value = True
+
+    tracker.emit_message(tracker_message)
+    tracker.emit_exception(tracker_exception)
+
+    for handler in handlers_mocks["message_handlers"]:
+        handler.capture_message.assert_not_called()
+    handlers_mocks["exception_handlers"][0].capture_exception.assert_called_once()
+    # Filtered items never reach the sampler.
+    sampler.should_sample.assert_called_once_with(Exception, None)
+
+
+def test_tracker_filters_by_enum_and_handler_level():
+    audit_handler = Mock()
+    alerting_handler = Mock()
+    tracker = Tracker(
+        event_handlers=[audit_handler, alerting_handler],
+        filters=TrackerFilter(
+            min_levels={alerting_handler: logging.WARNING},
+            levels={FilteredEvents.PAID: logging.WARNING},
+            deny=[FilteredEvents.HEALTH_CHECK],
+        ),
+    )
+    paid = TrackerEvent(event=FilteredEvents.PAID)
+
+    tracker.emit_event(paid)
+    tracker.emit_event(TrackerEvent(event=FilteredEvents.HEALTH_CHECK))
+
+    audit_handler.capture_event.assert_called_once_with(paid)
+    alerting_handler.capture_event.assert_called_once_with(paid)
+
+
+def test_tracker_filters_exceptions_by_type(tracker_exception):
+    handler = Mock()
+    tracker = Tracker(
+        exception_handlers=[handler], filters=TrackerFilter(deny=[LookupError])
+    )
+
+    tracker.emit_exception(tracker_exception)
+    tracker.emit_exception(TrackerException(exception=KeyError("missing")))
+
+    handler.capture_exception.assert_called_once_with(tracker_exception)
+
+
+def test_tracker_filters_apply_on_dispatcher_workers(tracker_event):
+    handler = Mock()
+    dispatcher = BackgroundDispatcher(BackgroundDispatcher.DispatcherConfig())
+    tracker = Tracker(
+        message_handlers=[handler],
+        exception_handlers=[handler],
+        event_handlers=[handler],
+        dispatcher=dispatcher,
+        filters=TrackerFilter(
+            min_levels={handler: logging.INFO}, allow=[FilteredEvents.PAID]
+        ),
+    )
+
+    tracker.emit_event(TrackerEvent(event=FilteredEvents.PAID))
+    tracker.emit_message(TrackerMessage(message=FilteredEvents.PAID))
+    tracker.emit_exception(TrackerException(exception=ValueError()))
+    tracker.emit_event(tracker_event)
+    tracker.close(timeout=5)
+
+    handler.capture_event.assert_called_once()
+    handler.capture_message.assert_called_once()
+    handler.capture_exception.assert_not_called()
+
+
+def test_tracker_enabled_for():
+    handler = Mock()
+    tracker = Tracker(
+        event_handlers=[handler],
+        exception_handlers=[handler],
+        filters=TrackerFilter(deny=[FilteredEvents.HEALTH_CHECK, KeyError]),
+    )
+
+    assert tracker.enabled_for(FilteredEvents.PAID) is True
+    assert tracker.enabled_for(FilteredEvents.HEALTH_CHECK) is False
+    assert tracker.enabled_for(FilteredEvents.PAID, HandlerKind.MESSAGE) is False
+    assert tracker.enabled_for(ValueError) is True
+    assert tracker.enabled_for(KeyError) is False
+
+
+def test_tracker_resolves_lazy_contexts_once_across_handlers():
+    factory = Mock(return_value={"id": "1"})
+    resolved = []
+
+    def serialize(tracker_event):
+        resolved.append(resolve_mapping(tracker_event.contexts))
+
+    first, second = Mock(), Mock()
+    first.capture_event.side_effect = serialize
+    second.capture_event.side_effect = serialize
+    tracker = Tracker(event_handlers=[first, second])
+
+    tracker.emit_event(
+        TrackerEvent(event=FilteredEvents.PAID, contexts={"order": factory})
+    )
+
+    assert resolved == [{"order": {"id": "1"}}] * 2
+    factory.assert_called_once_with()
+
+
+def test_tracker_resolves_lazy_tags_once_with_tag_keyed_sampler():
+    factory = Mock(return_value={"tenant": "a"})
+    handler = Mock()
+    handler.capture_event.side_effect = lambda item: resolve_mapping(item.tags)
+    tracker = Tracker(
+        event_handlers=[handler],
+        sampler=TokenBucketSampler(rate=1, burst=10, tag_keys=["tenant"]),
+    )
+
+    tracker.emit_event(TrackerEvent(event=FilteredEvents.PAID, tags=factory))
+
+    factory.assert_called_once_with()
+
+
+def test_tracker_resolves_ambient_lazy_contexts_once_per_emit():
+    factory = Mock(return_value={"id": "1"})
+    first = LoggerEventHandler(LoggerCore(LoggerCore.LoggerConfig()))
+    second = LoggerEventHandler(LoggerCore(LoggerCore.LoggerConfig()))
+    tracker = Tracker(event_handlers=[first, second])
+
+    with tracker.scope():
+        tracker.set_contexts({"request": factory})
+        tracker.emit_event(TrackerEvent(event=FilteredEvents.PAID))
+        tracker.emit_event(TrackerEvent(event=FilteredEvents.PAID))
+
+    assert factory.call_count == 2
+
+
+def test_tracker_skips_lazy_contexts_of_filtered_events():
+    factory = Mock()
+    handler = Mock()
+    tracker = Tracker(
+        event_handlers=[handler], filters=TrackerFilter(deny=[FilteredEvents.PAID])
+    )
+
+    tracker.emit_event(TrackerEvent(event=FilteredEvents.PAID, contexts=factory))
+
+    factory.assert_not_called()
+    handler.capture_event.assert_not_called()
+
+
+def test_tracker_cardinality_guard_limits_emitted_and_ambient_tags(
+    tracker_event, tracker_message, tracker_exception
+):
+    guard = CardinalityGuard(CardinalityGuard.CardinalityConfig(max_values_per_key=1))
+    handler = MagicMock()
+    tracker = Tracker(
+        event_handlers=[handler],
+        message_handlers=[handler],
+        exception_handlers=[handler],
+        cardinality=guard,
+    )
+
+    tracker.set_tags({"user_id": "a"})
+    tracker.set_tags({"user_id": "b"})
+    handler.set_tags.assert_called_with({"user_id": OVERFLOW_VALUE})
+
+    for item in (tracker_event, tracker_message, tracker_exception):
+        item.tags = {"user_id": "c"}
+
+    tracker.emit_event(tracker_event)
+    tracker.emit_message(tracker_message)
+    tracker.emit_exception(tracker_exception)
+
+    for captured in (
+        handler.capture_event.call_args[0][0],
+        handler.capture_message.call_args[0][0],
+        handler.capture_exception.call_args[0][0],
+    ):
+        assert captured.tags == {"user_id": OVERFLOW_VALUE}
+
+    assert tracker_event.tags == {"user_id": "c"}
+    assert guard.overflowed() == {"user_id": 3}
+
+
+def test_tracker_cardinality_guard_passes_items_without_tags(tracker_event):
+    handler = MagicMock()
+    tracker = Tracker(
+        event_handlers=[handler],
+        cardinality=CardinalityGuard(CardinalityGuard.CardinalityConfig()),
+    )
+
+    tracker.emit_event(tracker_event)
+
+    handler.capture_event.assert_called_once_with(tracker_event)
+
+
+def test_tracker_cardinality_guard_ignores_sampled_out_events():
+    guard = CardinalityGuard(CardinalityGuard.CardinalityConfig(max_values_per_key=1))
+    sampler = Mock()
+    sampler.should_sample.side_effect = [False, True]
+    handler = Mock()
+    tracker = Tracker(event_handlers=[handler], sampler=sampler, cardinality=guard)
+
+    tracker.emit_event(TrackerEvent(event=FilteredEvents.PAID, tags={"user_id": "a"}))
+    tracker.emit_event(TrackerEvent(event=FilteredEvents.PAID, tags={"user_id": "b"}))
+
+    assert handler.capture_event.call_args[0][0].tags == {"user_id": "b"}
+    assert guard.overflowed() == {}
@@ -0,0 +1,193 @@
+import logging
+import threading
+from contextvars import ContextVar
+from unittest.mock import Mock
+
+import pytest
+
+from tracker.dispatchers import BackgroundDispatcher, OverflowPolicy
+
+_request_id = ContextVar("request_id", default=None)
+
+
+@pytest.fixture()
+def gate():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def make_dispatcher(**kwargs):
+    return BackgroundDispatcher(BackgroundDispatcher.DispatcherConfig(**kwargs))
+
+
+def blocked_function(gate):
+    started = threading.Event()
+
+    def function(item):
+        started.set()
+        gate.wait(5)
+
+    return function, started
+
+
+def test_dispatcher_runs_submitted_items():
+    dispatcher = make_dispatcher()
+    function = Mock()
+
+    assert dispatcher.submit(function, "item") is True
+    assert dispatcher.flush(timeout=5) is True
+
+    function.assert_called_once_with("item")
+    assert dispatcher.close(timeout=5) is True
+
+
+def test_dispatcher_propagates_caller_context():
+    dispatcher = make_dispatcher()
+    seen = []
+
+    _request_id.set("abc")
+    dispatcher.submit(lambda item: seen.append(_request_id.get()), "item")
+    dispatcher.flush(timeout=5)
+
+    assert seen == ["abc"]
+    dispatcher.close(timeout=5)
+
+
+def test_dispatcher_logs_errors_and_keeps_running(caplog):
+    dispatcher = make_dispatcher()
+    function = Mock(side_effect=[Exception("Boom"), None])
+
+    with caplog.at_level(logging.ERROR):
+        dispatcher.submit(function, "first")
+        dispatcher.submit(function, "second")
+        dispatcher.flush(timeout=5)
+
+    assert function.call_count == 2
+    assert caplog.records[0].message == "Error dispatching first in background: Boom"
+    dispatcher.close(timeout=5)
+
+
+def test_dispatcher_drop_newest_when_full(gate):
+    dispatcher = make_dispatcher(
+        max_queue_size=1, overflow_policy=OverflowPolicy.DROP_NEWEST
+    )
+    blocker, started = blocked_function(gate)
+    function = Mock()
+
+    dispatcher.submit(blocker, "blocker")
+    started.wait(5)
+
+    assert dispatcher.submit(function, "kept") is True
+    assert dispatcher.submit(function, "dropped") is False
+    assert dispatcher.dropped == 1
+    assert dispatcher.queue_depth == 1
+
+    gate.set()
+    dispatcher.flush(timeout=5)
+
+    function.assert_called_once_with("kept")
+    dispatcher.close(timeout=5)
+
+
+def test_dispatcher_drop_oldest_when_full(gate):
+    dispatcher = make_dispatcher(
+        max_queue_size=1, overflow_policy=OverflowPolicy.DROP_OLDEST
+    )
+    blocker, started = blocked_function(gate)
+    function = Mock()
+
+    dispatcher.submit(blocker, "blocker")
+    started.wait(5)
+
+    assert dispatcher.submit(function, "dropped") is True
+    assert dispatcher.submit(function, "kept") is True
+    assert dispatcher.dropped == 1
+
+    gate.set()
+    dispatcher.flush(timeout=5)
+
+    function.assert_called_once_with("kept")
+    dispatcher.close(timeout=5)
+
+
+def test_dispatcher_block_with_timeout_when_full(gate):
+    dispatcher = make_dispatcher(
+        max_queue_size=1, overflow_policy=OverflowPolicy.BLOCK, block_timeout=0.01
+    )
+    blocker, started = blocked_function(gate)
+    function = Mock()
+
+    dispatcher.submit(blocker, "blocker")
+    started.wait(5)
+
+    assert dispatcher.submit(function, "kept") is True
+    assert dispatcher.submit(function, "dropped") is False
+    assert dispatcher.dropped == 1
+
+    gate.set()
+    dispatcher.flush(timeout=5)
+
+    function.assert_called_once_with("kept")
+    dispatcher.close(timeout=5)
+
+
+def test_dispatcher_flush_times_out(gate):
+    dispatcher = make_dispatcher()
+    blocker, started = blocked_function(gate)
+
+    dispatcher.submit(blocker, "blocker")
+    started.wait(5)
+
+    assert dispatcher.flush(timeout=0.01) is False
+
+    gate.set()
+    assert dispatcher.close() is True
+
+
+def test_dispatcher_rejects_items_after_close():
+    dispatcher = make_dispatcher(workers=2)
+    function = Mock()
+
+    assert dispatcher.close(timeout=5) is True
+    assert dispatcher.close(timeout=5) is True
+    assert dispatcher.submit(function, "item") is False
+    assert dispatcher.dropped == 1
+    function.assert_not_called()
+
+
+def test_dispatcher_close_times_out_when_queue_stays_full(gate):
+    dispatcher = make_dispatcher(max_queue_size=1)
+    blocker, started = blocked_function(gate)
+
+    dispatcher.submit(blocker, "blocker")
+    started.wait(5)
+    dispatcher.submit(Mock(), "pending")
+
+    assert dispatcher.close(timeout=0.01) is False
+
+
+def test_dispatcher_discard_oldest_on_empty_queue():
+    dispatcher = make_dispatcher()
+
+    dispatcher._discard_oldest()
+
+    assert dispatcher.dropped == 0
+    dispatcher.close(timeout=5)
+
+
+def test_dispatcher_restarts_workers_after_fork():
+    dispatcher = BackgroundDispatcher(BackgroundDispatcher.DispatcherConfig())
+    workers = dispatcher._workers
+    function = Mock()
+
+    dispatcher._restart()
+    dispatcher.submit(function, "item")
+
+    assert dispatcher._workers is not workers
+    assert dispatcher.flush(timeout=5) is True
+    function.assert_called_once_with("item")
+    assert dispatcher.close(timeout=5) is True
+
+    dispatcher._restart()
+    assert dispatcher._workers is not workers
@@ -0,0 +1,50 @@
+from dataclasses import FrozenInstanceError
+from enum import Enum
+
+import pytest
+
+from tracker.dtos import (
+    FrozenTrackerEvent,
+    FrozenTrackerException,
+    FrozenTrackerMessage,
+    TrackerEvent,
+    TrackerException,
+    TrackerMessage,
+)
+
+
+class DTOEvents(Enum):
+    CREATED = "created"
+
+
+@pytest.mark.parametrize(
+    "dto",
+    [
+        TrackerEvent(event=DTOEvents.CREATED),
+        TrackerMessage(message=DTOEvents.CREATED),
+        TrackerException(exception=ValueError()),
+        FrozenTrackerEvent(event=DTOEvents.CREATED),
+        FrozenTrackerMessage(message=DTOEvents.CREATED),
+        FrozenTrackerException(exception=ValueError()),
+    ],
+)
+def test_dtos_are_slotted(dto):
+    assert not hasattr(dto, "__dict__")
+    assert dto.tags is None
+    assert dto.contexts is None
+
+
+def test_mutable_dtos_accept_assignment():
+    dto = TrackerEvent(event=DTOEvents.CREATED)
+    dto.tags = {"a": 1}
+
+    assert dto.tags == {"a": 1}
+
+
+def test_frozen_dtos_reject_assignment():
+    dto = FrozenTrackerEvent(event=DTOEvents.CREATED, tags={"a": 1})
+
+    with pytest.raises(FrozenInstanceError):
+        dto.tags = {}
+
+    assert dto == FrozenTrackerEvent(event=DTOEvents.CREATED, tags={"a": 1})
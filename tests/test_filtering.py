@@ -0,0 +1,75 @@
+import logging
+from enum import Enum
+
+from tracker.filtering import TrackerFilter
+from tracker.plan import HandlerKind
+
+
+class FilteredEvents(Enum):
+    PAID = "paid"
+    HEALTH_CHECK = "health_check"
+
+
+class PaymentError(Exception):
+    pass
+
+
+class CardDeclined(PaymentError):
+    pass
+
+
+def test_tracker_filter_defaults_allow_everything():
+    filters = TrackerFilter()
+
+    assert filters.allows(HandlerKind.EVENT, FilteredEvents.PAID)
+    assert filters.allows(HandlerKind.EXCEPTION, ValueError)
+    assert filters.level(HandlerKind.EVENT, FilteredEvents.PAID) == logging.INFO
+    assert filters.level(HandlerKind.MESSAGE, FilteredEvents.PAID) == logging.INFO
+    assert filters.level(HandlerKind.EXCEPTION, ValueError) == logging.ERROR
+    assert filters.allows_handler(object(), logging.DEBUG)
+    assert filters.keys == frozenset()
+
+
+def test_tracker_filter_disabled_kinds():
+    filters = TrackerFilter(disabled_kinds=[HandlerKind.EVENT])
+
+    assert not filters.allows(HandlerKind.EVENT, FilteredEvents.PAID)
+    assert filters.allows(HandlerKind.MESSAGE, FilteredEvents.PAID)
+
+
+def test_tracker_filter_allow_and_deny():
+    filters = TrackerFilter(
+        allow=[FilteredEvents.PAID, FilteredEvents.HEALTH_CHECK, PaymentError],
+        deny=[FilteredEvents.HEALTH_CHECK],
+    )
+
+    assert filters.allows(HandlerKind.EVENT, FilteredEvents.PAID)
+    assert not filters.allows(HandlerKind.EVENT, FilteredEvents.HEALTH_CHECK)
+    assert filters.allows(HandlerKind.EXCEPTION, CardDeclined)
+    assert not filters.allows(HandlerKind.EXCEPTION, ValueError)
+    assert filters.keys == {
+        FilteredEvents.PAID,
+        FilteredEvents.HEALTH_CHECK,
+        PaymentError,
+    }
+
+
+def test_tracker_filter_deny_covers_exception_subclasses():
+    filters = TrackerFilter(deny=[PaymentError])
+
+    assert not filters.allows(HandlerKind.EXCEPTION, CardDeclined)
+    assert filters.allows(HandlerKind.EXCEPTION, KeyError)
+
+
+def test_tracker_filter_levels_and_min_levels():
+    handler = object()
+    filters = TrackerFilter(
+        min_levels={handler: logging.WARNING},
+        levels={FilteredEvents.PAID: logging.WARNING, PaymentError: logging.CRITICAL},
+    )
+
+    assert filters.level(HandlerKind.EVENT, FilteredEvents.PAID) == logging.WARNING
+    assert filters.level(HandlerKind.EXCEPTION, CardDeclined) == logging.CRITICAL
+    assert filters.allows_handler(handler, logging.WARNING)
+    assert not filters.allows_handler(handler, logging.INFO)
+    assert filters.allows_handler(object(), logging.INFO)
@@ -0,0 +1,39 @@
+import gc
+import logging
+from unittest.mock import patch
+
+from tracker.forking import register_after_fork
+
+
+class Resource:
+    def __init__(self):
+        self.restarts = 0
+
+    def restart(self):
+        self.restarts += 1
+
+
+def registered_callback(target):
+    with patch("tracker.forking.os.register_at_fork") as register_at_fork:
+        register_after_fork(target)
+
+    return register_at_fork.call_args.kwargs["after_in_child"]
+
+
+def test_register_after_fork_calls_method_in_child():
+    resource = Resource()
+    after_in_child = registered_callback(resource.restart)
+
+    after_in_child()
+
+    assert resource.restarts == 1
+
+
+def test_register_after_fork_does_not_keep_object_alive():
+    resource = Resource()
+    after_in_child = registered_callback(resource.restart)
+
+    del resource
+    gc.collect()
+
+    after_in_child()
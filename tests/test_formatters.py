@@ -0,0 +1,118 @@
+import json
+import logging
+
+import pytest
+
+from tracker.formatters import (
+    TrackerJSONFormatter,
+    encode_contexts,
+    encode_tags,
+)
+from tracker.scopes import EMPTY_SCOPE
+
+
+def make_record(msg="message", exc_info=None, **extra):
+    record = logging.LogRecord(
+        name="Tracker.LoggerCore",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg=msg,
+        args=(),
+        exc_info=exc_info,
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def formatter(request):
+    return TrackerJSONFormatter(use_orjson=request.param)
+
+
+def test_encode_tags_matches_json():
+    tags = {
+        "str": 'välue "quoted"',
+        "int": 1,
+        "float": 1.5,
+        "true": True,
+        "false": False,
+        "none": None,
+        "other": [1, 2],
+    }
+
+    assert json.loads(encode_tags(tags)) == tags
+    assert encode_tags({}) == "{}"
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_encode_tags_writes_null_for_non_finite_floats(value):
+    assert json.loads(encode_tags({"x": value, "y": 1.5})) == {"x": None, "y": 1.5}
+
+
+def test_encode_contexts_matches_json():
+    contexts = {"context": {"list": [1, {"nested": None}], "value": 1.5}}
+
+    assert json.loads(encode_contexts(contexts)) == contexts
+
+
+def test_encode_contexts_falls_back_to_str():
+    assert json.loads(encode_contexts({"context": {"value": object}})) == {
+        "context": {"value": str(object)}
+    }
+
+
+def test_formatter_serializes_tags_and_contexts(formatter):
+    record = make_record(
+        tags={"partner": "premium", "retry": 2},
+        contexts={"user": {"id": "123", "value": 250.75}},
+    )
+
+    output = json.loads(formatter.format(record))
+
+    assert output["level"] == "INFO"
+    assert output["logger"] == "Tracker.LoggerCore"
+    assert output["message"] == "message"
+    assert output["tags"] == {"partner": "premium", "retry": 2}
+    assert output["contexts"] == {"user": {"id": "123", "value": 250.75}}
+    assert "timestamp" in output
+    assert "exception" not in output
+
+
+def test_formatter_without_tracker_extras(formatter):
+    output = json.loads(formatter.format(make_record()))
+
+    assert "tags" not in output
+    assert "contexts" not in output
+
+
+def test_formatter_serializes_exception(formatter):
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        record = make_record(exc_info=(ValueError, e, e.__traceback__))
+
+    output = json.loads(formatter.format(record))
+
+    assert output["exception"].startswith("Traceback")
+    assert output["exception"].endswith("ValueError: boom")
+    assert json.loads(formatter.format(record))["exception"] == output["exception"]
+
+
+def test_formatter_reuses_encoded_ambient_scope(formatter):
+    tags = EMPTY_SCOPE.push({"service": "tracker"}).flatten()
+    formatter.format(make_record(tags=tags))
+
+    formatter._tags.encoder = None
+    output = json.loads(formatter.format(make_record(tags=tags)))
+
+    assert output["tags"] == {"service": "tracker"}
+
+
+def test_formatter_falls_back_to_stdlib_without_orjson(monkeypatch):
+    monkeypatch.setattr("tracker.formatters.orjson", None)
+
+    formatter = TrackerJSONFormatter()
+
+    assert formatter.use_orjson is False
+    assert json.loads(formatter.format(make_record(tags={"a": 1})))["tags"] == {"a": 1}
@@ -1,5 +1,53 @@
-from tracker.helpers import default_dict
+import pickle
+from dataclasses import FrozenInstanceError, dataclass
+
+import pytest
+
+from tracker.helpers import add_slots, default_dict
 
 
 def test_default_dict():
     assert default_dict() == {}
+
+
+@add_slots
+@dataclass
+class SlottedPoint:
+    x: int
+    y: int = 0
+
+
+@add_slots
+@dataclass(frozen=True)
+class FrozenPoint:
+    x: int
+    y: int = 0
+
+
+def test_add_slots_drops_instance_dict():
+    point = SlottedPoint(1)
+
+    assert SlottedPoint.__slots__ == ("x", "y")
+    assert not hasattr(point, "__dict__")
+    assert point == SlottedPoint(1, 0)
+    assert SlottedPoint.__qualname__ == "SlottedPoint"
+
+    point.y = 2
+    assert point.y == 2
+
+    with pytest.raises(AttributeError):
+        point.z = 3
+
+
+def test_add_slots_keeps_frozen_semantics():
+    point = FrozenPoint(1, 2)
+
+    with pytest.raises(FrozenInstanceError):
+        point.x = 3
+
+    assert hash(point) == hash(FrozenPoint(1, 2))
+
+
+def test_add_slots_round_trips_through_pickle():
+    assert pickle.loads(pickle.dumps(SlottedPoint(1, 2))) == SlottedPoint(1, 2)
+    assert pickle.loads(pickle.dumps(FrozenPoint(1, 2))) == FrozenPoint(1, 2)
@@ -0,0 +1,98 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import tracker
+import tracker.providers
+
+IMPORT_TIME_BUDGET = 0.25
+
+HEAVY_MODULES = ("sentry_sdk", "asyncio", "orjson", "http.client")
+
+OPTIONAL_MODULES = (
+    "tracker.aggregation",
+    "tracker.cardinality",
+    "tracker.dispatchers",
+    "tracker.filtering",
+    "tracker.multiprocess",
+    "tracker.sampling",
+    "tracker.serialization",
+    "tracker.wrappers",
+)
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+
+def test_import_does_not_load_heavy_modules():
+    loaded = run_python(
+        "import json, sys, tracker; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+
+    assert json.loads(loaded) == []
+
+
+def test_import_does_not_load_optional_modules():
+    loaded = run_python(
+        "import json, sys, tracker; "
+        f"print(json.dumps([m for m in {OPTIONAL_MODULES!r} if m in sys.modules]))"
+    )
+
+    assert json.loads(loaded) == []
+
+
+def test_import_time_budget():
+    timings = [
+        float(
+            run_python(
+                "import time; started = time.perf_counter(); import tracker; "
+                "print(time.perf_counter() - started)"
+            )
+        )
+        for _ in range(3)
+    ]
+
+    assert min(timings) < IMPORT_TIME_BUDGET
+
+
+def test_lazy_exports_resolve_on_access():
+    from tracker.async_core import AsyncTracker
+    from tracker.formatters import TrackerJSONFormatter
+    from tracker.providers.http import HttpCore
+    from tracker.providers.sentry import SentryCore, SentryExceptionHandler
+
+    assert tracker.SentryCore is SentryCore
+    assert tracker.SentryExceptionHandler is SentryExceptionHandler
+    assert tracker.AsyncTracker is AsyncTracker
+    assert tracker.TrackerJSONFormatter is TrackerJSONFormatter
+    assert tracker.providers.SentryCore is SentryCore
+    assert tracker.HttpCore is HttpCore
+
+
+def test_optional_exports_resolve_on_access():
+    from tracker.dispatchers import BackgroundDispatcher
+    from tracker.multiprocess import TrackerCollector
+    from tracker.sampling import TokenBucketSampler
+    from tracker.wrappers import BatchingHandler
+
+    assert tracker.BackgroundDispatcher is BackgroundDispatcher
+    assert tracker.TokenBucketSampler is TokenBucketSampler
+    assert tracker.BatchingHandler is BatchingHandler
+    assert tracker.TrackerCollector is TrackerCollector
+
+
+@pytest.mark.parametrize("module", [tracker, tracker.providers])
+def test_lazy_exports_unknown_attribute(module):
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        module.Unknown
+
+
+@pytest.mark.parametrize("module", [tracker, tracker.providers])
+def test_lazy_exports_listed_in_dir(module):
+    assert set(module.__all__) <= set(dir(module))
@@ -0,0 +1,96 @@
+import threading
+from enum import Enum
+from unittest.mock import Mock
+
+from tracker.dtos import FrozenTrackerEvent, TrackerEvent
+from tracker.lazy import LazyContext, memoized, resolve, resolve_mapping
+
+
+class LazyEvents(Enum):
+    CREATED = "created"
+
+
+def test_lazy_context_resolves_once():
+    factory = Mock(return_value={"id": "1"})
+    lazy = LazyContext(factory)
+
+    assert lazy() == {"id": "1"}
+    assert lazy() == {"id": "1"}
+    factory.assert_called_once_with()
+    assert repr(lazy) == f"LazyContext({factory!r})"
+
+
+def test_lazy_context_resolves_once_across_threads():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    lazy = LazyContext(factory)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(lazy())) for _ in range(3)
+    ]
+
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == ["value"] * 3
+
+
+def test_resolve():
+    assert resolve("plain") == "plain"
+    assert resolve(lambda: "called") == "called"
+    assert resolve(LazyContext(lambda: "lazy")) == "lazy"
+
+
+def test_resolve_mapping():
+    plain = {"a": 1}
+
+    assert resolve_mapping(None) is None
+    assert resolve_mapping(plain) is plain
+    assert resolve_mapping(lambda: plain) is plain
+    assert resolve_mapping({"a": lambda: 1, "b": LazyContext(lambda: 2), "c": 3}) == {
+        "a": 1,
+        "b": 2,
+        "c": 3,
+    }
+
+
+def test_memoized_returns_item_without_callables():
+    item = TrackerEvent(event=LazyEvents.CREATED, tags={"a": 1}, contexts=None)
+
+    assert memoized(item) is item
+
+
+def test_memoized_wraps_callables_once_per_emit():
+    factory = Mock(return_value={"id": "1"})
+    lazy = LazyContext(Mock(return_value="kept"))
+    item = FrozenTrackerEvent(
+        event=LazyEvents.CREATED,
+        tags=factory,
+        contexts={"order": factory, "user": lazy, "plain": {"a": 1}},
+    )
+
+    memo = memoized(item)
+
+    assert memo is not item
+    assert type(memo) is FrozenTrackerEvent
+    assert type(memo.tags) is LazyContext
+    assert memo.contexts["user"] is lazy
+    assert memo.contexts["plain"] == {"a": 1}
+    assert resolve_mapping(memo.contexts) == resolve_mapping(memo.contexts)
+    assert resolve_mapping(memo.tags) == {"id": "1"}
+    assert factory.call_count == 2
+    assert memoized(memo).tags is memo.tags
@@ -0,0 +1,121 @@
+import json
+from decimal import Decimal
+from types import MappingProxyType
+
+from tracker.limits import (
+    DEPTH_MARKER,
+    STRING_MARKER,
+    TRUNCATED_KEY,
+    ContextLimiter,
+)
+
+
+def make_limiter(**config):
+    return ContextLimiter(ContextLimiter.LimiterConfig(**config))
+
+
+def test_limit_returns_same_objects_within_limits():
+    limiter = make_limiter()
+    contexts = {"order": {"id": 1, "items": [{"sku": "a"}], "paid": True}}
+
+    assert limiter.limit(contexts) is contexts
+    assert limiter.limit(None) is None
+    assert limiter.limit({}) == {}
+    assert limiter.truncated_events == 0
+
+
+def test_limit_truncates_long_strings():
+    limiter = make_limiter(max_string_length=4)
+    contexts = {"request": {"body": "abcdefgh", "method": "POST"}, "other": {}}
+
+    limited = limiter.limit(contexts)
+
+    assert limited == {
+        "request": {"body": "abcd" + STRING_MARKER, "method": "POST"},
+        "other": {},
+    }
+    assert contexts["request"]["body"] == "abcdefgh"
+    assert limited["other"] is contexts["other"]
+    assert limiter.truncated_events == 1
+
+
+def test_limit_caps_items_per_mapping_and_list():
+    limiter = make_limiter(max_items=2)
+    contexts = {"order": {"a": 1, "b": 2, "c": 3}, "cart": {"ids": [1, 2, 3, 4]}}
+
+    assert limiter.limit(contexts) == {
+        "order": {"a": 1, "b": 2, TRUNCATED_KEY: 1},
+        "cart": {"ids": [1, 2, "...[2 items truncated]"]},
+    }
+
+
+def test_limit_caps_depth():
+    limiter = make_limiter(max_depth=3)
+    contexts = {"a": {"b": {"c": {"d": 1}, "e": [[1]]}, "f": (1, 2)}}
+
+    assert limiter.limit(contexts) == {
+        "a": {"b": {"c": DEPTH_MARKER, "e": DEPTH_MARKER}, "f": (1, 2)}
+    }
+
+
+def test_limit_copies_lists_after_a_truncated_item():
+    limiter = make_limiter(max_string_length=2)
+
+    assert limiter.limit({"log": {"lines": ("ok", "long", "x", 1)}}) == {
+        "log": {"lines": ["ok", "lo" + STRING_MARKER, "x", 1]}
+    }
+
+
+def test_limit_enforces_total_bytes():
+    limiter = make_limiter(max_bytes=200)
+    contexts = {f"context{index}": {"payload": "x" * 50} for index in range(10)}
+
+    limited = limiter.limit(contexts)
+
+    assert limited[TRUNCATED_KEY] > 0
+    assert len(json.dumps(limited)) < 300
+    assert limiter.truncated_events == 1
+
+
+def test_limit_cuts_strings_to_remaining_bytes():
+    limiter = make_limiter(max_bytes=30)
+
+    limited = limiter.limit({"request": {"body": "x" * 100, "more": "y"}})
+
+    assert limited["request"]["body"] == "x" * 11 + STRING_MARKER
+    assert limited["request"][TRUNCATED_KEY] == 1
+
+
+def test_limit_truncates_remaining_list_items_when_out_of_bytes():
+    limiter = make_limiter(max_bytes=20)
+
+    assert limiter.limit({"ids": {"values": [123456789, 123456789, 1]}}) == {
+        "ids": {"values": [123456789, "...[2 items truncated]"]}
+    }
+
+
+class Label(str):
+    pass
+
+
+class Items(list):
+    pass
+
+
+def test_limit_walks_subclasses_and_other_mappings():
+    limiter = make_limiter(max_string_length=2, max_items=1)
+    contexts = {
+        "request": MappingProxyType(
+            {"label": Label("long"), "items": Items([1, 2]), "at": Decimal("1.5")}
+        )
+    }
+
+    assert limiter.limit(contexts) == {
+        "request": {"label": "lo" + STRING_MARKER, TRUNCATED_KEY: 2}
+    }
+    assert make_limiter(max_items=1).limit({"items": {"ids": Items([1, 2])}}) == {
+        "items": {"ids": [1, "...[1 items truncated]"]}
+    }
+    assert make_limiter().limit({"at": {"value": Decimal("1.5")}}) == {
+        "at": {"value": Decimal("1.5")}
+    }
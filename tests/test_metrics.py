@@ -0,0 +1,180 @@
+import threading
+
+import pytest
+
+from tracker.metrics import (
+    BUCKET_COUNT,
+    CircuitStats,
+    HandlerStats,
+    LatencyHistogram,
+    QueueStats,
+    TrackerMetrics,
+    TrackerStats,
+    bucket_index,
+    bucket_upper_bound,
+    render_prometheus,
+)
+
+
+@pytest.mark.parametrize("value", [0, 1, 7, 15, 16, 17, 1000, 123456789, 2**39])
+def test_bucket_bounds_contain_value_within_relative_error(value):
+    index = bucket_index(value)
+
+    assert value <= bucket_upper_bound(index)
+    assert bucket_upper_bound(index) <= value * 1.125 + 1
+    assert index == 0 or bucket_upper_bound(index - 1) < value
+
+
+def test_bucket_index_clamps_huge_values():
+    assert bucket_index(2**60) == BUCKET_COUNT - 1
+
+
+def test_latency_histogram_record_and_percentiles():
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(50) == 0
+
+    for value in range(1, 101):
+        histogram.record(value * 1000)
+
+    assert histogram.count == 100
+    assert histogram.total == 5050 * 1000
+    assert histogram.max == 100000
+    assert 50000 <= histogram.percentile(50) <= 50000 * 1.125
+    assert histogram.percentile(100) == 100000
+    assert histogram.count_at_or_below(10**9) == 100
+    assert histogram.count_at_or_below(0) == 0
+
+
+def test_latency_histogram_merge():
+    first = LatencyHistogram()
+    second = LatencyHistogram()
+    first.record(10)
+    second.record(1000)
+
+    first.merge(second)
+
+    assert first.count == 2
+    assert first.total == 1010
+    assert first.max == 1000
+
+
+def test_tracker_metrics_counts_calls_errors_and_latency():
+    metrics = TrackerMetrics()
+    handler = object()
+
+    def capture(item):
+        if item == "bad":
+            raise ValueError(item)
+
+    timed = metrics.instrument("event", handler, capture)
+    timed("good")
+
+    with pytest.raises(ValueError):
+        timed("bad")
+
+    [stats] = metrics.snapshot()
+    assert stats.kind == "event"
+    assert stats.handler is handler
+    assert stats.calls == 2
+    assert stats.errors == 1
+    assert stats.latency.count == 2
+
+
+def test_tracker_metrics_merges_thread_shards():
+    metrics = TrackerMetrics()
+    timed = metrics.instrument("message", "handler", lambda item: None)
+
+    threads = [
+        threading.Thread(target=lambda: [timed(i) for i in range(100)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(metrics._shards) == 4
+    assert metrics.snapshot()[0].calls == 400
+
+
+def test_tracker_metrics_folds_shards_of_exited_threads():
+    metrics = TrackerMetrics()
+    timed = metrics.instrument("message", "handler", lambda item: None)
+
+    for finished in range(1, 4):
+        thread = threading.Thread(target=lambda: [timed(i) for i in range(10)])
+        thread.start()
+        thread.join()
+        assert metrics.snapshot()[0].calls == 10 * finished
+
+    timed(0)
+
+    # Only the live main thread keeps a shard; the others live on as totals.
+    assert len(metrics._shards) == 1
+    (stats,) = metrics.snapshot()
+    assert stats.calls == 31
+    assert stats.latency.count == 31
+
+
+class SentryMessageHandler:
+    pass
+
+
+def test_render_prometheus():
+    latency = LatencyHistogram()
+    latency.record(2_000_000)
+    handler_stats = HandlerStats(
+        kind="message",
+        handler=SentryMessageHandler(),
+        calls=1,
+        errors=0,
+        latency=latency,
+    )
+    stats = TrackerStats(
+        handlers=[handler_stats, handler_stats],
+        queues=[QueueStats(name='Queue "a"', depth=3, dropped=1)],
+    )
+
+    text = render_prometheus(stats, buckets=(0.001, 0.01))
+
+    assert text == (
+        "# TYPE tracker_handler_calls_total counter\n"
+        'tracker_handler_calls_total{kind="message",handler="SentryMessageHandler"} 2\n'
+        "# TYPE tracker_handler_errors_total counter\n"
+        'tracker_handler_errors_total{kind="message",handler="SentryMessageHandler"} 0\n'
+        "# TYPE tracker_handler_latency_seconds histogram\n"
+        "tracker_handler_latency_seconds_bucket"
+        '{kind="message",handler="SentryMessageHandler",le="0.001"} 0\n'
+        "tracker_handler_latency_seconds_bucket"
+        '{kind="message",handler="SentryMessageHandler",le="0.01"} 2\n'
+        "tracker_handler_latency_seconds_bucket"
+        '{kind="message",handler="SentryMessageHandler",le="+Inf"} 2\n'
+        "tracker_handler_latency_seconds_sum"
+        '{kind="message",handler="SentryMessageHandler"} 0.004\n'
+        "tracker_handler_latency_seconds_count"
+        '{kind="message",handler="SentryMessageHandler"} 2\n'
+        "# TYPE tracker_queue_depth gauge\n"
+        'tracker_queue_depth{queue="Queue \\"a\\""} 3\n'
+        "# TYPE tracker_queue_dropped_total counter\n"
+        'tracker_queue_dropped_total{queue="Queue \\"a\\""} 1\n'
+        "# TYPE tracker_circuit_state gauge\n"
+        "# TYPE tracker_circuit_short_circuited_total counter\n"
+    )
+
+
+def test_render_prometheus_circuits():
+    stats = TrackerStats(
+        circuits=[
+            CircuitStats(name="SentryCore", state="open", failures=0, short_circuited=7)
+        ]
+    )
+
+    assert render_prometheus(stats).endswith(
+        "# TYPE tracker_circuit_state gauge\n"
+        'tracker_circuit_state{handler="SentryCore",state="closed"} 0\n'
+        'tracker_circuit_state{handler="SentryCore",state="open"} 1\n'
+        'tracker_circuit_state{handler="SentryCore",state="half_open"} 0\n'
+        "# TYPE tracker_circuit_short_circuited_total counter\n"
+        'tracker_circuit_short_circuited_total{handler="SentryCore"} 7\n'
+    )
@@ -0,0 +1,225 @@
+import logging
+import os
+import socket
+import stat
+import tempfile
+import threading
+from enum import Enum
+from unittest.mock import Mock
+
+import pytest
+
+from tracker.core import Tracker
+from tracker.dtos import TrackerEvent, TrackerException, TrackerMessage
+from tracker.metrics import QueueStats
+from tracker.multiprocess import ForwardingHandler, TrackerCollector
+
+
+class WorkerEvents(Enum):
+    STARTED = "started"
+
+
+@pytest.fixture()
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes, which pytest's tmp_path
+    # can exceed.
+    directory = tempfile.mkdtemp()
+    yield os.path.join(directory, "collector.sock")
+    os.rmdir(directory)
+
+
+class Recorder:
+    def __init__(self, expected):
+        self.items = []
+        self.done = threading.Event()
+        self.expected = expected
+
+    def __call__(self, item):
+        self.items.append(item)
+
+        if len(self.items) >= self.expected:
+            self.done.set()
+
+
+def make_collector(socket_path, **handlers):
+    collector = TrackerCollector(
+        Tracker(**handlers),
+        TrackerCollector.CollectorConfig(
+            socket_path=socket_path, receive_buffer_size=1 << 20, poll_interval=0.01
+        ),
+    )
+    collector.start()
+    return collector
+
+
+def test_forwarding_handler_delivers_to_collector(socket_path):
+    recorder = Recorder(expected=3)
+    handler = Mock()
+    handler.capture_event.side_effect = recorder
+    handler.capture_message.side_effect = recorder
+    handler.capture_exception.side_effect = recorder
+    collector = make_collector(
+        socket_path,
+        event_handlers=[handler],
+        message_handlers=[handler],
+        exception_handlers=[handler],
+    )
+    forwarding = ForwardingHandler(
+        ForwardingHandler.ForwardingConfig(socket_path=socket_path)
+    )
+
+    with forwarding.scope():
+        forwarding.set_tags({"worker": 1})
+        forwarding.set_contexts({"process": {"pid": 42}})
+        forwarding.capture_event(
+            TrackerEvent(event=WorkerEvents.STARTED, tags={"a": 1})
+        )
+
+    forwarding.capture_message(TrackerMessage(message=WorkerEvents.STARTED))
+    forwarding.capture_exception(TrackerException(exception=ValueError("boom")))
+
+    assert recorder.done.wait(5)
+    forwarding.close()
+    collector.close(timeout=5)
+
+    event, message, exception = recorder.items
+    assert event == TrackerEvent(
+        event=WorkerEvents.STARTED,
+        tags={"worker": 1, "a": 1},
+        contexts={"process": {"pid": 42}},
+    )
+    assert message == TrackerMessage(message=WorkerEvents.STARTED, tags={}, contexts={})
+    assert exception.exception.args == ("boom",)
+    assert collector.received == 3
+    assert not os.path.exists(socket_path)
+
+
+def test_forwarding_handler_drops_without_collector(socket_path):
+    forwarding = ForwardingHandler(
+        ForwardingHandler.ForwardingConfig(socket_path=socket_path)
+    )
+
+    forwarding.capture_event(TrackerEvent(event=WorkerEvents.STARTED))
+    forwarding.close()
+
+    assert forwarding.dropped == 1
+    assert forwarding.queue_stats() == QueueStats(
+        name="ForwardingHandler", depth=0, dropped=1
+    )
+
+
+def test_collector_logs_undecodable_records(socket_path, caplog):
+    collector = make_collector(socket_path)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+        sender.sendto(b"not json", socket_path)
+
+    with caplog.at_level(logging.ERROR):
+        for _ in range(500):
+            if collector.errors:
+                break
+            threading.Event().wait(0.01)
+
+    collector.close(timeout=5)
+
+    assert collector.errors == 1
+    assert caplog.records[0].message.startswith("Error decoding record from worker")
+
+
+def test_forwarding_handler_drops_oversized_records(socket_path):
+    forwarding = ForwardingHandler(
+        ForwardingHandler.ForwardingConfig(socket_path=socket_path, max_record_size=64)
+    )
+
+    forwarding.capture_event(
+        TrackerEvent(event=WorkerEvents.STARTED, tags={"payload": "x" * 64})
+    )
+    forwarding.close()
+
+    assert forwarding.oversized == 1
+    assert forwarding.dropped == 1
+
+
+def test_collector_rejects_records_larger_than_max_record_size(socket_path, caplog):
+    collector = TrackerCollector(
+        Tracker(),
+        TrackerCollector.CollectorConfig(
+            socket_path=socket_path, max_record_size=16, poll_interval=0.01
+        ),
+    )
+    collector.start()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+        sender.sendto(b"x" * 17, socket_path)
+
+    with caplog.at_level(logging.ERROR):
+        for _ in range(500):
+            if collector.errors:
+                break
+            threading.Event().wait(0.01)
+
+    collector.close(timeout=5)
+
+    assert collector.errors == 1
+    assert caplog.records[0].message == "Dropped record larger than 16 bytes"
+
+
+@pytest.mark.parametrize("mode", [0o600, 0o660])
+def test_collector_socket_mode(socket_path, mode):
+    collector = TrackerCollector(
+        Tracker(),
+        TrackerCollector.CollectorConfig(socket_path=socket_path, socket_mode=mode),
+    )
+
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == mode
+    assert os.listdir(os.path.dirname(socket_path)) == ["collector.sock"]
+    collector.close()
+
+
+def test_collector_replaces_stale_socket_and_stops_when_closed(socket_path):
+    open(socket_path, "w").close()
+    collector = TrackerCollector(
+        Tracker(), TrackerCollector.CollectorConfig(socket_path=socket_path)
+    )
+
+    collector._socket.close()
+    collector.serve_forever()
+    collector.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_workers_forward_to_collector(socket_path):
+    recorder = Recorder(expected=4)
+    handler = Mock()
+    handler.capture_event.side_effect = recorder
+    collector = make_collector(socket_path, event_handlers=[handler])
+    forwarding = ForwardingHandler(
+        ForwardingHandler.ForwardingConfig(socket_path=socket_path)
+    )
+    forwarding.set_tags({"role": "worker"})
+
+    children = []
+    for index in range(4):
+        pid = os.fork()
+
+        if pid == 0:  # pragma: no cover
+            status = 0
+            try:
+                forwarding.capture_event(
+                    TrackerEvent(event=WorkerEvents.STARTED, tags={"index": index})
+                )
+                status = forwarding.dropped
+            finally:
+                os._exit(status)
+
+        children.append(pid)
+
+    statuses = [os.waitpid(pid, 0)[1] for pid in children]
+
+    assert recorder.done.wait(5)
+    forwarding.close()
+    collector.close(timeout=5)
+
+    assert statuses == [0, 0, 0, 0]
+    assert sorted(item.tags["index"] for item in recorder.items) == [0, 1, 2, 3]
+    assert {item.tags["role"] for item in recorder.items} == {"worker"}
@@ -0,0 +1,104 @@
+import logging
+from enum import Enum
+from unittest.mock import Mock
+
+import pytest
+
+from tracker.filtering import TrackerFilter
+from tracker.plan import DispatchPlan, HandlerKind, unique_by_core
+
+
+class PlanEvents(Enum):
+    LOUD = "loud"
+    QUIET = "quiet"
+    OTHER = "other"
+
+
+def test_unique_by_core_keeps_first_handler_per_core():
+    core = object()
+    first = Mock(**{"shared_core.return_value": core})
+    second = Mock(**{"shared_core.return_value": core})
+    other = Mock()
+
+    assert unique_by_core([first, other, second, other]) == (first, other)
+
+
+def test_dispatch_plan_binds_routes():
+    exception_handler = Mock()
+    message_handler = Mock()
+    event_handler = Mock()
+
+    plan = DispatchPlan(
+        exception_handlers=[exception_handler],
+        message_handlers=[message_handler],
+        event_handlers=[event_handler],
+    )
+
+    assert plan.exception_routes == (
+        (exception_handler, exception_handler.capture_exception),
+    )
+    assert plan.message_routes == ((message_handler, message_handler.capture_message),)
+    assert plan.event_routes == ((event_handler, event_handler.capture_event),)
+    assert plan.set_targets == (event_handler, exception_handler, message_handler)
+    assert plan.handlers(HandlerKind.MESSAGE) == (message_handler,)
+
+
+def test_dispatch_plan_with_and_without_handler_return_new_plans():
+    handler = Mock()
+    plan = DispatchPlan()
+
+    added = plan.with_handler(HandlerKind.EVENT, handler)
+    removed = added.without_handler(HandlerKind.EVENT, handler)
+
+    assert plan.event_handlers == ()
+    assert added.event_routes == ((handler, handler.capture_event),)
+    assert added.set_targets == (handler,)
+    assert removed.event_handlers == ()
+    assert removed.set_targets == ()
+
+
+def test_dispatch_plan_without_unknown_handler():
+    handler = Mock()
+
+    with pytest.raises(ValueError) as error:
+        DispatchPlan().without_handler(HandlerKind.EXCEPTION, handler)
+
+    assert str(error.value) == f"{handler} is not a registered exception handler"
+
+
+def test_dispatch_plan_precomputes_filtered_routes():
+    info_handler = Mock()
+    warning_handler = Mock()
+    plan = DispatchPlan(
+        event_handlers=[info_handler, warning_handler],
+        exception_handlers=[info_handler],
+        filters=TrackerFilter(
+            min_levels={warning_handler: logging.WARNING},
+            levels={PlanEvents.LOUD: logging.WARNING},
+            deny=[PlanEvents.QUIET, KeyError],
+        ),
+    )
+
+    assert plan.event_table == {
+        PlanEvents.LOUD: (
+            (info_handler, info_handler.capture_event),
+            (warning_handler, warning_handler.capture_event),
+        ),
+        PlanEvents.QUIET: (),
+    }
+    assert set(plan.message_table) == {PlanEvents.LOUD, PlanEvents.QUIET}
+    assert plan.exception_table == {KeyError: ()}
+
+    assert plan.routes_for(HandlerKind.EVENT, PlanEvents.OTHER) == (
+        (info_handler, info_handler.capture_event),
+    )
+    assert PlanEvents.OTHER in plan.event_table
+    assert plan.with_handler(HandlerKind.EVENT, Mock()).filters is plan.filters
+
+
+def test_dispatch_plan_routes_without_filters():
+    handler = Mock()
+    plan = DispatchPlan(event_handlers=[handler])
+
+    assert plan.routes_for(HandlerKind.EVENT, PlanEvents.LOUD) is plan.event_routes
+    assert plan.event_table == {PlanEvents.LOUD: plan.event_routes}
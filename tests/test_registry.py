@@ -0,0 +1,67 @@
+from enum import Enum
+
+import pytest
+
+from tracker.registry import EnumRegistry, enum_registry, enum_value
+
+
+class RegistryEvents(Enum):
+    CREATED = "created"
+    DELETED = "deleted"
+
+
+class RegistryMessages(Enum):
+    HELLO = "hello"
+
+
+def test_registry_register_resolves_members_once():
+    registry = EnumRegistry()
+
+    assert registry.register(RegistryEvents) is RegistryEvents
+
+    entry = registry.entry(RegistryEvents.CREATED)
+    assert entry.member is RegistryEvents.CREATED
+    assert entry.value == "created"
+    assert entry.key == f"{__name__}.RegistryEvents.CREATED"
+    assert registry.entry(RegistryEvents.CREATED) is entry
+
+
+def test_registry_registers_unknown_enums_on_first_use():
+    registry = EnumRegistry()
+
+    assert registry.value(RegistryMessages.HELLO) == "hello"
+    assert registry.value(RegistryMessages.HELLO) == "hello"
+    assert registry.key(RegistryMessages.HELLO) == f"{__name__}.RegistryMessages.HELLO"
+
+
+def test_registry_resolve_by_key():
+    registry = EnumRegistry()
+    registry.register(RegistryEvents)
+
+    assert registry.resolve(f"{__name__}.RegistryEvents.DELETED") is (
+        RegistryEvents.DELETED
+    )
+
+    with pytest.raises(KeyError, match="unknown.Enum.MEMBER is not registered"):
+        registry.resolve("unknown.Enum.MEMBER")
+
+
+def test_default_registry():
+    assert enum_registry.value(RegistryEvents.DELETED) == "deleted"
+
+
+def test_enum_value():
+    assert enum_value(RegistryEvents.CREATED) == "created"
+
+
+def test_registry_resolve_never_imports_unregistered_enums():
+    registry = EnumRegistry()
+
+    with pytest.raises(KeyError):
+        registry.resolve("tracker.dispatchers.OverflowPolicy.BLOCK")
+
+    registry.key(RegistryEvents.CREATED)
+
+    assert registry.resolve(f"{__name__}.RegistryEvents.DELETED") is (
+        RegistryEvents.DELETED
+    )
@@ -0,0 +1,115 @@
+from enum import Enum
+from unittest.mock import Mock, patch
+
+from tracker.sampling import (
+    AdaptiveSampler,
+    SamplingPolicy,
+    StaticSampler,
+    TokenBucketSampler,
+)
+
+
+class SamplingEvents(Enum):
+    NOISY = "noisy"
+    QUIET = "quiet"
+
+
+def test_static_sampler_uses_rate_per_key():
+    sampler = StaticSampler({SamplingEvents.NOISY: 0.25})
+
+    with patch("tracker.sampling.random.random", side_effect=[0.1, 0.3]):
+        assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+        assert sampler.should_sample(SamplingEvents.NOISY, None) is False
+
+
+def test_static_sampler_default_rate():
+    with patch("tracker.sampling.random.random") as random_mock:
+        assert StaticSampler({}).should_sample(SamplingEvents.QUIET, None) is True
+        random_mock.assert_not_called()
+
+    assert StaticSampler({}, default_rate=0).should_sample("key", None) is False
+
+
+def test_token_bucket_sampler_limits_per_key():
+    sampler = TokenBucketSampler(rate=0, burst=2)
+
+    assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+    assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+    assert sampler.should_sample(SamplingEvents.NOISY, None) is False
+    assert sampler.should_sample(SamplingEvents.QUIET, None) is True
+
+
+def test_token_bucket_sampler_keys_by_tag_values():
+    sampler = TokenBucketSampler(rate=0, burst=1, tag_keys=["partner"])
+
+    assert sampler.should_sample(SamplingEvents.NOISY, {"partner": "a"}) is True
+    assert sampler.should_sample(SamplingEvents.NOISY, {"partner": "a"}) is False
+    assert sampler.should_sample(SamplingEvents.NOISY, {"partner": "b"}) is True
+    assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+
+
+def test_token_bucket_sampler_resolves_lazy_tags():
+    sampler = TokenBucketSampler(rate=0, burst=1, tag_keys=["partner"])
+
+    assert sampler.should_sample(SamplingEvents.NOISY, lambda: {"partner": "a"})
+    assert not sampler.should_sample(SamplingEvents.NOISY, {"partner": lambda: "a"})
+    assert sampler.should_sample(SamplingEvents.NOISY, {"partner": "b"}) is True
+
+
+def test_token_bucket_sampler_refills_over_time():
+    sampler = TokenBucketSampler(rate=10, burst=1)
+
+    with patch("tracker.sampling.time.monotonic", side_effect=[0, 0.05, 0.1]):
+        assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+        assert sampler.should_sample(SamplingEvents.NOISY, None) is False
+        assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+
+
+def test_token_bucket_sampler_evicts_least_recent_bucket():
+    sampler = TokenBucketSampler(rate=0, burst=1, max_buckets=1)
+
+    assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+    assert sampler.should_sample(SamplingEvents.QUIET, None) is True
+    assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+
+
+def test_adaptive_sampler_targets_rate():
+    sampler = AdaptiveSampler(target_per_second=2, window=1)
+    times = [0, 0.1, 0.2, 0.3, 1.0, 1.1, 2.1]
+
+    with (
+        patch("tracker.sampling.time.monotonic", side_effect=times),
+        patch("tracker.sampling.random.random", side_effect=[0.4, 0.6]),
+    ):
+        for _ in range(4):
+            assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+
+        assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+        assert sampler.should_sample(SamplingEvents.NOISY, None) is False
+        assert sampler.should_sample(SamplingEvents.NOISY, None) is True
+
+
+def test_adaptive_sampler_resets_rate_after_idle_window():
+    sampler = AdaptiveSampler(target_per_second=1, window=1)
+    sampler.should_sample("key", None)
+    sampler._windows["key"].seen = 0
+    sampler._windows["key"].started_at -= 1
+
+    assert sampler.should_sample("key", None) is True
+    assert sampler._windows["key"].rate == 1.0
+
+
+def test_sampling_policy_counts_sampled_out():
+    accept = Mock()
+    accept.should_sample.return_value = True
+    reject = Mock()
+    reject.should_sample.side_effect = [True, False, False]
+
+    policy = SamplingPolicy([accept, reject])
+
+    assert policy.should_sample(SamplingEvents.NOISY, None) is True
+    assert policy.should_sample(SamplingEvents.NOISY, None) is False
+    assert policy.should_sample(SamplingEvents.QUIET, {"a": 1}) is False
+
+    assert policy.sampled_out == {SamplingEvents.NOISY: 1, SamplingEvents.QUIET: 1}
+    reject.should_sample.assert_called_with(SamplingEvents.QUIET, {"a": 1})
@@ -0,0 +1,63 @@
+from tracker.scopes import EMPTY_SCOPE, MAX_SCOPE_DEPTH, Scope
+
+
+def test_scope_push_does_not_change_parent():
+    parent = EMPTY_SCOPE.push({"a": 1})
+    child = parent.push({"b": 2})
+
+    assert parent.flatten() == {"a": 1}
+    assert child.flatten() == {"a": 1, "b": 2}
+    assert child.parent is parent
+    assert EMPTY_SCOPE.flatten() == {}
+
+
+def test_scope_push_copies_values():
+    values = {"a": 1}
+    scope = EMPTY_SCOPE.push(values)
+    values["a"] = 2
+
+    assert scope.flatten() == {"a": 1}
+
+
+def test_scope_child_overrides_parent():
+    scope = EMPTY_SCOPE.push({"a": 1, "b": 1}).push({"a": 2})
+
+    assert scope.flatten() == {"a": 2, "b": 1}
+
+
+def test_scope_flatten_is_cached():
+    scope = EMPTY_SCOPE.push({"a": 1})
+
+    assert scope.flatten() is scope.flatten()
+
+
+def test_scope_merged_without_values_shares_flatten():
+    scope = EMPTY_SCOPE.push({"a": 1})
+
+    assert scope.merged(None) is scope.flatten()
+    assert scope.merged({}) is scope.flatten()
+
+
+def test_scope_merged_with_values_returns_new_mapping():
+    scope = EMPTY_SCOPE.push({"a": 1})
+
+    merged = scope.merged({"b": 2})
+
+    assert merged == {"a": 1, "b": 2}
+    assert scope.flatten() == {"a": 1}
+
+
+def test_scope_squashes_deep_chains():
+    scope = EMPTY_SCOPE
+
+    for index in range(MAX_SCOPE_DEPTH + 1):
+        scope = scope.push({f"key{index}": index})
+
+    assert scope.depth == 0
+    assert scope.parent is None
+    assert scope.flatten() == {f"key{i}": i for i in range(MAX_SCOPE_DEPTH + 1)}
+
+
+def test_scope_depth():
+    assert Scope().depth == 0
+    assert Scope().push({}).push({}).depth == 2
@@ -0,0 +1,159 @@
+from enum import Enum
+
+import pytest
+
+from tracker.dtos import (
+    FrozenTrackerEvent,
+    TrackerEvent,
+    TrackerException,
+    TrackerMessage,
+)
+from tracker.lazy import LazyContext
+from tracker.serialization import (
+    RemoteException,
+    deserialize,
+    from_dict,
+    kind_of,
+    register_exception,
+    serialize,
+    to_dict,
+)
+
+
+class SerializedEvents(Enum):
+    CREATED = "created"
+
+
+@register_exception
+class CustomError(Exception):
+    def __init__(self, code, detail):
+        super().__init__(code, detail)
+
+
+class UnregisteredError(Exception):
+    pass
+
+
+def raise_value_error():
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        return e
+
+
+def test_event_round_trip():
+    event = TrackerEvent(
+        event=SerializedEvents.CREATED,
+        tags={"a": 1},
+        contexts={"ctx": {"k": "v"}},
+    )
+
+    assert deserialize(serialize(event)) == event
+
+
+def test_frozen_and_message_round_trip():
+    assert deserialize(
+        serialize(FrozenTrackerEvent(event=SerializedEvents.CREATED))
+    ) == TrackerEvent(event=SerializedEvents.CREATED)
+    assert deserialize(
+        serialize(TrackerMessage(message=SerializedEvents.CREATED, tags={"a": "b"}))
+    ) == TrackerMessage(message=SerializedEvents.CREATED, tags={"a": "b"})
+
+
+def test_to_dict_omits_missing_tags_and_contexts():
+    assert to_dict(TrackerMessage(message=SerializedEvents.CREATED)) == {
+        "kind": "message",
+        "message": f"{__name__}.SerializedEvents.CREATED",
+    }
+
+
+def test_to_dict_resolves_lazy_tags_and_contexts():
+    item = TrackerEvent(
+        event=SerializedEvents.CREATED,
+        tags=lambda: {"tag": "value"},
+        contexts={"order": LazyContext(lambda: {"id": 1})},
+    )
+
+    assert to_dict(item)["tags"] == {"tag": "value"}
+    assert to_dict(item)["contexts"] == {"order": {"id": 1}}
+
+
+def test_exception_round_trip_rebuilds_type_and_keeps_traceback():
+    exception = raise_value_error()
+
+    restored = deserialize(
+        serialize(TrackerException(exception=exception, tags={"a": 1}))
+    )
+
+    assert type(restored.exception) is ValueError
+    assert restored.exception.args == ("boom",)
+    assert "raise_value_error" in restored.exception.__notes__[0]
+    assert restored.tags == {"a": 1}
+
+
+def test_exception_with_non_json_args():
+    exception = CustomError(1, object())
+
+    restored = deserialize(serialize(TrackerException(exception=exception)))
+
+    assert type(restored.exception) is CustomError
+    assert restored.exception.args[0] == 1
+    assert isinstance(restored.exception.args[1], str)
+
+
+def test_exception_that_cannot_be_rebuilt():
+    record = {
+        "kind": "exception",
+        "exception": {
+            "type": "missing.module.Error",
+            "args": ["boom"],
+            "traceback": "",
+        },
+    }
+
+    exception = from_dict(record).exception
+
+    assert isinstance(exception, RemoteException)
+    assert str(exception) == "missing.module.Error: boom"
+
+
+def test_exception_type_that_is_not_registered():
+    restored = deserialize(
+        serialize(TrackerException(exception=UnregisteredError("boom")))
+    )
+
+    assert isinstance(restored.exception, RemoteException)
+    assert str(restored.exception) == f"{__name__}.UnregisteredError: boom"
+
+
+def test_exception_whose_constructor_rejects_stored_args():
+    record = {
+        "kind": "exception",
+        "exception": {
+            "type": f"{__name__}.CustomError",
+            "args": ["only code"],
+            "traceback": "",
+        },
+    }
+
+    exception = from_dict(record).exception
+
+    assert isinstance(exception, RemoteException)
+    assert str(exception) == f"{__name__}.CustomError: only code"
+
+
+def test_exception_type_that_is_not_an_exception():
+    record = {
+        "kind": "exception",
+        "exception": {"type": "builtins.dict", "args": [1, 2], "traceback": ""},
+    }
+
+    assert str(from_dict(record).exception) == "builtins.dict: [1, 2]"
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        from_dict({"kind": "metric"})
+
+    with pytest.raises(KeyError):
+        kind_of(object())
@@ -0,0 +1,169 @@
+import logging
+import sys
+
+import pytest
+
+from tracker.tracebacks import TracebackCache, fingerprint
+
+formatter = logging.Formatter()
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def recurse(depth):
+    if depth == 0:
+        fail("deep")
+
+    recurse(depth - 1)
+
+
+def caught(function, *args):
+    try:
+        function(*args)
+    except BaseException:
+        return sys.exc_info()
+
+
+def chained_cause():
+    try:
+        fail("inner")
+    except ValueError as e:
+        raise KeyError("outer") from e
+
+
+def chained_context():
+    try:
+        fail("inner")
+    except ValueError:
+        raise KeyError("outer")
+
+
+def suppressed_context():
+    try:
+        fail("inner")
+    except ValueError:
+        raise KeyError("outer") from None
+
+
+def grouped():
+    raise ExceptionGroup("many", [ValueError("a"), KeyError("b")])  # noqa: F821
+
+
+def cause_without_traceback():
+    raise KeyError("outer") from ValueError("never raised")
+
+
+@pytest.mark.parametrize(
+    "function, args",
+    [
+        (fail, ("boom",)),
+        (recurse, (3,)),
+        (chained_cause, ()),
+        (chained_context, ()),
+        (suppressed_context, ()),
+        (cause_without_traceback, ()),
+    ],
+)
+def test_traceback_cache_matches_logging_formatter(function, args):
+    cache = TracebackCache(TracebackCache.TracebackConfig())
+    exc_info = caught(function, *args)
+
+    assert cache.format(exc_info) == formatter.formatException(exc_info)
+    assert cache.format(exc_info) == formatter.formatException(exc_info)
+    assert cache.hits >= 1
+
+
+def test_traceback_cache_reuses_stack_and_renders_message():
+    cache = TracebackCache(TracebackCache.TracebackConfig())
+
+    first = cache.format(caught(fail, "first"))
+    second = cache.format(caught(fail, "second"))
+
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert first.splitlines()[:-1] == second.splitlines()[:-1]
+    assert second.endswith("ValueError: second")
+
+
+def test_traceback_cache_keys_on_code_location():
+    cache = TracebackCache(TracebackCache.TracebackConfig())
+
+    cache.format(caught(fail, "a"))
+    cache.format(caught(recurse, 0))
+    cache.format(caught(recurse, 1))
+
+    assert (cache.misses, cache.hits) == (3, 0)
+
+
+def test_traceback_cache_handles_cycles():
+    first, second = ValueError("first"), ValueError("second")
+    first.__context__ = second
+    second.__context__ = first
+
+    exc_info = (ValueError, first, None)
+    assert TracebackCache(TracebackCache.TracebackConfig()).format(
+        exc_info
+    ) == formatter.formatException(exc_info)
+
+
+def test_traceback_cache_without_exception():
+    exc_info = (None, None, None)
+
+    assert TracebackCache(TracebackCache.TracebackConfig()).format(
+        exc_info
+    ) == formatter.formatException(exc_info)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="exception groups")
+def test_traceback_cache_renders_exception_groups_uncached():
+    cache = TracebackCache(TracebackCache.TracebackConfig())
+    exc_info = caught(grouped)
+
+    assert cache.format(exc_info) == formatter.formatException(exc_info)
+    assert cache.misses == 0
+
+
+def test_traceback_cache_evicts_least_recently_used():
+    cache = TracebackCache(TracebackCache.TracebackConfig(max_size=2))
+    failures = [caught(fail, "a"), caught(recurse, 0), caught(recurse, 1)]
+    keys = [fingerprint(tb) for _, _, tb in failures]
+
+    cache.format(failures[0])
+    cache.format(failures[1])
+    cache.format(failures[0])
+    cache.format(failures[2])
+
+    assert list(cache._stacks) == [keys[0], keys[2]]
+
+
+def test_traceback_cache_compact_frames():
+    cache = TracebackCache(TracebackCache.TracebackConfig(compact_frames=2))
+    exc_info = caught(recurse, 10)
+
+    lines = cache.format(exc_info).splitlines()
+    full = formatter.formatException(exc_info).splitlines()
+
+    assert "  ... 9 frames omitted ..." in lines
+    assert lines[:5] == full[:5]
+    assert lines[-5:] == full[-5:]
+    assert len(lines) < len(full)
+
+
+def test_traceback_cache_compact_frames_keeps_short_stacks():
+    exc_info = caught(fail, "boom")
+
+    assert TracebackCache(TracebackCache.TracebackConfig(compact_frames=2)).format(
+        exc_info
+    ) == formatter.formatException(exc_info)
+
+
+def test_traceback_cache_filter_sets_exc_text():
+    cache = TracebackCache(TracebackCache.TracebackConfig())
+    exc_info = caught(fail, "boom")
+    record = logging.LogRecord("name", logging.ERROR, __file__, 1, "msg", (), exc_info)
+    plain = logging.LogRecord("name", logging.INFO, __file__, 1, "msg", (), None)
+
+    assert cache.filter(record) and cache.filter(plain)
+    assert record.exc_text == formatter.formatException(exc_info)
+    assert plain.exc_text is None
@@ -0,0 +1,189 @@
+import logging
+import time
+from contextvars import ContextVar
+from enum import Enum
+from unittest.mock import Mock
+
+from tracker.dtos import TrackerEvent
+from tracker.interfaces import (
+    ITrackerHandlerEventBatch,
+    ITrackerHandlerExceptionBatch,
+    ITrackerHandlerMessageBatch,
+)
+from tracker.wrappers import BatchingHandler
+from tracker.wrappers.batching import _EVENT
+
+_request_id = ContextVar("request_id", default=None)
+
+
+class BatchEvents(Enum):
+    HIGH_VOLUME = "high_volume"
+
+
+class BatchHandler(
+    ITrackerHandlerEventBatch,
+    ITrackerHandlerMessageBatch,
+    ITrackerHandlerExceptionBatch,
+):
+    def __init__(self):
+        self.events = []
+        self.messages = []
+        self.exceptions = []
+
+    def capture_events_batch(self, tracker_events):
+        self.events.append(tracker_events)
+
+    def capture_messages_batch(self, tracker_messages):
+        self.messages.append(tracker_messages)
+
+    def capture_exceptions_batch(self, tracker_exceptions):
+        self.exceptions.append(tracker_exceptions)
+
+
+def make_handler(handler, **kwargs):
+    return BatchingHandler(handler, BatchingHandler.BatchingConfig(**kwargs))
+
+
+def make_events(count):
+    return [
+        TrackerEvent(event=BatchEvents.HIGH_VOLUME, tags={"i": i}) for i in range(count)
+    ]
+
+
+def test_batching_handler_flushes_when_size_is_reached():
+    inner = BatchHandler()
+    handler = make_handler(inner, max_batch_size=3, max_batch_age=None)
+    events = make_events(4)
+
+    for event in events:
+        handler.capture_event(event)
+
+    assert inner.events == [events[:3]]
+    assert handler.pending == 1
+
+    handler.close()
+
+    assert inner.events == [events[:3], events[3:]]
+    assert handler.pending == 0
+
+
+def test_batching_handler_flushes_each_kind_to_its_hook(
+    tracker_message, tracker_exception
+):
+    inner = BatchHandler()
+    handler = make_handler(inner, max_batch_size=10, max_batch_age=None)
+
+    handler.capture_message(tracker_message)
+    handler.capture_exception(tracker_exception)
+    handler.flush()
+
+    assert inner.messages == [[tracker_message]]
+    assert inner.exceptions == [[tracker_exception]]
+    assert inner.events == []
+
+
+def test_batching_handler_flushes_when_age_is_reached():
+    inner = BatchHandler()
+    handler = make_handler(inner, max_batch_size=100, max_batch_age=0.01)
+    events = make_events(1)
+
+    handler.capture_event(events[0])
+
+    deadline = time.monotonic() + 5
+    while not inner.events and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert inner.events == [events]
+    handler.close()
+    handler.close()
+
+
+def test_batching_handler_flushes_expired_batch_on_capture():
+    inner = BatchHandler()
+    handler = make_handler(inner, max_batch_size=100, max_batch_age=60)
+    events = make_events(2)
+
+    handler.capture_event(events[0])
+    handler._started_at[_EVENT] -= 60
+    handler.capture_event(events[1])
+
+    assert inner.events == [events]
+    handler.close()
+
+
+def test_batching_handler_falls_back_to_single_captures():
+    inner = Mock(spec=["capture_event", "set_tags", "set_contexts"])
+    handler = make_handler(inner, max_batch_size=2, max_batch_age=None)
+    seen = []
+    inner.capture_event.side_effect = lambda event: seen.append(_request_id.get())
+    events = make_events(2)
+
+    _request_id.set("first")
+    handler.capture_event(events[0])
+    _request_id.set("second")
+    handler.capture_event(events[1])
+
+    assert [call.args[0] for call in inner.capture_event.call_args_list] == events
+    assert seen == ["first", "second"]
+
+
+def test_batching_handler_logs_single_capture_errors(caplog):
+    inner = Mock(spec=["capture_event"])
+    inner.capture_event.side_effect = [Exception("Handler Error"), None]
+    handler = make_handler(inner, max_batch_size=2, max_batch_age=None)
+
+    with caplog.at_level(logging.ERROR):
+        for event in make_events(2):
+            handler.capture_event(event)
+
+    assert inner.capture_event.call_count == 2
+    assert (
+        caplog.records[0].message
+        == f"Error flushing event for handler {inner}: Handler Error"
+    )
+
+
+def test_batching_handler_logs_batch_errors(caplog):
+    inner = Mock(spec=BatchHandler)
+    inner.capture_events_batch.side_effect = Exception("Batch Error")
+    handler = make_handler(inner, max_batch_size=1, max_batch_age=None)
+
+    with caplog.at_level(logging.ERROR):
+        handler.capture_event(make_events(1)[0])
+
+    assert (
+        caplog.records[0].message
+        == f"Error flushing event batch for handler {inner}: Batch Error"
+    )
+
+
+def test_batching_handler_forwards_tags_and_contexts():
+    inner = Mock()
+    handler = make_handler(inner, max_batch_age=None)
+
+    handler.set_tags({"key": "value"})
+    handler.set_contexts({"context": {"detail": "info"}})
+
+    inner.set_tags.assert_called_once_with({"key": "value"})
+    inner.set_contexts.assert_called_once_with({"context": {"detail": "info"}})
+
+
+def test_batching_handler_forwards_scope():
+    inner = Mock()
+    handler = make_handler(inner, max_batch_age=None)
+
+    assert handler.scope() is inner.scope.return_value
+    assert handler.shared_core() is inner.shared_core.return_value
+
+
+def test_batching_handler_restarts_flusher_after_fork():
+    handler = BatchingHandler(Mock(), BatchingHandler.BatchingConfig(max_batch_age=60))
+    flusher = handler._flusher
+
+    handler._restart()
+    assert handler._flusher is not flusher
+    assert handler._flusher.is_alive()
+
+    handler.close()
+    handler._restart()
+    assert handler._flusher is None or not handler._flusher.is_alive()
@@ -0,0 +1,299 @@
+import logging
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tracker.core import Tracker
+from tracker.dtos import TrackerEvent, TrackerException, TrackerMessage
+from tracker.metrics import CircuitStats
+from tracker.wrappers import CircuitBreakerHandler, CircuitState
+
+
+def make_handler(inner, **kwargs):
+    return CircuitBreakerHandler(
+        inner, CircuitBreakerHandler.CircuitBreakerConfig(**kwargs)
+    )
+
+
+def failing_inner():
+    inner = Mock()
+    inner.capture_exception.side_effect = Exception("Transport Error")
+    return inner
+
+
+def capture(handler):
+    try:
+        handler.capture_exception(TrackerException(exception=ValueError()))
+    except Exception:
+        pass
+
+
+def test_circuit_breaker_forwards_every_kind():
+    inner = Mock()
+    handler = make_handler(inner)
+    event = TrackerEvent(event=Mock())
+    message = TrackerMessage(message=Mock())
+    exception = TrackerException(exception=ValueError())
+
+    handler.capture_event(event)
+    handler.capture_message(message)
+    handler.capture_exception(exception)
+
+    inner.capture_event.assert_called_once_with(event)
+    inner.capture_message.assert_called_once_with(message)
+    inner.capture_exception.assert_called_once_with(exception)
+    assert handler.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_opens_after_failures_and_short_circuits(caplog):
+    inner = failing_inner()
+    handler = make_handler(inner, failure_threshold=3, window=10)
+
+    with patch("tracker.wrappers.circuit_breaker.time.monotonic", return_value=0):
+        with caplog.at_level(logging.WARNING):
+            for _ in range(5):
+                capture(handler)
+
+    assert inner.capture_exception.call_count == 3
+    assert handler.state is CircuitState.OPEN
+    assert handler.short_circuited == 2
+    assert caplog.records[0].message == f"Circuit opened for handler {inner}"
+
+
+def test_circuit_breaker_forgets_failures_outside_window():
+    inner = failing_inner()
+    handler = make_handler(inner, failure_threshold=2, window=10)
+
+    with patch("tracker.wrappers.circuit_breaker.time.monotonic") as monotonic:
+        monotonic.return_value = 0
+        capture(handler)
+        monotonic.return_value = 11
+        capture(handler)
+
+    assert handler.state is CircuitState.CLOSED
+    assert handler.circuit_stats().failures == 1
+
+
+def test_circuit_breaker_counts_slow_calls_as_failures():
+    inner = Mock()
+    handler = make_handler(inner, failure_threshold=1, slow_call_threshold=1.0)
+
+    with patch(
+        "tracker.wrappers.circuit_breaker.time.monotonic", side_effect=[0, 2, 2]
+    ):
+        handler.capture_exception(TrackerException(exception=ValueError()))
+
+    assert handler.state is CircuitState.OPEN
+
+
+def test_circuit_breaker_half_open_probe_closes_on_success(caplog):
+    inner = failing_inner()
+    handler = make_handler(inner, failure_threshold=1, reset_timeout=30)
+
+    with patch("tracker.wrappers.circuit_breaker.time.monotonic") as monotonic:
+        monotonic.return_value = 0
+        capture(handler)
+        assert handler.state is CircuitState.OPEN
+
+        monotonic.return_value = 31
+        inner.capture_exception.side_effect = None
+
+        with caplog.at_level(logging.WARNING):
+            capture(handler)
+
+    assert handler.state is CircuitState.CLOSED
+    assert inner.capture_exception.call_count == 2
+    assert caplog.records[-1].message == f"Circuit closed for handler {inner}"
+
+
+def test_circuit_breaker_half_open_probe_reopens_on_failure():
+    inner = failing_inner()
+    handler = make_handler(inner, failure_threshold=1, reset_timeout=30)
+
+    with patch("tracker.wrappers.circuit_breaker.time.monotonic") as monotonic:
+        monotonic.return_value = 0
+        capture(handler)
+        monotonic.return_value = 31
+        capture(handler)
+        capture(handler)
+
+    assert handler.state is CircuitState.OPEN
+    assert inner.capture_exception.call_count == 2
+    assert handler.short_circuited == 1
+
+
+def test_circuit_breaker_limits_half_open_probes():
+    release = threading.Event()
+    probing = threading.Event()
+    inner = Mock()
+    handler = make_handler(inner, failure_threshold=1, reset_timeout=0)
+
+    inner.capture_exception.side_effect = Exception("Transport Error")
+    capture(handler)
+    assert handler.state is CircuitState.OPEN
+
+    def slow_probe(item):
+        probing.set()
+        release.wait(5)
+
+    inner.capture_exception.side_effect = slow_probe
+    probe = threading.Thread(target=capture, args=(handler,))
+    probe.start()
+    probing.wait(5)
+
+    capture(handler)
+    release.set()
+    probe.join()
+
+    assert inner.capture_exception.call_count == 2
+    assert handler.short_circuited == 1
+    assert handler.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_call_timeout():
+    release = threading.Event()
+    inner = Mock()
+    inner.capture_message.side_effect = lambda item: release.wait(5)
+    handler = make_handler(inner, failure_threshold=1, call_timeout=0.01)
+
+    with pytest.raises(TimeoutError) as error:
+        handler.capture_message(TrackerMessage(message=Mock()))
+
+    release.set()
+    handler.close()
+
+    assert str(error.value) == "Timed out after 0.01s"
+    assert handler.state is CircuitState.OPEN
+
+
+def test_circuit_breaker_cancels_queued_calls_on_timeout():
+    release = threading.Event()
+    calls = []
+    inner = Mock()
+    inner.capture_message.side_effect = lambda item: (
+        calls.append(item),
+        release.wait(5),
+    )
+    handler = make_handler(
+        inner, failure_threshold=10, call_timeout=0.05, timeout_workers=1
+    )
+
+    for _ in range(4):
+        with pytest.raises(TimeoutError):
+            handler.capture_message(TrackerMessage(message=Mock()))
+
+    release.set()
+    handler._executor.shutdown(wait=True)
+
+    assert len(calls) == 1
+
+
+def test_circuit_breaker_bounds_pending_calls():
+    release = threading.Event()
+    inner = Mock()
+    inner.capture_message.side_effect = lambda item: release.wait(5)
+    handler = make_handler(
+        inner,
+        failure_threshold=10,
+        call_timeout=0.01,
+        timeout_workers=1,
+        max_pending_calls=1,
+    )
+
+    with pytest.raises(TimeoutError):
+        handler.capture_message(TrackerMessage(message=Mock()))
+
+    with pytest.raises(RuntimeError) as error:
+        handler.capture_message(TrackerMessage(message=Mock()))
+
+    release.set()
+    handler._executor.shutdown(wait=True)
+
+    assert str(error.value) == "1 calls already pending"
+    assert inner.capture_message.call_count == 1
+    assert handler.circuit_stats().failures == 2
+
+
+def test_circuit_breaker_call_timeout_completes_in_time():
+    inner = Mock()
+    handler = make_handler(inner, call_timeout=5)
+
+    handler.capture_event(TrackerEvent(event=Mock()))
+    handler.close()
+
+    assert handler.state is CircuitState.CLOSED
+    inner.capture_event.assert_called_once()
+
+
+def test_circuit_breaker_close_without_executor():
+    make_handler(Mock()).close()
+
+
+def test_circuit_breaker_forwards_tags_contexts_scope_and_core():
+    inner = Mock()
+    handler = make_handler(inner)
+
+    handler.set_tags({"key": "value"})
+    handler.set_contexts({"context": {"detail": "info"}})
+
+    inner.set_tags.assert_called_once_with({"key": "value"})
+    inner.set_contexts.assert_called_once_with({"context": {"detail": "info"}})
+    assert handler.scope() is inner.scope.return_value
+    assert handler.shared_core() is inner.shared_core.return_value
+
+
+def test_circuit_breaker_reports_state_through_tracker(caplog):
+    inner = failing_inner()
+    handler = make_handler(inner, failure_threshold=1)
+    tracker = Tracker(exception_handlers=[handler])
+
+    with caplog.at_level(logging.ERROR):
+        tracker.emit_exception(TrackerException(exception=ValueError()))
+        tracker.emit_exception(TrackerException(exception=ValueError()))
+
+    assert tracker.stats().circuits == [
+        CircuitStats(name="Mock", state="open", failures=0, short_circuited=1)
+    ]
+    assert [record.message for record in caplog.records] == [
+        f"Error emitting exception for handler {handler}: Transport Error"
+    ]
+
+
+def test_circuit_breaker_releases_pending_slot_when_submit_fails():
+    handler = make_handler(Mock(), call_timeout=5, max_pending_calls=1)
+    handler._executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        handler.capture_event(TrackerEvent(event=Mock()))
+
+    assert handler._pending.acquire(blocking=False)
+
+
+def test_circuit_breaker_reports_configured_name():
+    handler = make_handler(Mock(), name="payments-sentry")
+
+    assert handler.circuit_stats().name == "payments-sentry"
+
+
+def test_circuit_breaker_restarts_after_fork():
+    handler = make_handler(Mock(), call_timeout=5)
+    executor, lock = handler._executor, handler._lock
+    lock.acquire()
+
+    handler._restart()
+
+    assert handler._executor is not executor
+    assert handler._lock is not lock
+    assert handler.circuit_stats().state == "closed"
+    executor.shutdown()
+    handler.close()
+
+
+def test_circuit_breaker_restarts_without_executor_after_fork():
+    handler = make_handler(Mock())
+
+    handler._restart()
+
+    assert handler._executor is None
+    handler.capture_event(TrackerEvent(event=Mock()))
@@ -0,0 +1,231 @@
+import logging
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tracker.dtos import TrackerException
+from tracker.wrappers import (
+    DeduplicatingExceptionHandler,
+    exception_fingerprint,
+)
+
+
+def raise_value_error(message="boom"):
+    try:
+        raise ValueError(message)
+    except ValueError as e:
+        return e
+
+
+def raise_key_error():
+    try:
+        raise KeyError("missing")
+    except KeyError as e:
+        return e
+
+
+def make_handler(inner, **kwargs):
+    return DeduplicatingExceptionHandler(
+        inner, DeduplicatingExceptionHandler.DeduplicationConfig(**kwargs)
+    )
+
+
+def forwarded(inner):
+    return [call.args[0] for call in inner.capture_exception.call_args_list]
+
+
+def test_exception_fingerprint_ignores_message():
+    first = exception_fingerprint(raise_value_error("first"))
+    second = exception_fingerprint(raise_value_error("second"))
+
+    assert first == second
+    assert first != exception_fingerprint(raise_key_error())
+    assert first[:2] == ("builtins", "ValueError")
+    assert first[2][0][1] == "raise_value_error"
+
+
+def test_exception_fingerprint_without_traceback():
+    assert exception_fingerprint(ValueError()) == ("builtins", "ValueError", ())
+
+
+def test_dedup_forwards_first_occurrence_and_suppresses_repeats():
+    inner = Mock()
+    handler = make_handler(inner, window=60)
+    first = TrackerException(exception=raise_value_error())
+
+    handler.capture_exception(first)
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+
+    assert forwarded(inner) == [first]
+
+
+def test_dedup_forwards_distinct_fingerprints():
+    inner = Mock()
+    handler = make_handler(inner)
+    value_error = TrackerException(exception=raise_value_error())
+    key_error = TrackerException(exception=raise_key_error())
+
+    handler.capture_exception(value_error)
+    handler.capture_exception(key_error)
+
+    assert forwarded(inner) == [value_error, key_error]
+
+
+@pytest.mark.parametrize(
+    "contexts",
+    [{"context": {"key": "value"}}, lambda: {"context": {"key": "value"}}],
+    ids=["mapping", "lazy"],
+)
+def test_dedup_forwards_aggregate_after_window(contexts):
+    inner = Mock()
+    handler = make_handler(inner, window=10)
+    fingerprint = exception_fingerprint(raise_value_error())
+    last = TrackerException(
+        exception=raise_value_error(), tags={"tag": "value"}, contexts=contexts
+    )
+
+    with patch("tracker.wrappers.dedup.time.monotonic", side_effect=[0, 5, 11]):
+        handler.capture_exception(TrackerException(exception=raise_value_error()))
+        handler.capture_exception(TrackerException(exception=raise_value_error()))
+        handler.capture_exception(last)
+
+    aggregated = forwarded(inner)[1]
+    assert aggregated.exception is last.exception
+    assert aggregated.tags == {"tag": "value"}
+    assert aggregated.contexts == {
+        "context": {"key": "value"},
+        "deduplication": {
+            "fingerprint": handler._digest(fingerprint),
+            "occurrences": 2,
+            "window_seconds": 10,
+        },
+    }
+
+
+def test_dedup_forwards_as_is_after_quiet_window():
+    inner = Mock()
+    handler = make_handler(inner, window=10)
+    second = TrackerException(exception=raise_value_error())
+
+    with patch("tracker.wrappers.dedup.time.monotonic", side_effect=[0, 11]):
+        handler.capture_exception(TrackerException(exception=raise_value_error()))
+        handler.capture_exception(second)
+
+    assert forwarded(inner)[1] is second
+
+
+def test_dedup_flush_forwards_pending_aggregates():
+    inner = Mock()
+    handler = make_handler(inner)
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+    handler.capture_exception(TrackerException(exception=raise_key_error()))
+
+    handler.flush()
+    handler.flush()
+
+    assert len(forwarded(inner)) == 3
+    assert forwarded(inner)[2].contexts["deduplication"]["occurrences"] == 1
+
+
+def test_dedup_reports_burst_that_stops_in_background():
+    reported = threading.Event()
+    inner = Mock()
+    inner.capture_exception.side_effect = lambda item: (
+        reported.set() if "deduplication" in (item.contexts or {}) else None
+    )
+    handler = make_handler(inner, window=0.05)
+
+    for _ in range(3):
+        handler.capture_exception(TrackerException(exception=raise_value_error()))
+
+    assert reported.wait(5)
+    handler.close()
+
+    assert len(forwarded(inner)) == 2
+    assert forwarded(inner)[1].contexts["deduplication"]["occurrences"] == 2
+
+
+def test_dedup_close_forwards_pending_aggregates():
+    inner = Mock()
+    handler = make_handler(inner, flush_in_background=False)
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+
+    handler.close()
+    handler.close()
+
+    assert len(forwarded(inner)) == 2
+    assert forwarded(inner)[1].contexts["deduplication"]["occurrences"] == 1
+
+
+def test_dedup_logs_handler_errors_when_flushing(caplog):
+    inner = Mock()
+    handler = make_handler(inner, flush_in_background=False)
+
+    for _ in range(2):
+        handler.capture_exception(TrackerException(exception=raise_value_error()))
+        handler.capture_exception(TrackerException(exception=raise_key_error()))
+
+    # The ValueError burst has outlived its window; the KeyError one hasn't.
+    handler._entries[exception_fingerprint(raise_value_error())].window_started_at -= 60
+    inner.capture_exception.side_effect = Exception("Unavailable")
+
+    with caplog.at_level(logging.ERROR):
+        handler._flush_expired()
+        handler.close()
+
+    assert inner.capture_exception.call_count == 4
+    assert [record.message for record in caplog.records] == [
+        f"Error flushing aggregate for handler {inner}: Unavailable"
+    ] * 2
+
+
+def test_dedup_restarts_after_fork():
+    inner = Mock()
+    handler = make_handler(inner, window=60)
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+    flusher, lock = handler._flusher, handler._lock
+    lock.acquire()
+
+    handler._restart()
+    assert handler._flusher is not flusher
+    assert handler._flusher.is_alive()
+    assert handler._lock is not lock
+    # Counts suppressed before the fork belong to the parent.
+    handler.flush()
+    assert len(forwarded(inner)) == 1
+
+    handler.close()
+    handler._restart()
+    assert not handler._flusher.is_alive()
+
+
+def test_dedup_evicts_least_recent_fingerprint_with_aggregate():
+    inner = Mock()
+    handler = make_handler(inner, max_fingerprints=1)
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+    handler.capture_exception(TrackerException(exception=raise_value_error()))
+    key_error = TrackerException(exception=raise_key_error())
+
+    handler.capture_exception(key_error)
+
+    assert forwarded(inner)[1] is key_error
+    assert forwarded(inner)[2].contexts["deduplication"]["occurrences"] == 1
+    assert len(handler._entries) == 1
+
+
+def test_dedup_forwards_tags_contexts_and_scope():
+    inner = Mock()
+    handler = make_handler(inner)
+
+    handler.set_tags({"key": "value"})
+    handler.set_contexts({"context": {"detail": "info"}})
+
+    inner.set_tags.assert_called_once_with({"key": "value"})
+    inner.set_contexts.assert_called_once_with({"context": {"detail": "info"}})
+    assert handler.scope() is inner.scope.return_value
+    assert handler.shared_core() is inner.shared_core.return_value
@@ -0,0 +1,418 @@
+import logging
+import os
+import threading
+from enum import Enum
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tracker.dtos import TrackerEvent, TrackerException, TrackerMessage
+from tracker.metrics import QueueStats
+from tracker.registry import enum_registry
+from tracker.wrappers import FsyncPolicy, SpoolingHandler
+
+
+class SpoolEvents(Enum):
+    CREATED = "created"
+
+
+def make_handler(inner, directory, **kwargs):
+    kwargs.setdefault("replay_in_background", False)
+    return SpoolingHandler(
+        inner, SpoolingHandler.SpoolConfig(directory=str(directory), **kwargs)
+    )
+
+
+def event(index=0):
+    return TrackerEvent(event=SpoolEvents.CREATED, tags={"index": index})
+
+
+def segments(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".seg"))
+
+
+def test_spool_replays_every_kind_in_order(tmp_path):
+    inner = Mock()
+    handler = make_handler(inner, tmp_path)
+    message = TrackerMessage(message=SpoolEvents.CREATED)
+    exception = TrackerException(exception=ValueError("boom"))
+
+    handler.capture_event(event())
+    handler.capture_message(message)
+    handler.capture_exception(exception)
+
+    assert inner.capture_event.call_count == 0
+    assert handler.flush() == 3
+    handler.close()
+
+    inner.capture_event.assert_called_once_with(event())
+    inner.capture_message.assert_called_once_with(message)
+    assert inner.capture_exception.call_args.args[0].exception.args == ("boom",)
+    assert handler.spooled_bytes == 0
+
+
+def test_spool_keeps_records_until_handler_recovers(tmp_path, caplog):
+    inner = Mock()
+    inner.capture_event.side_effect = [None, Exception("Unavailable"), None, None]
+    handler = make_handler(inner, tmp_path)
+
+    for index in range(3):
+        handler.capture_event(event(index))
+
+    with caplog.at_level(logging.ERROR):
+        assert handler.replay() == 1
+
+    assert handler.spooled_bytes > 0
+    assert handler.replay() == 2
+    handler.close()
+
+    assert [
+        call.args[0].tags["index"] for call in inner.capture_event.call_args_list
+    ] == [
+        0,
+        1,
+        1,
+        2,
+    ]
+    assert caplog.records[0].message == (
+        f"Error replaying spooled event for handler {inner}: Unavailable"
+    )
+
+
+def test_spool_survives_restart(tmp_path):
+    first = make_handler(Mock(), tmp_path)
+    first.capture_event(event(0))
+    first.capture_event(event(1))
+    first.close()
+    first.close()
+
+    inner = Mock()
+    inner.capture_event.side_effect = [None, Exception("Unavailable")]
+    second = make_handler(inner, tmp_path)
+    assert second.replay() == 1
+    second.close()
+
+    inner = Mock()
+    third = make_handler(inner, tmp_path)
+    assert third.replay() == 1
+    third.close()
+
+    inner.capture_event.assert_called_once_with(event(1))
+    assert len(segments(tmp_path)) == 1
+
+
+def test_spool_rolls_segments_and_evicts_oldest(tmp_path, caplog):
+    inner = Mock()
+    handler = make_handler(inner, tmp_path, segment_size=100, max_bytes=250)
+
+    with caplog.at_level(logging.WARNING):
+        for index in range(10):
+            handler.capture_event(event(index))
+
+    assert handler.evicted_segments > 0
+    assert sum(os.path.getsize(tmp_path / name) for name in segments(tmp_path)) <= 250
+    assert caplog.records[0].message.startswith("Spool exceeded 250 bytes")
+    assert handler.queue_stats() == QueueStats(
+        name="SpoolingHandler",
+        depth=handler.spooled_bytes,
+        dropped=handler.evicted_segments,
+    )
+
+    delivered = handler.flush()
+    handler.close()
+
+    replayed = [
+        call.args[0].tags["index"] for call in inner.capture_event.call_args_list
+    ]
+    assert replayed == list(range(10 - delivered, 10))
+
+
+def test_spool_spooled_bytes_after_checkpointed_segment_is_evicted(tmp_path):
+    handler = make_handler(Mock(), tmp_path, segment_size=100, max_bytes=250)
+    handler.capture_event(event())
+    handler.replay()
+
+    for index in range(10):
+        handler.capture_event(event(index))
+
+    assert handler.spooled_bytes == sum(
+        os.path.getsize(tmp_path / name) for name in segments(tmp_path)
+    )
+    handler.close()
+
+
+def test_spool_stops_at_torn_or_corrupt_records(tmp_path, caplog):
+    first = make_handler(Mock(), tmp_path)
+    first.capture_event(event(0))
+    first.capture_event(event(1))
+    first.close()
+
+    path = tmp_path / segments(tmp_path)[0]
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data) + b"\x00\x00\x10\x00")
+
+    inner = Mock()
+    handler = make_handler(inner, tmp_path)
+
+    with caplog.at_level(logging.ERROR):
+        assert handler.replay() == 1
+
+    handler.close()
+
+    inner.capture_event.assert_called_once_with(event(0))
+    assert caplog.records[0].message.startswith(f"Corrupt record in {path}")
+
+
+def test_spool_retries_records_it_cannot_decode_yet(tmp_path, caplog):
+    class LateEvents(Enum):
+        REGISTERED_LATER = "registered_later"
+
+    first = make_handler(Mock(), tmp_path)
+    first.capture_event(TrackerEvent(event=LateEvents.REGISTERED_LATER))
+    first.capture_event(event(1))
+    first.close()
+
+    inner = Mock()
+    second = make_handler(inner, tmp_path, retry_interval=0)
+
+    # After a restart the enum isn't known until the application uses it.
+    with patch.dict(enum_registry._keys, clear=True):
+        with caplog.at_level(logging.ERROR):
+            assert second.replay() == 0
+
+    assert "is not registered" in caplog.records[0].message
+    assert second.replay() == 2
+    second.close()
+
+    assert [call.args[0] for call in inner.capture_event.call_args_list] == [
+        TrackerEvent(event=LateEvents.REGISTERED_LATER),
+        event(1),
+    ]
+
+
+def test_spool_quarantines_undecodable_records(tmp_path, caplog):
+    inner = Mock()
+    handler = make_handler(inner, tmp_path, max_delivery_attempts=2, retry_interval=0)
+    handler.capture_event(event(0))
+    handler.capture_event(event(1))
+
+    with caplog.at_level(logging.ERROR):
+        with patch(
+            "tracker.wrappers.spool.deserialize",
+            side_effect=[ValueError("bad record"), ValueError("bad record"), event(1)],
+        ):
+            assert handler.replay() == 0
+            assert handler.replay() == 1
+
+    handler.close()
+
+    inner.capture_event.assert_called_once_with(event(1))
+    assert handler.quarantined_records == 1
+    assert caplog.records[0].message.endswith(": bad record")
+
+
+def test_spool_discards_segments_behind_checkpoint(tmp_path):
+    (tmp_path / f"{1:020d}.seg").write_bytes(b"")
+    (tmp_path / "checkpoint").write_text("2 0")
+
+    handler = make_handler(Mock(), tmp_path)
+    handler.replay()
+    handler.close()
+
+    assert segments(tmp_path) == [f"{2:020d}.seg"]
+
+
+def test_spool_ignores_invalid_checkpoint(tmp_path):
+    (tmp_path / "checkpoint").write_text("garbage")
+
+    handler = make_handler(Mock(), tmp_path)
+    handler.close()
+
+
+@pytest.mark.parametrize(
+    "policy, syncs",
+    [(FsyncPolicy.RECORD, 4), (FsyncPolicy.BATCH, 2), (FsyncPolicy.INTERVAL, 0)],
+)
+def test_spool_fsync_policies(tmp_path, policy, syncs):
+    handler = make_handler(
+        Mock(), tmp_path, fsync_policy=policy, fsync_batch_size=2, fsync_interval=60
+    )
+
+    with patch("tracker.wrappers.spool.os.fsync") as fsync:
+        for index in range(4):
+            handler.capture_event(event(index))
+
+        assert fsync.call_count == syncs
+
+    handler.close()
+
+
+def test_spool_interval_fsync(tmp_path):
+    handler = make_handler(
+        Mock(), tmp_path, fsync_policy=FsyncPolicy.INTERVAL, fsync_interval=0
+    )
+
+    with patch("tracker.wrappers.spool.os.fsync") as fsync:
+        handler.capture_event(event())
+
+    fsync.assert_called_once()
+    handler.close()
+
+
+def test_spool_interval_fsync_after_appends_stop(tmp_path):
+    synced = threading.Event()
+    handler = make_handler(
+        Mock(),
+        tmp_path,
+        fsync_policy=FsyncPolicy.INTERVAL,
+        fsync_interval=0.05,
+        retry_interval=60,
+        replay_in_background=True,
+    )
+
+    with patch(
+        "tracker.wrappers.spool.os.fsync", side_effect=lambda fd: synced.set()
+    ) as fsync:
+        handler.capture_event(event())
+
+        assert synced.wait(5)
+        assert fsync.call_count == 1
+
+        handler.close()
+
+
+def test_spool_quarantines_records_that_keep_failing(tmp_path, caplog):
+    def capture_event(item):
+        if item.tags["index"] == 0:
+            raise Exception("Rejected")
+
+    inner = Mock()
+    inner.capture_event.side_effect = capture_event
+    handler = make_handler(inner, tmp_path, max_delivery_attempts=3, retry_interval=0)
+    handler.capture_event(event(0))
+    handler.capture_event(event(1))
+
+    with caplog.at_level(logging.ERROR):
+        assert handler.replay() == 0
+        assert handler.replay() == 0
+        assert handler.replay() == 1
+
+    handler.close()
+
+    assert inner.capture_event.call_args.args[0] == event(1)
+    assert handler.quarantined_records == 1
+    assert handler.spooled_bytes == 0
+    assert (tmp_path / "quarantine").stat().st_size > 0
+    assert caplog.records[-1].message == (
+        f"Moved spooled record to {tmp_path / 'quarantine'} after 3 failed deliveries"
+    )
+
+
+def test_spool_counts_attempts_once_per_retry_interval(tmp_path):
+    failed = threading.Event()
+
+    def capture_event(item):
+        failed.set()
+        raise Exception("Unavailable")
+
+    inner = Mock()
+    inner.capture_event.side_effect = capture_event
+    handler = make_handler(
+        inner,
+        tmp_path,
+        retry_interval=60,
+        max_delivery_attempts=2,
+        replay_in_background=True,
+    )
+
+    handler.capture_event(event(0))
+    assert failed.wait(5)
+
+    # Neither new records nor explicit replays during the backoff retry
+    # the failing record as a new attempt.
+    for index in range(1, 50):
+        handler.capture_event(event(index))
+
+    assert handler.replay() == 0
+    handler.close()
+
+    assert inner.capture_event.call_count <= 3
+    assert handler.quarantined_records == 0
+    assert handler.spooled_bytes > 0
+
+
+def test_spool_retries_in_background_after_retry_interval(tmp_path):
+    delivered = threading.Event()
+    outcomes = iter([Exception("Unavailable"), None])
+
+    def capture_event(item):
+        outcome = next(outcomes)
+
+        if outcome:
+            raise outcome
+
+        delivered.set()
+
+    inner = Mock()
+    inner.capture_event.side_effect = capture_event
+    handler = make_handler(
+        inner, tmp_path, replay_in_background=True, retry_interval=0.05
+    )
+
+    handler.capture_event(event())
+
+    assert delivered.wait(5)
+    handler.close()
+
+    assert inner.capture_event.call_count == 2
+    assert handler.spooled_bytes == 0
+
+
+def test_spool_replays_in_background(tmp_path):
+    delivered = threading.Event()
+    inner = Mock()
+    inner.capture_event.side_effect = lambda item: delivered.set()
+    handler = make_handler(
+        inner, tmp_path, replay_in_background=True, retry_interval=0.01
+    )
+
+    handler.capture_event(event())
+
+    assert delivered.wait(5)
+    handler.close()
+
+
+def test_spool_forwards_tags_contexts_scope_and_core(tmp_path):
+    inner = Mock()
+    handler = make_handler(inner, tmp_path)
+
+    handler.set_tags({"key": "value"})
+    handler.set_contexts({"context": {"detail": "info"}})
+
+    inner.set_tags.assert_called_once_with({"key": "value"})
+    inner.set_contexts.assert_called_once_with({"context": {"detail": "info"}})
+    assert handler.scope() is inner.scope.return_value
+    assert handler.shared_core() is inner.shared_core.return_value
+    handler.close()
+
+
+def test_spool_drops_torn_tail_of_previous_segment(tmp_path):
+    (tmp_path / f"{1:020d}.seg").write_bytes(b"\x00\x00\x03\xe8\x00\x00\x00\x00{")
+
+    inner = Mock()
+    handler = make_handler(inner, tmp_path)
+
+    assert handler.replay() == 0
+    handler.close()
+
+    inner.capture_event.assert_not_called()
+
+
+def test_spool_tolerates_missing_segment_files(tmp_path):
+    handler = make_handler(Mock(), tmp_path)
+    handler.capture_event(event())
+    os.remove(tmp_path / segments(tmp_path)[0])
+
+    assert handler.replay() == 0
+    handler.close()
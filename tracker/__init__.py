@@ -1,21 +1,129 @@
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from .core import Tracker
-from .dtos import TrackerEvent, TrackerException, TrackerMessage
+from .dtos import (
+    FrozenTrackerEvent,
+    FrozenTrackerException,
+    FrozenTrackerMessage,
+    TrackerEvent,
+    TrackerException,
+    TrackerMessage,
+)
 from .interfaces import (
+    IAsyncTrackerHandlerEvent,
+    IAsyncTrackerHandlerException,
+    IAsyncTrackerHandlerMessage,
+    ICircuitReporter,
+    IQueueReporter,
     ITrackerHandlerEvent,
+    ITrackerHandlerEventBatch,
     ITrackerHandlerException,
+    ITrackerHandlerExceptionBatch,
     ITrackerHandlerMessage,
+    ITrackerHandlerMessageBatch,
+    ITrackerSampler,
+)
+from .lazy import LazyContext
+from .limits import ContextLimiter
+from .metrics import (
+    CircuitStats,
+    HandlerStats,
+    LatencyHistogram,
+    QueueStats,
+    TrackerMetrics,
+    TrackerStats,
+    render_prometheus,
 )
+from .plan import DispatchPlan, HandlerKind
 from .providers import (
     LoggerCore,
     LoggerEventHandler,
     LoggerExceptionHandler,
     LoggerMessageHandler,
-    SentryCore,
-    SentryExceptionHandler,
-    SentryMessageHandler,
 )
+from .registry import EnumRegistry, enum_registry
 from .types import Contexts, JSONFields, Primitive, Tags
 
+if TYPE_CHECKING:
+    from .aggregation import (
+        AggregateRecord,
+        AggregatingEventHandler,
+        HandlerSink,
+        IAggregateSink,
+        LoggerSink,
+        StatsdSink,
+    )
+    from .async_core import AsyncTracker
+    from .cardinality import CardinalityGuard
+    from .dispatchers import BackgroundDispatcher, OverflowPolicy
+    from .filtering import TrackerFilter
+    from .formatters import TrackerJSONFormatter
+    from .multiprocess import ForwardingHandler, TrackerCollector
+    from .providers.http import HttpCore, HttpEventHandler, PayloadFormat
+    from .providers.sentry import (
+        SentryCore,
+        SentryEventHandler,
+        SentryExceptionHandler,
+        SentryMessageHandler,
+    )
+    from .sampling import (
+        AdaptiveSampler,
+        SamplingPolicy,
+        StaticSampler,
+        TokenBucketSampler,
+    )
+    from .serialization import register_exception
+    from .tracebacks import TracebackCache
+    from .wrappers import (
+        BatchingHandler,
+        CircuitBreakerHandler,
+        CircuitState,
+        DeduplicatingExceptionHandler,
+        FsyncPolicy,
+        SpoolingHandler,
+    )
+
+# Everything beyond the Tracker, its DTOs and interfaces and the logger
+# provider is only loaded on first access (PEP 562): heavy imports
+# (sentry_sdk, asyncio, orjson, http.client) and optional features alike,
+# so services that never use them don't pay for them at startup.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "AsyncTracker": ".async_core",
+    "TrackerJSONFormatter": ".formatters",
+    "SentryCore": ".providers.sentry",
+    "SentryEventHandler": ".providers.sentry",
+    "SentryExceptionHandler": ".providers.sentry",
+    "SentryMessageHandler": ".providers.sentry",
+    "HttpCore": ".providers.http",
+    "HttpEventHandler": ".providers.http",
+    "PayloadFormat": ".providers.http",
+    "BackgroundDispatcher": ".dispatchers",
+    "OverflowPolicy": ".dispatchers",
+    "TrackerFilter": ".filtering",
+    "CardinalityGuard": ".cardinality",
+    "TracebackCache": ".tracebacks",
+    "AdaptiveSampler": ".sampling",
+    "SamplingPolicy": ".sampling",
+    "StaticSampler": ".sampling",
+    "TokenBucketSampler": ".sampling",
+    "AggregateRecord": ".aggregation",
+    "AggregatingEventHandler": ".aggregation",
+    "HandlerSink": ".aggregation",
+    "IAggregateSink": ".aggregation",
+    "LoggerSink": ".aggregation",
+    "StatsdSink": ".aggregation",
+    "ForwardingHandler": ".multiprocess",
+    "TrackerCollector": ".multiprocess",
+    "BatchingHandler": ".wrappers",
+    "CircuitBreakerHandler": ".wrappers",
+    "CircuitState": ".wrappers",
+    "DeduplicatingExceptionHandler": ".wrappers",
+    "FsyncPolicy": ".wrappers",
+    "SpoolingHandler": ".wrappers",
+    "register_exception": ".serialization",
+}
+
 __all__ = [
     "Contexts",
     "JSONFields",
@@ -24,15 +132,83 @@ __all__ = [
     "TrackerEvent",
     "TrackerException",
     "TrackerMessage",
+    "FrozenTrackerEvent",
+    "FrozenTrackerException",
+    "FrozenTrackerMessage",
+    "LazyContext",
+    "ContextLimiter",
+    "CardinalityGuard",
+    "EnumRegistry",
+    "enum_registry",
     "Tracker",
+    "DispatchPlan",
+    "HandlerKind",
+    "TrackerFilter",
+    "AsyncTracker",
+    "BackgroundDispatcher",
+    "OverflowPolicy",
     "ITrackerHandlerException",
     "ITrackerHandlerMessage",
     "ITrackerHandlerEvent",
+    "ITrackerHandlerExceptionBatch",
+    "ITrackerHandlerMessageBatch",
+    "ITrackerHandlerEventBatch",
+    "ITrackerSampler",
+    "IQueueReporter",
+    "ICircuitReporter",
+    "IAsyncTrackerHandlerException",
+    "IAsyncTrackerHandlerMessage",
+    "IAsyncTrackerHandlerEvent",
     "LoggerCore",
     "LoggerExceptionHandler",
     "LoggerMessageHandler",
     "LoggerEventHandler",
+    "TrackerJSONFormatter",
+    "TracebackCache",
     "SentryCore",
+    "SentryEventHandler",
     "SentryExceptionHandler",
     "SentryMessageHandler",
+    "HttpCore",
+    "HttpEventHandler",
+    "PayloadFormat",
+    "AggregatingEventHandler",
+    "AggregateRecord",
+    "IAggregateSink",
+    "LoggerSink",
+    "StatsdSink",
+    "HandlerSink",
+    "BatchingHandler",
+    "DeduplicatingExceptionHandler",
+    "CircuitBreakerHandler",
+    "CircuitState",
+    "SpoolingHandler",
+    "FsyncPolicy",
+    "register_exception",
+    "ForwardingHandler",
+    "TrackerCollector",
+    "TrackerMetrics",
+    "TrackerStats",
+    "HandlerStats",
+    "CircuitStats",
+    "QueueStats",
+    "LatencyHistogram",
+    "render_prometheus",
+    "SamplingPolicy",
+    "StaticSampler",
+    "TokenBucketSampler",
+    "AdaptiveSampler",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
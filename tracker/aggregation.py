@@ -0,0 +1,391 @@
+import atexit
+import logging
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from .dtos import TrackerEvent
+from .forking import register_after_fork
+from .interfaces import ITrackerHandlerEvent
+from .lazy import resolve_mapping
+from .registry import enum_value
+from .types import Contexts, Tags
+
+logger = logging.getLogger(__name__)
+
+AggregateKey = Tuple[Enum, FrozenSet[Tuple[str, Any]]]
+
+_NO_TAGS: FrozenSet[Tuple[str, Any]] = frozenset()
+
+
+class Distribution:
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def record(self, value: float):
+        # Converted first, so a non-numeric value raises before any field
+        # changes.
+        value = float(value)
+        self.count += 1
+        self.total += value
+
+        if value < self.min:
+            self.min = value
+
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "Distribution"):
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+@dataclass(frozen=True)
+class AggregateRecord:
+    event: Enum
+    tags: Mapping[str, Any]
+    count: int
+    values: Mapping[str, Distribution]
+    interval: float
+
+
+def _numeric(event: Enum, values: Dict[str, Any]) -> Dict[str, float]:
+    # Validated before the shard is touched: a bad value is left out of its
+    # distribution instead of leaving the aggregate half updated.
+    numeric: Dict[str, float] = {}
+
+    for key, value in values.items():
+        try:
+            numeric[key] = float(value)
+        except (TypeError, ValueError):
+            logger.error(f"Ignoring non-numeric value {value!r} of {key} for {event}")
+
+    return numeric
+
+
+class _Aggregate:
+    __slots__ = ("count", "values")
+
+    def __init__(self):
+        self.count = 0
+        self.values: Dict[str, Distribution] = {}
+
+    def merge(self, other: "_Aggregate"):
+        self.count += other.count
+
+        for key, distribution in other.values.items():
+            self.values.setdefault(key, Distribution()).merge(distribution)
+
+
+class _Shard:
+    __slots__ = ("lock", "aggregates", "thread")
+
+    def __init__(self):
+        # Only the owning thread and flush() take this lock, so it is
+        # uncontended outside of flushes.
+        self.lock = threading.Lock()
+        self.aggregates: Dict[AggregateKey, _Aggregate] = {}
+        self.thread = threading.current_thread()
+
+
+class IAggregateSink(ABC):
+    @abstractmethod
+    def write(self, records: List[AggregateRecord]): ...
+
+
+def summary(record: AggregateRecord) -> Dict[str, Any]:
+    return {
+        "count": record.count,
+        "interval": record.interval,
+        "values": {
+            key: {
+                "count": distribution.count,
+                "sum": distribution.total,
+                "min": distribution.min,
+                "max": distribution.max,
+            }
+            for key, distribution in record.values.items()
+        },
+    }
+
+
+class LoggerSink(IAggregateSink):
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger("Tracker.Aggregates")
+
+    def write(self, records: List[AggregateRecord]):
+        # Same extra fields as LoggerCore, so TrackerJSONFormatter renders
+        # them as tags and contexts.
+        for record in records:
+            self.logger.info(
+                enum_value(record.event),
+                extra={
+                    "tags": dict(record.tags),
+                    "contexts": {"aggregate": summary(record)},
+                },
+            )
+
+
+class HandlerSink(IAggregateSink):
+    def __init__(self, handler: ITrackerHandlerEvent):
+        self.handler = handler
+
+    def write(self, records: List[AggregateRecord]):
+        for record in records:
+            self.handler.capture_event(
+                TrackerEvent(
+                    event=record.event,
+                    tags=dict(record.tags),
+                    contexts={"aggregate": summary(record)},
+                )
+            )
+
+
+# Separators of the StatsD line protocol; a tag containing one of them
+# would split or corrupt the line it is sent on.
+_STATSD_RESERVED = str.maketrans({char: "_" for char in "|,:\n"})
+
+
+def _statsd_safe(value: Any) -> str:
+    return str(value).translate(_STATSD_RESERVED)
+
+
+class StatsdSink(IAggregateSink):
+    @dataclass
+    class StatsdConfig:
+        host: str = "127.0.0.1"
+        port: int = 8125
+        prefix: str = ""
+        max_packet_size: int = 1432
+
+    def __init__(self, config: StatsdConfig):
+        self.config = config
+        self.dropped = 0
+        family, _, _, _, address = socket.getaddrinfo(
+            config.host, config.port, type=socket.SOCK_DGRAM
+        )[0]
+        self._address = address
+        self._socket = socket.socket(family, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def lines(self, record: AggregateRecord) -> List[str]:
+        # DogStatsD tags; sums and counts are counters, extremes are gauges.
+        name = _statsd_safe(f"{self.config.prefix}{enum_value(record.event)}")
+        tags = (
+            "|#"
+            + ",".join(
+                f"{_statsd_safe(key)}:{_statsd_safe(value)}"
+                for key, value in record.tags.items()
+            )
+            if record.tags
+            else ""
+        )
+        lines = [f"{name}:{record.count}|c{tags}"]
+
+        for key, distribution in record.values.items():
+            key = _statsd_safe(key)
+            lines.append(f"{name}.{key}.count:{distribution.count}|c{tags}")
+            lines.append(f"{name}.{key}.sum:{distribution.total}|c{tags}")
+            lines.append(f"{name}.{key}.min:{distribution.min}|g{tags}")
+            lines.append(f"{name}.{key}.max:{distribution.max}|g{tags}")
+
+        return lines
+
+    def packets(self, records: List[AggregateRecord]) -> List[bytes]:
+        packets: List[bytes] = []
+        packet = b""
+
+        for record in records:
+            for line in self.lines(record):
+                encoded = line.encode()
+
+                if (
+                    packet
+                    and len(packet) + 1 + len(encoded) > self.config.max_packet_size
+                ):
+                    packets.append(packet)
+                    packet = b""
+
+                packet = packet + b"\n" + encoded if packet else encoded
+
+        if packet:
+            packets.append(packet)
+
+        return packets
+
+    def write(self, records: List[AggregateRecord]):
+        for packet in self.packets(records):
+            try:
+                self._socket.sendto(packet, self._address)
+            except OSError:
+                self.dropped += 1
+
+    def close(self):
+        self._socket.close()
+
+
+class AggregatingEventHandler(ITrackerHandlerEvent):
+    @dataclass
+    class AggregationConfig:
+        interval: Optional[float] = 10.0
+        # Numeric tags recorded as distributions instead of being part of
+        # the key, e.g. ("amount",).
+        value_keys: Tuple[str, ...] = ()
+
+    def __init__(self, sink: IAggregateSink, config: AggregationConfig):
+        self.sink = sink
+        self.config = config
+        self._value_keys = frozenset(config.value_keys)
+        self._stopped = threading.Event()
+        self._start()
+
+        if config.interval is not None:
+            atexit.register(self.close)
+
+        register_after_fork(self._restart)
+
+    def set_tags(self, tags: Tags):
+        # Ambient tags (request ids and the like) would explode the number
+        # of keys; only the event's own tags are aggregated.
+        pass
+
+    def set_contexts(self, contexts: Contexts):
+        pass
+
+    def capture_event(self, tracker_event: TrackerEvent):
+        tags = resolve_mapping(tracker_event.tags)
+        values: Optional[Dict[str, Any]] = None
+
+        if tags and self._value_keys:
+            values = {key: tags[key] for key in self._value_keys if key in tags}
+
+            if values:
+                tags = {key: value for key, value in tags.items() if key not in values}
+                values = _numeric(tracker_event.event, values)
+
+        key = (tracker_event.event, frozenset(tags.items()) if tags else _NO_TAGS)
+        shard = self._shard()
+
+        with shard.lock:
+            aggregate = shard.aggregates.get(key)
+
+            if aggregate is None:
+                aggregate = shard.aggregates[key] = _Aggregate()
+
+            aggregate.count += 1
+
+            if values:
+                for name, value in values.items():
+                    distribution = aggregate.values.get(name)
+
+                    if distribution is None:
+                        distribution = aggregate.values[name] = Distribution()
+
+                    distribution.record(value)
+
+    def flush(self) -> List[AggregateRecord]:
+        now = time.monotonic()
+        interval = now - self._window_started_at
+        self._window_started_at = now
+        merged: Dict[AggregateKey, _Aggregate] = {}
+
+        with self._lock:
+            shards = list(self._shards)
+
+        for shard in shards:
+            # A thread seen dead before draining can't write again, so its
+            # shard is dropped once drained.
+            alive = shard.thread.is_alive()
+
+            with shard.lock:
+                aggregates, shard.aggregates = shard.aggregates, {}
+
+            if not alive:
+                with self._lock:
+                    self._shards.remove(shard)
+
+            for key, aggregate in aggregates.items():
+                total = merged.get(key)
+
+                if total is None:
+                    merged[key] = aggregate
+                else:
+                    total.merge(aggregate)
+
+        records = [
+            AggregateRecord(
+                event=event,
+                tags=dict(tags),
+                count=aggregate.count,
+                values=aggregate.values,
+                interval=interval,
+            )
+            for (event, tags), aggregate in merged.items()
+        ]
+
+        if records:
+            try:
+                self.sink.write(records)
+            except Exception as e:
+                logger.error(
+                    f"Error writing {len(records)} aggregates to sink {self.sink}: {e}"
+                )
+
+        return records
+
+    def close(self):
+        if self._stopped.is_set():
+            return
+
+        self._stopped.set()
+        atexit.unregister(self.close)
+
+        if self._flusher:
+            self._flusher.join()
+
+        self.flush()
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+
+            with self._lock:
+                self._shards.append(shard)
+
+            return shard
+
+    def _start(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[_Shard] = []
+        self._window_started_at = time.monotonic()
+        self._flusher: Optional[threading.Thread] = None
+
+        if self.config.interval is not None:
+            self._flusher = threading.Thread(
+                target=self._run, name="Tracker.AggregatingEventHandler", daemon=True
+            )
+            self._flusher.start()
+
+    def _restart(self):
+        # Shard locks may have been held by other threads at fork time;
+        # counts recorded before the fork are flushed by the parent.
+        if not self._stopped.is_set():
+            self._start()
+
+    def _run(self):
+        while not self._stopped.wait(self.config.interval):
+            self.flush()
@@ -0,0 +1,167 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import sys
+from concurrent.futures import Executor
+from contextlib import ExitStack, contextmanager
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .dtos import TrackerEvent, TrackerException, TrackerMessage
+from .interfaces import (
+    IAsyncTrackerHandlerEvent,
+    IAsyncTrackerHandlerException,
+    IAsyncTrackerHandlerMessage,
+    ITrackerHandlerEvent,
+    ITrackerHandlerException,
+    ITrackerHandlerMessage,
+)
+from .lazy import end_shared_resolutions, memoized, share_resolutions
+from .plan import unique_by_core
+from .types import Contexts, Tags
+
+logger = logging.getLogger(__name__)
+
+AsyncCapture = Callable[[Any], Awaitable[None]]
+
+
+def _is_async(capture: Callable[..., Any]) -> bool:
+    if inspect.iscoroutinefunction(capture):
+        return True
+
+    # inspect misses callables that only carry asyncio's coroutine marker
+    # (AsyncMock on 3.9); asyncio still checks it, up to its 3.14
+    # deprecation.
+    if sys.version_info < (3, 14) and asyncio.iscoroutinefunction(capture):
+        return True
+
+    return inspect.iscoroutinefunction(getattr(capture, "__call__", None))
+
+
+class AsyncTracker:
+    def __init__(
+        self,
+        message_handlers: Optional[
+            List[Union[IAsyncTrackerHandlerMessage, ITrackerHandlerMessage]]
+        ] = None,
+        exception_handlers: Optional[
+            List[Union[IAsyncTrackerHandlerException, ITrackerHandlerException]]
+        ] = None,
+        event_handlers: Optional[
+            List[Union[IAsyncTrackerHandlerEvent, ITrackerHandlerEvent]]
+        ] = None,
+        handler_timeout: Optional[float] = None,
+        executor: Optional[Executor] = None,
+    ):
+        self.__handler_timeout = handler_timeout
+        self.__executor = executor
+        self.__message_handlers = self.__bind(message_handlers, "capture_message")
+        self.__exception_handlers = self.__bind(exception_handlers, "capture_exception")
+        self.__event_handlers = self.__bind(event_handlers, "capture_event")
+
+    def set_tags(self, tags: Tags):
+        for handler in self.__handlers():
+            try:
+                handler.set_tags(tags)
+            except Exception as e:
+                logger.error(f"Error setting tags for handler {handler}: {e}")
+
+    def set_contexts(self, contexts: Contexts):
+        for handler in self.__handlers():
+            try:
+                handler.set_contexts(contexts)
+            except Exception as e:
+                logger.error(f"Error setting contexts for handler {handler}: {e}")
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        with ExitStack() as stack:
+            for handler in self.__handlers():
+                try:
+                    stack.enter_context(handler.scope())
+                except Exception as e:
+                    logger.error(f"Error opening scope for handler {handler}: {e}")
+
+            yield
+
+    async def emit_exception(self, tracker_exception: TrackerException):
+        await self.__gather("exception", self.__exception_handlers, tracker_exception)
+
+    async def emit_message(self, tracker_message: TrackerMessage):
+        await self.__gather("message", self.__message_handlers, tracker_message)
+
+    async def emit_event(self, tracker_event: TrackerEvent):
+        await self.__gather("event", self.__event_handlers, tracker_event)
+
+    def __handlers(self) -> Tuple[Any, ...]:
+        return unique_by_core(
+            handler
+            for handler, _ in self.__event_handlers
+            + self.__exception_handlers
+            + self.__message_handlers
+        )
+
+    def __bind(
+        self, handlers: Optional[Sequence[Any]], method: str
+    ) -> List[Tuple[Any, AsyncCapture]]:
+        bound = []
+
+        for handler in handlers or []:
+            capture = getattr(handler, method)
+
+            if not _is_async(capture):
+                capture = functools.partial(self.__offload, capture)
+
+            bound.append((handler, capture))
+
+        return bound
+
+    async def __offload(self, capture: Callable[[Any], None], item: Any):
+        # Sync handlers read ambient tags from ContextVars, which
+        # run_in_executor does not propagate on its own.
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self.__executor, functools.partial(context.run, capture, item)
+        )
+
+    async def __gather(
+        self, kind: str, handlers: List[Tuple[Any, AsyncCapture]], item: Any
+    ):
+        if not handlers:
+            return
+
+        token = None
+
+        if len(handlers) > 1:
+            item = memoized(item)
+            token = share_resolutions()
+
+        try:
+            results = await asyncio.gather(
+                *(
+                    asyncio.wait_for(capture(item), self.__handler_timeout)
+                    for _, capture in handlers
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            if token is not None:
+                end_shared_resolutions(token)
+
+        for (handler, _), result in zip(handlers, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.error(f"Timeout emitting {kind} for handler {handler}")
+            elif isinstance(result, Exception):
+                logger.error(f"Error emitting {kind} for handler {handler}: {result}")
@@ -0,0 +1,210 @@
+import dataclasses
+import hashlib
+import logging
+import math
+import sys
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, Optional
+
+from .lazy import LazyContext, resolve
+from .types import Tags
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_VALUE = "__overflow__"
+
+_MASK64 = (1 << 64) - 1
+_MISSING = object()
+_DROPPED = object()
+
+
+def _stable_hash(value: Any) -> int:
+    # hash() of a str is salted per process and hash() of a type follows
+    # its address, so sketches built from it would differ between processes
+    # (and between a forked worker and its collector). Only new values are
+    # hashed, so blake2b's cost stays off the common path.
+    digest = hashlib.blake2b(repr(value).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class HyperLogLog:
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = 10):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: Any):
+        hashed = _stable_hash(value)
+        index = hashed >> (64 - self.precision)
+        remaining = (hashed << self.precision) & _MASK64
+        rank = min(65 - remaining.bit_length(), 65 - self.precision)
+
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0**-rank for rank in self.registers)
+        zeros = self.registers.count(0)
+
+        if estimate <= 2.5 * size and zeros:
+            # Linear counting is more accurate while most registers are empty.
+            estimate = size * math.log(size / zeros)
+
+        return round(estimate)
+
+
+class _KeyState:
+    __slots__ = ("values", "sketch", "overflowed")
+
+    def __init__(self, precision: int):
+        self.values: Dict[Any, Any] = {}
+        self.sketch = HyperLogLog(precision)
+        self.overflowed = False
+
+
+class CardinalityGuard:
+    @dataclass
+    class CardinalityConfig:
+        max_values_per_key: int = 1000
+        max_keys: int = 1000
+        overflow_value: str = OVERFLOW_VALUE
+        precision: int = 10
+
+    def __init__(self, config: CardinalityConfig):
+        self.config = config
+        self.dropped_keys = 0
+        self._keys: Dict[str, _KeyState] = {}
+
+    def limit(self, tags: Any) -> Any:
+        # Lazy tags stay lazy; they are checked when a handler resolves them.
+        if callable(tags):
+            return LazyContext(partial(self._limit_resolved, tags))
+
+        if not tags:
+            return tags
+
+        limited: Optional[Dict[str, Any]] = None
+        keys = self._keys
+
+        for key, value in tags.items():
+            # Inlined lookup of already admitted values, the common case.
+            state = keys.get(key)
+            canonical: Any = _MISSING
+
+            if state is not None:
+                canonical = state.values.get(
+                    value if type(value) is str else (type(value), value), _MISSING
+                )
+
+            if canonical is not _MISSING:
+                pass
+            elif callable(value):
+                canonical = LazyContext(partial(self._value_resolved, key, value))
+            else:
+                canonical = self.value(key, value)
+
+            # An equal value that merely isn't the interned object is kept
+            # as is: the mapping is only copied when a value is replaced.
+            if canonical is value or (
+                canonical is not _DROPPED
+                and type(canonical) is type(value)
+                and canonical == value
+            ):
+                if limited is not None:
+                    limited[key] = value
+
+                continue
+
+            if limited is None:
+                limited = {}
+
+                for seen_key, seen_value in tags.items():
+                    if seen_key == key:
+                        break
+
+                    limited[seen_key] = seen_value
+
+            if canonical is not _DROPPED:
+                limited[key] = canonical
+
+        return tags if limited is None else limited
+
+    def limit_item(self, item: Any) -> Any:
+        tags = self.limit(item.tags)
+
+        if tags is item.tags:
+            return item
+
+        return dataclasses.replace(item, tags=tags)
+
+    def value(self, key: str, value: Any) -> Any:
+        # The per-key table interns admitted values, so tag-keyed state
+        # downstream shares one object per value; it holds at most
+        # max_values_per_key entries, everything past that is counted by
+        # the sketch only. Concurrent callers may admit a few extra values.
+        state = self._keys.get(key)
+
+        if state is None:
+            state = self._new_key(key)
+
+            if state is None:
+                return _DROPPED
+
+        entry = value if type(value) is str else (type(value), value)
+        canonical = state.values.get(entry, _MISSING)
+
+        if canonical is not _MISSING:
+            return canonical
+
+        state.sketch.add(entry)
+
+        if len(state.values) >= self.config.max_values_per_key:
+            if not state.overflowed:
+                state.overflowed = True
+                logger.warning(
+                    f"Tag {key!r} exceeded {self.config.max_values_per_key} "
+                    f"distinct values; new values are reported as "
+                    f"{self.config.overflow_value!r}"
+                )
+
+            return self.config.overflow_value
+
+        canonical = sys.intern(value) if type(value) is str else value
+        state.values[entry] = canonical
+        return canonical
+
+    def overflowed(self) -> Dict[str, int]:
+        # Offending keys and their estimated number of distinct values.
+        return {
+            key: state.sketch.estimate()
+            for key, state in list(self._keys.items())
+            if state.overflowed
+        }
+
+    def _new_key(self, key: str) -> Optional[_KeyState]:
+        if len(self._keys) >= self.config.max_keys:
+            self.dropped_keys += 1
+
+            if self.dropped_keys == 1:
+                logger.warning(
+                    f"Tag key limit of {self.config.max_keys} reached; "
+                    f"dropping new keys such as {key!r}"
+                )
+
+            return None
+
+        key = sys.intern(key)
+        return self._keys.setdefault(key, _KeyState(self.config.precision))
+
+    def _limit_resolved(self, tags: Any) -> Optional[Tags]:
+        return self.limit(resolve(tags))
+
+    def _value_resolved(self, key: str, value: Any) -> Any:
+        canonical = self.value(key, resolve(value))
+        # A key dropped after the fact can't be removed from the mapping
+        # that holds it anymore.
+        return self.config.overflow_value if canonical is _DROPPED else canonical
@@ -1,14 +1,34 @@
 import logging
-from typing import List, Optional
+import threading
+from contextlib import ExitStack, contextmanager
+from enum import Enum
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
 
 from .dtos import TrackerEvent, TrackerException, TrackerMessage
 from .interfaces import (
+    ICircuitReporter,
+    IQueueReporter,
     ITrackerHandlerEvent,
     ITrackerHandlerException,
     ITrackerHandlerMessage,
+    ITrackerSampler,
 )
+from .lazy import end_shared_resolutions, memoized, share_resolutions
+from .metrics import TrackerMetrics, TrackerStats
+from .plan import DispatchPlan, HandlerKind, Route
 from .types import Contexts, Tags
 
+if TYPE_CHECKING:
+    # Only passed in by callers; importing them here would load them for
+    # every 'import tracker'.
+    from .cardinality import CardinalityGuard
+    from .dispatchers import BackgroundDispatcher
+    from .filtering import TrackerFilter
+
+AnyHandler = Union[
+    ITrackerHandlerException, ITrackerHandlerMessage, ITrackerHandlerEvent
+]
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,50 +38,267 @@ class Tracker:
         message_handlers: Optional[List[ITrackerHandlerMessage]] = None,
         exception_handlers: Optional[List[ITrackerHandlerException]] = None,
         event_handlers: Optional[List[ITrackerHandlerEvent]] = None,
+        dispatcher: Optional["BackgroundDispatcher"] = None,
+        sampler: Optional[ITrackerSampler] = None,
+        metrics: Optional[TrackerMetrics] = None,
+        filters: Optional["TrackerFilter"] = None,
+        cardinality: Optional["CardinalityGuard"] = None,
     ):
-        self.__message_handlers = message_handlers or []
-        self.__exception_handlers = exception_handlers or []
-        self.__event_handlers = event_handlers or []
+        self.__plan = DispatchPlan(
+            exception_handlers=exception_handlers or (),
+            message_handlers=message_handlers or (),
+            event_handlers=event_handlers or (),
+            instrument=metrics.instrument if metrics else None,
+            filters=filters,
+        )
+        self.__plan_lock = threading.Lock()
+        self.__dispatcher = dispatcher
+        self.__sampler = sampler
+        self.__metrics = metrics
+        self.__cardinality = cardinality
 
-    def set_tags(self, tags: Tags):
-        handlers = (
-            self.__event_handlers + self.__exception_handlers + self.__message_handlers
+    def add_handler(self, kind: HandlerKind, handler: AnyHandler):
+        with self.__plan_lock:
+            self.__plan = self.__plan.with_handler(kind, handler)
+
+    def remove_handler(self, kind: HandlerKind, handler: AnyHandler):
+        with self.__plan_lock:
+            self.__plan = self.__plan.without_handler(kind, handler)
+
+    def enabled_for(
+        self, key: Union[Enum, type], kind: Optional[HandlerKind] = None
+    ) -> bool:
+        # Lets callers skip building expensive tags and contexts; sampling
+        # still applies on emit.
+        plan = self.__plan
+
+        if kind is not None:
+            routes = plan.tables[kind].get(key)
+            return bool(plan.routes_for(kind, key) if routes is None else routes)
+
+        if isinstance(key, type):
+            return bool(plan.routes_for(HandlerKind.EXCEPTION, key))
+
+        return bool(
+            plan.routes_for(HandlerKind.EVENT, key)
+            or plan.routes_for(HandlerKind.MESSAGE, key)
         )
 
-        for handler in handlers:
+    def set_tags(self, tags: Tags):
+        if self.__cardinality:
+            tags = self.__cardinality.limit(tags)
+
+        for handler in self.__plan.set_targets:
             try:
                 handler.set_tags(tags)
             except Exception as e:
                 logger.error(f"Error setting tags for handler {handler}: {e}")
 
     def set_contexts(self, contexts: Contexts):
-        handlers = (
-            self.__event_handlers + self.__exception_handlers + self.__message_handlers
-        )
-
-        for handler in handlers:
+        for handler in self.__plan.set_targets:
             try:
                 handler.set_contexts(contexts)
             except Exception as e:
                 logger.error(f"Error setting contexts for handler {handler}: {e}")
 
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        with ExitStack() as stack:
+            for handler in self.__plan.set_targets:
+                try:
+                    stack.enter_context(handler.scope())
+                except Exception as e:
+                    logger.error(f"Error opening scope for handler {handler}: {e}")
+
+            yield
+
     def emit_exception(self, tracker_exception: TrackerException):
-        for handler in self.__exception_handlers:
-            try:
-                handler.capture_exception(tracker_exception)
-            except Exception as e:
-                logger.error(f"Error emitting exception for handler {handler}: {e}")
+        key = type(tracker_exception.exception)
+        plan = self.__plan
+        routes = plan.exception_table.get(key)
+
+        if routes is None:
+            routes = plan.routes_for(HandlerKind.EXCEPTION, key)
+
+        if not routes:
+            return
+
+        if self.__sampler:
+            # Samplers keyed by tag values resolve lazy tags; memoizing first
+            # lets handlers reuse that result.
+            tracker_exception = memoized(tracker_exception)
+
+            if not self.__sampler.should_sample(key, tracker_exception.tags):
+                return
+
+        if self.__cardinality and tracker_exception.tags:
+            tracker_exception = self.__cardinality.limit_item(tracker_exception)
+
+        if self.__dispatcher:
+            self.__dispatcher.submit(self.__emit_exception, tracker_exception)
+        else:
+            self.__emit_exception(tracker_exception, routes)
 
     def emit_message(self, tracker_message: TrackerMessage):
-        for handler in self.__message_handlers:
-            try:
-                handler.capture_message(tracker_message)
-            except Exception as e:
-                logger.error(f"Error emitting message for handler {handler}: {e}")
+        key = tracker_message.message
+        plan = self.__plan
+        routes = plan.message_table.get(key)
+
+        if routes is None:
+            routes = plan.routes_for(HandlerKind.MESSAGE, key)
+
+        if not routes:
+            return
+
+        if self.__sampler:
+            tracker_message = memoized(tracker_message)
+
+            if not self.__sampler.should_sample(key, tracker_message.tags):
+                return
+
+        if self.__cardinality and tracker_message.tags:
+            tracker_message = self.__cardinality.limit_item(tracker_message)
+
+        if self.__dispatcher:
+            self.__dispatcher.submit(self.__emit_message, tracker_message)
+        else:
+            self.__emit_message(tracker_message, routes)
 
     def emit_event(self, tracker_event: TrackerEvent):
-        for handler in self.__event_handlers:
-            try:
-                handler.capture_event(tracker_event)
-            except Exception as e:
-                logger.error(f"Error emitting event for handler {handler}: {e}")
+        key = tracker_event.event
+        plan = self.__plan
+        routes = plan.event_table.get(key)
+
+        if routes is None:
+            routes = plan.routes_for(HandlerKind.EVENT, key)
+
+        if not routes:
+            return
+
+        if self.__sampler:
+            tracker_event = memoized(tracker_event)
+
+            if not self.__sampler.should_sample(key, tracker_event.tags):
+                return
+
+        if self.__cardinality and tracker_event.tags:
+            tracker_event = self.__cardinality.limit_item(tracker_event)
+
+        if self.__dispatcher:
+            self.__dispatcher.submit(self.__emit_event, tracker_event)
+        else:
+            self.__emit_event(tracker_event, routes)
+
+    def stats(self) -> TrackerStats:
+        plan = self.__plan
+        handlers = plan.event_handlers + plan.exception_handlers + plan.message_handlers
+        sources = [self.__dispatcher, *handlers]
+        sources.extend(handler.shared_core() for handler in handlers)
+
+        queues = []
+        circuits = []
+        for source in {id(source): source for source in sources}.values():
+            if isinstance(source, IQueueReporter):
+                queue_stats = source.queue_stats()
+
+                if queue_stats:
+                    queues.append(queue_stats)
+
+            if isinstance(source, ICircuitReporter):
+                circuits.append(source.circuit_stats())
+
+        return TrackerStats(
+            handlers=self.__metrics.snapshot() if self.__metrics else [],
+            queues=queues,
+            circuits=circuits,
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        if self.__dispatcher:
+            return self.__dispatcher.flush(timeout)
+
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        if self.__dispatcher:
+            return self.__dispatcher.close(timeout)
+
+        return True
+
+    def __emit_exception(
+        self,
+        tracker_exception: TrackerException,
+        routes: Optional[Tuple[Route, ...]] = None,
+    ):
+        # Items handed to the dispatcher are routed by the plan current when
+        # a worker picks them up.
+        if routes is None:
+            routes = self.__plan.routes_for(
+                HandlerKind.EXCEPTION, type(tracker_exception.exception)
+            )
+
+        token = None
+
+        if len(routes) > 1:
+            # Lazy values on the item and in ambient scopes resolve once and
+            # are shared by every handler of this emit.
+            tracker_exception = memoized(tracker_exception)
+            token = share_resolutions()
+
+        try:
+            for handler, capture in routes:
+                try:
+                    capture(tracker_exception)
+                except Exception as e:
+                    logger.error(f"Error emitting exception for handler {handler}: {e}")
+        finally:
+            if token is not None:
+                end_shared_resolutions(token)
+
+    def __emit_message(
+        self,
+        tracker_message: TrackerMessage,
+        routes: Optional[Tuple[Route, ...]] = None,
+    ):
+        if routes is None:
+            routes = self.__plan.routes_for(
+                HandlerKind.MESSAGE, tracker_message.message
+            )
+
+        token = None
+
+        if len(routes) > 1:
+            tracker_message = memoized(tracker_message)
+            token = share_resolutions()
+
+        try:
+            for handler, capture in routes:
+                try:
+                    capture(tracker_message)
+                except Exception as e:
+                    logger.error(f"Error emitting message for handler {handler}: {e}")
+        finally:
+            if token is not None:
+                end_shared_resolutions(token)
+
+    def __emit_event(
+        self, tracker_event: TrackerEvent, routes: Optional[Tuple[Route, ...]] = None
+    ):
+        if routes is None:
+            routes = self.__plan.routes_for(HandlerKind.EVENT, tracker_event.event)
+
+        token = None
+
+        if len(routes) > 1:
+            tracker_event = memoized(tracker_event)
+            token = share_resolutions()
+
+        try:
+            for handler, capture in routes:
+                try:
+                    capture(tracker_event)
+                except Exception as e:
+                    logger.error(f"Error emitting event for handler {handler}: {e}")
+        finally:
+            if token is not None:
+                end_shared_resolutions(token)
@@ -0,0 +1,172 @@
+import atexit
+import contextvars
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, List, Optional
+
+from .forking import register_after_fork
+from .interfaces import IQueueReporter
+from .metrics import QueueStats
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class OverflowPolicy(Enum):
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+
+class BackgroundDispatcher(IQueueReporter):
+    @dataclass
+    class DispatcherConfig:
+        max_queue_size: int = 10000
+        workers: int = 1
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST
+        block_timeout: Optional[float] = None
+        shutdown_timeout: Optional[float] = 5.0
+
+    def __init__(self, config: DispatcherConfig):
+        self.config = config
+        self.dropped = 0
+        self._closed = False
+        self._start()
+        atexit.register(self.close, config.shutdown_timeout)
+        register_after_fork(self._restart)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def queue_stats(self) -> QueueStats:
+        return QueueStats(
+            name=type(self).__name__, depth=self.queue_depth, dropped=self.dropped
+        )
+
+    def submit(self, function: Callable[[Any], None], item: Any) -> bool:
+        if self._closed:
+            self.dropped += 1
+            return False
+
+        # Handlers read ambient tags and contexts from ContextVars, so the
+        # caller's context travels with the item to the worker thread.
+        entry = (contextvars.copy_context(), function, item)
+        policy = self.config.overflow_policy
+
+        if policy is OverflowPolicy.BLOCK:
+            try:
+                self._queue.put(entry, timeout=self.config.block_timeout)
+                return True
+            except queue.Full:
+                self.dropped += 1
+                return False
+
+        if policy is OverflowPolicy.DROP_NEWEST:
+            try:
+                self._queue.put_nowait(entry)
+                return True
+            except queue.Full:
+                self.dropped += 1
+                return False
+
+        while True:
+            try:
+                self._queue.put_nowait(entry)
+                return True
+            except queue.Full:
+                self._discard_oldest()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                if deadline is None:
+                    self._queue.all_tasks_done.wait()
+                    continue
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+
+                self._queue.all_tasks_done.wait(remaining)
+
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        if self._closed:
+            return True
+
+        self._closed = True
+        atexit.unregister(self.close)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = self.flush(timeout)
+
+        for _ in self._workers:
+            try:
+                self._queue.put(_STOP, timeout=self._remaining(deadline))
+            except queue.Full:
+                return False
+
+        for worker in self._workers:
+            worker.join(self._remaining(deadline))
+
+        return flushed and not any(worker.is_alive() for worker in self._workers)
+
+    def _start(self):
+        self._queue: "queue.Queue[Any]" = queue.Queue(
+            maxsize=self.config.max_queue_size
+        )
+        self._workers: List[threading.Thread] = []
+
+        for index in range(self.config.workers):
+            worker = threading.Thread(
+                target=self._run,
+                name=f"Tracker.BackgroundDispatcher-{index}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _restart(self):
+        # Workers don't survive fork(); items queued at fork time are left
+        # to the parent.
+        if not self._closed:
+            self._start()
+
+    def _discard_oldest(self):
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            return
+
+        self._queue.task_done()
+        self.dropped += 1
+
+    def _remaining(self, deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+
+        return max(deadline - time.monotonic(), 0)
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+
+            if entry is _STOP:
+                self._queue.task_done()
+                return
+
+            context, function, item = entry
+            try:
+                context.run(function, item)
+            except Exception as e:
+                logger.error(f"Error dispatching {item} in background: {e}")
+            finally:
+                self._queue.task_done()
@@ -2,9 +2,11 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
+from .helpers import add_slots
 from .types import Contexts, Tags
 
 
+@add_slots
 @dataclass
 class TrackerException:
     exception: Exception
@@ -12,6 +14,7 @@ class TrackerException:
     contexts: Optional[Contexts] = None
 
 
+@add_slots
 @dataclass
 class TrackerEvent:
     event: Enum
@@ -19,8 +22,33 @@ class TrackerEvent:
     contexts: Optional[Contexts] = None
 
 
+@add_slots
 @dataclass
 class TrackerMessage:
     message: Enum
     tags: Optional[Tags] = None
     contexts: Optional[Contexts] = None
+
+
+@add_slots
+@dataclass(frozen=True)
+class FrozenTrackerException:
+    exception: Exception
+    tags: Optional[Tags] = None
+    contexts: Optional[Contexts] = None
+
+
+@add_slots
+@dataclass(frozen=True)
+class FrozenTrackerEvent:
+    event: Enum
+    tags: Optional[Tags] = None
+    contexts: Optional[Contexts] = None
+
+
+@add_slots
+@dataclass(frozen=True)
+class FrozenTrackerMessage:
+    message: Enum
+    tags: Optional[Tags] = None
+    contexts: Optional[Contexts] = None
@@ -0,0 +1,61 @@
+import logging
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Mapping, Optional
+
+from .plan import HandlerKind
+
+DEFAULT_LEVELS: Dict[HandlerKind, int] = {
+    HandlerKind.EXCEPTION: logging.ERROR,
+    HandlerKind.MESSAGE: logging.INFO,
+    HandlerKind.EVENT: logging.INFO,
+}
+
+
+class TrackerFilter:
+    def __init__(
+        self,
+        disabled_kinds: Iterable[HandlerKind] = (),
+        min_levels: Optional[Mapping[Any, int]] = None,
+        levels: Optional[Mapping[Hashable, int]] = None,
+        allow: Optional[Iterable[Hashable]] = None,
+        deny: Iterable[Hashable] = (),
+    ):
+        self.disabled_kinds = frozenset(disabled_kinds)
+        self.min_levels = dict(min_levels or {})
+        self.levels = dict(levels or {})
+        self.allow: Optional[FrozenSet[Hashable]] = (
+            None if allow is None else frozenset(allow)
+        )
+        self.deny = frozenset(deny)
+
+    @property
+    def keys(self) -> FrozenSet[Hashable]:
+        return frozenset(self.levels) | (self.allow or frozenset()) | self.deny
+
+    def level(self, kind: HandlerKind, key: Hashable) -> int:
+        for candidate in _candidates(key):
+            if candidate in self.levels:
+                return self.levels[candidate]
+
+        return DEFAULT_LEVELS[kind]
+
+    def allows(self, kind: HandlerKind, key: Hashable) -> bool:
+        if kind in self.disabled_kinds or _matches(key, self.deny):
+            return False
+
+        return self.allow is None or _matches(key, self.allow)
+
+    def allows_handler(self, handler: Any, level: int) -> bool:
+        return level >= self.min_levels.get(handler, logging.NOTSET)
+
+
+def _candidates(key: Hashable) -> Iterable[Hashable]:
+    # Exceptions are keyed by type, so rules set on a base class also cover
+    # its subclasses.
+    if isinstance(key, type):
+        return key.__mro__
+
+    return (key,)
+
+
+def _matches(key: Hashable, keys: FrozenSet[Hashable]) -> bool:
+    return any(candidate in keys for candidate in _candidates(key))
@@ -0,0 +1,19 @@
+import os
+import weakref
+from typing import Callable
+
+
+def register_after_fork(method: Callable[[], None]):
+    # Threads, locks held by other threads and open connections don't
+    # survive fork() in a usable state, so objects owning them rebuild
+    # them in the child. A weak reference keeps the registration from
+    # pinning the object for the rest of the process.
+    reference = weakref.WeakMethod(method)
+
+    def after_in_child():
+        bound = reference()
+
+        if bound is not None:
+            bound()
+
+    os.register_at_fork(after_in_child=after_in_child)
@@ -0,0 +1,119 @@
+import json
+import logging
+import math
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+Encoder = Callable[[Any], str]
+
+_json_encode = json.JSONEncoder(
+    separators=(",", ":"), default=str, check_circular=False
+).encode
+
+
+def _encode_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _encode_none(value: None) -> str:
+    return "null"
+
+
+def _encode_float(value: float) -> str:
+    # float.__repr__ gives nan/inf, which no JSON parser accepts; null is
+    # also what orjson writes for them.
+    return float.__repr__(value) if math.isfinite(value) else "null"
+
+
+_PRIMITIVE_ENCODERS: Dict[type, Encoder] = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: _encode_bool,
+    type(None): _encode_none,
+}
+
+
+def encode_tags(tags: Mapping[str, Any]) -> str:
+    encoders = _PRIMITIVE_ENCODERS
+    parts = []
+
+    for key, value in tags.items():
+        encoder = encoders.get(type(value), _json_encode)
+        parts.append(f"{encode_basestring_ascii(key)}:{encoder(value)}")
+
+    return "{" + ",".join(parts) + "}"
+
+
+def encode_contexts(contexts: Mapping[str, Any]) -> str:
+    return _json_encode(contexts)
+
+
+def _orjson_encode(value: Any) -> str:
+    return orjson.dumps(value, default=str).decode()
+
+
+class _IdentityCache:
+    # Ambient scopes hand out the same flattened mapping to every record
+    # until they change, so identity is enough to reuse the encoded form.
+    __slots__ = ("encoder", "_last")
+
+    def __init__(self, encoder: Encoder):
+        self.encoder = encoder
+        self._last: Tuple[Any, str] = (None, "{}")
+
+    def encode(self, value: Mapping[str, Any]) -> str:
+        last_value, last_encoded = self._last
+
+        if value is last_value:
+            return last_encoded
+
+        encoded = self.encoder(value)
+        self._last = (value, encoded)
+        return encoded
+
+
+class TrackerJSONFormatter(logging.Formatter):
+    def __init__(self, use_orjson: bool = True, datefmt: Optional[str] = None):
+        super().__init__(datefmt=datefmt)
+        self.use_orjson = use_orjson and orjson is not None
+
+        if self.use_orjson:
+            self._encode = _orjson_encode
+            self._tags = _IdentityCache(_orjson_encode)
+            self._contexts = _IdentityCache(_orjson_encode)
+        else:
+            self._encode = _json_encode
+            self._tags = _IdentityCache(encode_tags)
+            self._contexts = _IdentityCache(encode_contexts)
+
+    def format(self, record: logging.LogRecord) -> str:
+        encode = self._encode
+        parts = [
+            f'"timestamp":{encode(self.formatTime(record, self.datefmt))}',
+            f'"level":{encode(record.levelname)}',
+            f'"logger":{encode(record.name)}',
+            f'"message":{encode(record.getMessage())}',
+        ]
+
+        tags = getattr(record, "tags", None)
+        if tags is not None:
+            parts.append(f'"tags":{self._tags.encode(tags)}')
+
+        contexts = getattr(record, "contexts", None)
+        if contexts is not None:
+            parts.append(f'"contexts":{self._contexts.encode(contexts)}')
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+
+        if record.exc_text:
+            parts.append(f'"exception":{encode(record.exc_text)}')
+
+        return "{" + ",".join(parts) + "}"
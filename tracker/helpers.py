@@ -1,2 +1,37 @@
+import dataclasses
+from typing import Any, Dict, Type, TypeVar
+
+T = TypeVar("T")
+
+
 def default_dict() -> dict:
     return {}
+
+
+def add_slots(cls: Type[T]) -> Type[T]:
+    # Backport of dataclass(slots=True), which only exists from Python 3.10.
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = field_names
+
+    for name in field_names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+
+    if getattr(cls, "__dataclass_params__").frozen:
+        # Frozen instances can't be restored through setattr when unpickled.
+        slotted.__getstate__ = _frozen_getstate
+        slotted.__setstate__ = _frozen_setstate
+
+    return slotted
+
+
+def _frozen_getstate(self) -> Dict[str, Any]:
+    return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+
+
+def _frozen_setstate(self, state: Dict[str, Any]):
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import ContextManager, Hashable, List, Optional
 
 from .dtos import TrackerEvent, TrackerException, TrackerMessage
+from .metrics import CircuitStats, QueueStats
 from .types import Contexts, Tags
 
 
@@ -11,6 +14,12 @@ class ISetMixin(ABC):
     @abstractmethod
     def set_contexts(self, contexts: Contexts): ...
 
+    def scope(self) -> ContextManager[None]:
+        return nullcontext()
+
+    def shared_core(self) -> Hashable:
+        return self
+
 
 class ITrackerHandlerException(ISetMixin, ABC):
     @abstractmethod
@@ -25,3 +34,48 @@ class ITrackerHandlerMessage(ISetMixin, ABC):
 class ITrackerHandlerEvent(ISetMixin, ABC):
     @abstractmethod
     def capture_event(self, tracker_event: TrackerEvent): ...
+
+
+class ITrackerHandlerExceptionBatch(ABC):
+    @abstractmethod
+    def capture_exceptions_batch(self, tracker_exceptions: List[TrackerException]): ...
+
+
+class ITrackerHandlerMessageBatch(ABC):
+    @abstractmethod
+    def capture_messages_batch(self, tracker_messages: List[TrackerMessage]): ...
+
+
+class ITrackerHandlerEventBatch(ABC):
+    @abstractmethod
+    def capture_events_batch(self, tracker_events: List[TrackerEvent]): ...
+
+
+class IAsyncTrackerHandlerException(ISetMixin, ABC):
+    @abstractmethod
+    async def capture_exception(self, tracker_exception: TrackerException): ...
+
+
+class IAsyncTrackerHandlerMessage(ISetMixin, ABC):
+    @abstractmethod
+    async def capture_message(self, tracker_message: TrackerMessage): ...
+
+
+class IAsyncTrackerHandlerEvent(ISetMixin, ABC):
+    @abstractmethod
+    async def capture_event(self, tracker_event: TrackerEvent): ...
+
+
+class ITrackerSampler(ABC):
+    @abstractmethod
+    def should_sample(self, key: Hashable, tags: Optional[Tags]) -> bool: ...
+
+
+class IQueueReporter(ABC):
+    @abstractmethod
+    def queue_stats(self) -> Optional[QueueStats]: ...
+
+
+class ICircuitReporter(ABC):
+    @abstractmethod
+    def circuit_stats(self) -> CircuitStats: ...
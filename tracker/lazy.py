@@ -0,0 +1,109 @@
+import dataclasses
+import threading
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Mapping, Optional
+
+_UNRESOLVED = object()
+
+# While one emit is dispatched, bare callables found in ambient scopes
+# (set_tags/set_contexts) resolve once and are shared by every handler,
+# keyed by id(): the scopes keep them alive for the whole emit.
+_shared_values: ContextVar[Optional[Dict[int, "LazyContext"]]] = ContextVar(
+    "shared_values", default=None
+)
+
+
+class LazyContext:
+    __slots__ = ("factory", "_value", "_lock")
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+        self._value: Any = _UNRESOLVED
+        self._lock = threading.Lock()
+
+    def __call__(self) -> Any:
+        # Handlers offloaded to threads (AsyncTracker) may resolve the same
+        # value concurrently; the factory still runs once.
+        if self._value is _UNRESOLVED:
+            with self._lock:
+                if self._value is _UNRESOLVED:
+                    self._value = self.factory()
+
+        return self._value
+
+    def __repr__(self) -> str:
+        return f"LazyContext({self.factory!r})"
+
+
+def resolve(value: Any) -> Any:
+    return value() if callable(value) else value
+
+
+def resolve_mapping(values: Any) -> Optional[Mapping[str, Any]]:
+    values = resolve(values)
+
+    if not values or not any(map(callable, values.values())):
+        return values
+
+    shared = _shared_values.get()
+
+    if shared is None:
+        return {key: resolve(value) for key, value in values.items()}
+
+    return {
+        key: _resolve_shared(shared, value) if callable(value) else value
+        for key, value in values.items()
+    }
+
+
+def share_resolutions() -> Token:
+    return _shared_values.set({})
+
+
+def end_shared_resolutions(token: Token):
+    _shared_values.reset(token)
+
+
+def _resolve_shared(shared: Dict[int, "LazyContext"], factory: Any) -> Any:
+    if type(factory) is LazyContext:
+        return factory()
+
+    lazy = shared.get(id(factory))
+
+    if lazy is None:
+        lazy = shared.setdefault(id(factory), LazyContext(factory))
+
+    return lazy()
+
+
+def memoized(item: Any) -> Any:
+    # Bare callables would run once per handler; wrapping them for the
+    # duration of one emit makes every handler share a single result.
+    tags = _memoize(item.tags)
+    contexts = _memoize(item.contexts)
+
+    if tags is item.tags and contexts is item.contexts:
+        return item
+
+    return dataclasses.replace(item, tags=tags, contexts=contexts)
+
+
+def _memoize(values: Any) -> Any:
+    if callable(values):
+        return _once(values)
+
+    if not values or not any(map(callable, values.values())):
+        return values
+
+    if all(type(value) is LazyContext for value in values.values() if callable(value)):
+        # Already memoized, e.g. before sampling.
+        return values
+
+    memoized_values: Dict[str, Any] = {
+        key: _once(value) if callable(value) else value for key, value in values.items()
+    }
+    return memoized_values
+
+
+def _once(factory: Callable[[], Any]) -> LazyContext:
+    return factory if type(factory) is LazyContext else LazyContext(factory)
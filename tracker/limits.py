@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+TRUNCATED_KEY = "_truncated"
+STRING_MARKER = "...[truncated]"
+DEPTH_MARKER = "[max depth]"
+
+_SCALARS = frozenset({int, float, bool, type(None)})
+
+
+class ContextLimiter:
+    @dataclass
+    class LimiterConfig:
+        max_depth: int = 8
+        max_string_length: int = 8192
+        max_items: int = 100
+        max_bytes: int = 64 * 1024
+
+    def __init__(self, config: LimiterConfig):
+        self.config = config
+        self.truncated_events = 0
+
+    def limit(
+        self, contexts: Optional[Mapping[str, Any]]
+    ) -> Optional[Mapping[str, Any]]:
+        if not contexts:
+            return contexts
+
+        walk = _Walk(self.config)
+        limited = walk.mapping(contexts, 1)
+
+        if walk.truncated:
+            self.truncated_events += 1
+
+        return limited
+
+
+class _Walk:
+    # One pass over the payload that tracks the approximate encoded size as
+    # it goes. Containers are copied only once something inside them is cut,
+    # so payloads within limits come back as the same objects.
+    __slots__ = ("config", "remaining", "truncated")
+
+    def __init__(self, config: ContextLimiter.LimiterConfig):
+        self.config = config
+        self.remaining = config.max_bytes
+        self.truncated = False
+
+    def value(self, value: Any, depth: int) -> Any:
+        # Exact type checks first: isinstance against the Mapping ABC is
+        # several times slower and most values are plain builtins.
+        value_type = type(value)
+
+        if value_type is str:
+            return self.string(value)
+
+        if value_type is dict:
+            return self.mapping(value, depth + 1)
+
+        if value_type is list or value_type is tuple:
+            return self.sequence(value, depth + 1)
+
+        if value_type not in _SCALARS:
+            if isinstance(value, str):
+                return self.string(value)
+
+            if isinstance(value, Mapping):
+                return self.mapping(value, depth + 1)
+
+            if isinstance(value, (list, tuple)):
+                return self.sequence(value, depth + 1)
+
+        self.remaining -= len(str(value))
+        return value
+
+    def string(self, value: str) -> str:
+        limit = min(self.config.max_string_length, max(self.remaining, 0))
+        self.remaining -= min(len(value), limit) + 2
+
+        if len(value) <= limit:
+            return value
+
+        self.truncated = True
+        return value[:limit] + STRING_MARKER
+
+    def mapping(self, values: Mapping[str, Any], depth: int) -> Any:
+        if depth > self.config.max_depth:
+            self.truncated = True
+            return DEPTH_MARKER
+
+        limited: Optional[Dict[str, Any]] = None
+
+        for index, (key, value) in enumerate(values.items()):
+            if index >= self.config.max_items or self.remaining <= 0:
+                self.truncated = True
+
+                if limited is None:
+                    limited = dict(islice(values.items(), index))
+
+                limited[TRUNCATED_KEY] = len(values) - index
+                return limited
+
+            self.remaining -= len(key) + 4
+            item = self.value(value, depth)
+
+            if limited is not None:
+                limited[key] = item
+            elif item is not value:
+                limited = dict(islice(values.items(), index))
+                limited[key] = item
+
+        return values if limited is None else limited
+
+    def sequence(self, values: Sequence[Any], depth: int) -> Any:
+        if depth > self.config.max_depth:
+            self.truncated = True
+            return DEPTH_MARKER
+
+        limited: Optional[List[Any]] = None
+
+        for index, value in enumerate(values):
+            if index >= self.config.max_items or self.remaining <= 0:
+                self.truncated = True
+
+                if limited is None:
+                    limited = list(values[:index])
+
+                limited.append(f"...[{len(values) - index} items truncated]")
+                return limited
+
+            self.remaining -= 1
+            item = self.value(value, depth)
+
+            if limited is not None:
+                limited.append(item)
+            elif item is not value:
+                limited = list(values[:index])
+                limited.append(item)
+
+        return values if limited is None else limited
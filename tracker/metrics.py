@@ -0,0 +1,318 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# Log-linear buckets as in HdrHistogram: 2**SUB_BUCKET_BITS buckets per power
+# of two keep the relative error of any recorded latency under 12.5%.
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+MAX_BIT_LENGTH = 40  # ~18 minutes in nanoseconds; anything slower is clamped
+BUCKET_COUNT = (MAX_BIT_LENGTH - SUB_BUCKET_BITS + 1) * SUB_BUCKETS
+
+PROMETHEUS_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CIRCUIT_STATES = ("closed", "open", "half_open")
+
+
+def bucket_index(value: int) -> int:
+    bit_length = value.bit_length()
+
+    if bit_length <= SUB_BUCKET_BITS + 1:
+        return value
+
+    if bit_length > MAX_BIT_LENGTH:
+        return BUCKET_COUNT - 1
+
+    shift = bit_length - SUB_BUCKET_BITS - 1
+    return (bit_length - SUB_BUCKET_BITS) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+
+def bucket_upper_bound(index: int) -> int:
+    if index < 2 * SUB_BUCKETS:
+        return index
+
+    bit_length = index // SUB_BUCKETS + SUB_BUCKET_BITS
+    mantissa = SUB_BUCKETS + index % SUB_BUCKETS
+    shift = bit_length - SUB_BUCKET_BITS - 1
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int):
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram"):
+        counts = self.counts
+
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> int:
+        if not self.count:
+            return 0
+
+        threshold = max(1, round(self.count * percentile / 100))
+        seen = 0
+
+        for index, count in enumerate(self.counts):
+            seen += count
+
+            if seen >= threshold:
+                return min(bucket_upper_bound(index), self.max)
+
+        return self.max  # pragma: no cover
+
+    def count_at_or_below(self, value: int) -> int:
+        return sum(
+            count
+            for index, count in enumerate(self.counts)
+            if count and bucket_upper_bound(index) <= value
+        )
+
+
+class _Series:
+    __slots__ = ("calls", "errors", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+
+SeriesKey = Tuple[str, Any]
+
+
+@dataclass(frozen=True)
+class HandlerStats:
+    kind: str
+    handler: Any
+    calls: int
+    errors: int
+    latency: LatencyHistogram
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    name: str
+    depth: int
+    dropped: int
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    name: str
+    state: str
+    failures: int
+    short_circuited: int
+
+
+@dataclass(frozen=True)
+class TrackerStats:
+    handlers: List[HandlerStats] = field(default_factory=list)
+    queues: List[QueueStats] = field(default_factory=list)
+    circuits: List[CircuitStats] = field(default_factory=list)
+
+
+class TrackerMetrics:
+    def __init__(self):
+        # Each thread records into its own shard, so the emit path never
+        # takes a lock; snapshot() merges the shards.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, Dict[SeriesKey, _Series]]] = []
+        # Totals of threads that have exited, whose shards are dropped.
+        self._retired: Dict[SeriesKey, _Series] = {}
+
+    def instrument(
+        self, kind: str, handler: Any, capture: Callable[[Any], None]
+    ) -> Callable[[Any], None]:
+        key = (kind, handler)
+        clock = time.perf_counter_ns
+
+        def timed_capture(item: Any):
+            series = self._series(key)
+            started = clock()
+
+            try:
+                capture(item)
+            except Exception:
+                series.errors += 1
+                raise
+            finally:
+                series.calls += 1
+                series.latency.record(clock() - started)
+
+        return timed_capture
+
+    def snapshot(self) -> List[HandlerStats]:
+        merged: Dict[SeriesKey, _Series] = {}
+
+        with self._lock:
+            # A thread seen dead can't record again, so its shard is folded
+            # into the retired totals and dropped.
+            live = []
+
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    live.append((thread, shard))
+                else:
+                    _merge_series(self._retired, shard)
+
+            self._shards = live
+            _merge_series(merged, self._retired)
+
+        for _, shard in live:
+            _merge_series(merged, shard)
+
+        return [
+            HandlerStats(
+                kind=kind,
+                handler=handler,
+                calls=series.calls,
+                errors=series.errors,
+                latency=series.latency,
+            )
+            for (kind, handler), series in merged.items()
+        ]
+
+    def _series(self, key: SeriesKey) -> _Series:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+
+        series = shard.get(key)
+
+        if series is None:
+            series = shard[key] = _Series()
+
+        return series
+
+
+def _merge_series(merged: Dict[SeriesKey, _Series], shard: Dict[SeriesKey, _Series]):
+    for key, series in list(shard.items()):
+        total = merged.setdefault(key, _Series())
+        total.calls += series.calls
+        total.errors += series.errors
+        total.latency.merge(series.latency)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def render_prometheus(
+    stats: TrackerStats,
+    namespace: str = "tracker",
+    buckets: Iterable[float] = PROMETHEUS_BUCKETS,
+) -> str:
+    # Series are labelled by handler class, so handlers of the same type
+    # and kind are reported together.
+    grouped: Dict[Tuple[str, str], _Series] = {}
+
+    for handler_stats in stats.handlers:
+        key = (handler_stats.kind, type(handler_stats.handler).__name__)
+        series = grouped.setdefault(key, _Series())
+        series.calls += handler_stats.calls
+        series.errors += handler_stats.errors
+        series.latency.merge(handler_stats.latency)
+
+    calls = f"{namespace}_handler_calls_total"
+    errors = f"{namespace}_handler_errors_total"
+    latency = f"{namespace}_handler_latency_seconds"
+    depth = f"{namespace}_queue_depth"
+    dropped = f"{namespace}_queue_dropped_total"
+    circuit_state = f"{namespace}_circuit_state"
+    short_circuited = f"{namespace}_circuit_short_circuited_total"
+
+    lines = [f"# TYPE {calls} counter"]
+    lines.extend(
+        f"{calls}{_labels(kind=kind, handler=name)} {series.calls}"
+        for (kind, name), series in grouped.items()
+    )
+    lines.append(f"# TYPE {errors} counter")
+    lines.extend(
+        f"{errors}{_labels(kind=kind, handler=name)} {series.errors}"
+        for (kind, name), series in grouped.items()
+    )
+    lines.append(f"# TYPE {latency} histogram")
+
+    for (kind, name), series in grouped.items():
+        for bound in buckets:
+            cumulative = series.latency.count_at_or_below(int(bound * 1e9))
+            labels = _labels(kind=kind, handler=name, le=repr(bound))
+            lines.append(f"{latency}_bucket{labels} {cumulative}")
+
+        labels = _labels(kind=kind, handler=name, le="+Inf")
+        lines.append(f"{latency}_bucket{labels} {series.latency.count}")
+        labels = _labels(kind=kind, handler=name)
+        lines.append(f"{latency}_sum{labels} {series.latency.total / 1e9!r}")
+        lines.append(f"{latency}_count{labels} {series.latency.count}")
+
+    lines.append(f"# TYPE {depth} gauge")
+    lines.extend(
+        f"{depth}{_labels(queue=queue.name)} {queue.depth}" for queue in stats.queues
+    )
+    lines.append(f"# TYPE {dropped} counter")
+    lines.extend(
+        f"{dropped}{_labels(queue=queue.name)} {queue.dropped}"
+        for queue in stats.queues
+    )
+
+    lines.append(f"# TYPE {circuit_state} gauge")
+    lines.extend(
+        f"{circuit_state}{_labels(handler=circuit.name, state=state)} "
+        f"{int(circuit.state == state)}"
+        for circuit in stats.circuits
+        for state in CIRCUIT_STATES
+    )
+    lines.append(f"# TYPE {short_circuited} counter")
+    lines.extend(
+        f"{short_circuited}{_labels(handler=circuit.name)} {circuit.short_circuited}"
+        for circuit in stats.circuits
+    )
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,216 @@
+import contextlib
+import dataclasses
+import logging
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from .core import Tracker
+from .dtos import TrackerEvent, TrackerException, TrackerMessage
+from .forking import register_after_fork
+from .interfaces import (
+    IQueueReporter,
+    ITrackerHandlerEvent,
+    ITrackerHandlerException,
+    ITrackerHandlerMessage,
+)
+from .lazy import resolve
+from .metrics import QueueStats
+from .scopes import EMPTY_SCOPE, Scope
+from .serialization import (
+    EVENT,
+    MESSAGE,
+    TrackerItem,
+    deserialize,
+    kind_of,
+    serialize,
+)
+from .types import Contexts, Tags
+
+logger = logging.getLogger(__name__)
+
+# Largest serialized record a worker sends and the collector accepts; both
+# ends default to it so a record is never silently truncated in between.
+MAX_RECORD_SIZE = 65536
+
+_forwarded_tags: ContextVar[Scope] = ContextVar("forwarded_tags", default=EMPTY_SCOPE)
+_forwarded_contexts: ContextVar[Scope] = ContextVar(
+    "forwarded_contexts", default=EMPTY_SCOPE
+)
+
+
+class ForwardingHandler(
+    ITrackerHandlerEvent,
+    ITrackerHandlerMessage,
+    ITrackerHandlerException,
+    IQueueReporter,
+):
+    @dataclass
+    class ForwardingConfig:
+        socket_path: str
+        max_record_size: int = MAX_RECORD_SIZE
+
+    def __init__(self, config: ForwardingConfig):
+        self.config = config
+        self.dropped = 0
+        self.oversized = 0
+        self._open_socket()
+        register_after_fork(self._open_socket)
+
+    def queue_stats(self) -> QueueStats:
+        return QueueStats(name=type(self).__name__, depth=0, dropped=self.dropped)
+
+    def set_tags(self, tags: Tags):
+        _forwarded_tags.set(_forwarded_tags.get().push(tags))
+
+    def set_contexts(self, contexts: Contexts):
+        _forwarded_contexts.set(_forwarded_contexts.get().push(contexts))
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        tags_token = _forwarded_tags.set(_forwarded_tags.get())
+        contexts_token = _forwarded_contexts.set(_forwarded_contexts.get())
+
+        try:
+            yield
+        finally:
+            _forwarded_contexts.reset(contexts_token)
+            _forwarded_tags.reset(tags_token)
+
+    def capture_event(self, tracker_event: TrackerEvent):
+        self._send(tracker_event)
+
+    def capture_message(self, tracker_message: TrackerMessage):
+        self._send(tracker_message)
+
+    def capture_exception(self, tracker_exception: TrackerException):
+        self._send(tracker_exception)
+
+    def close(self):
+        self._socket.close()
+
+    def _open_socket(self):
+        # A forked child gets its own socket instead of sharing the parent's.
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def _send(self, item: TrackerItem):
+        # Ambient tags and contexts only exist in this process, so they are
+        # merged into the item before it leaves.
+        item = dataclasses.replace(
+            item,
+            tags=_forwarded_tags.get().merged(resolve(item.tags)),
+            contexts=_forwarded_contexts.get().merged(resolve(item.contexts)),
+        )
+
+        data = serialize(item)
+
+        if len(data) > self.config.max_record_size:
+            self.oversized += 1
+            self.dropped += 1
+            return
+
+        try:
+            self._socket.sendto(data, self.config.socket_path)
+        except OSError:
+            # Collector down or its buffer full: the worker must never block
+            # on telemetry.
+            self.dropped += 1
+
+
+class TrackerCollector:
+    @dataclass
+    class CollectorConfig:
+        socket_path: str
+        max_record_size: int = MAX_RECORD_SIZE
+        receive_buffer_size: Optional[int] = None
+        poll_interval: float = 0.5
+        socket_mode: int = 0o600
+
+    def __init__(self, tracker: Tracker, config: CollectorConfig):
+        self.tracker = tracker
+        self.config = config
+        self.received = 0
+        self.errors = 0
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(config.socket_path)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+        if config.receive_buffer_size:
+            self._socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, config.receive_buffer_size
+            )
+
+        # Records are decoded and emitted as they arrive, so only the allowed
+        # users may send them: the socket gets its mode under a temporary
+        # name and only then appears at socket_path.
+        temporary = f"{config.socket_path}.{os.getpid()}.tmp"
+
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temporary)
+
+        self._socket.bind(temporary)
+        os.chmod(temporary, config.socket_mode)
+        os.replace(temporary, config.socket_path)
+        self._socket.settimeout(config.poll_interval)
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="Tracker.TrackerCollector", daemon=True
+        )
+        self._thread.start()
+
+    def serve_forever(self):
+        while not self._stopped.is_set():
+            try:
+                # One extra byte tells an oversized datagram apart from one
+                # that fits exactly, instead of decoding a truncated record.
+                data = self._socket.recv(self.config.max_record_size + 1)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+
+            self.received += 1
+
+            if len(data) > self.config.max_record_size:
+                self.errors += 1
+                logger.error(
+                    f"Dropped record larger than {self.config.max_record_size} bytes"
+                )
+                continue
+
+            try:
+                self._emit(deserialize(data))
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Error decoding record from worker: {e}")
+
+    def close(self, timeout: Optional[float] = None):
+        self._stopped.set()
+
+        if self._thread:
+            self._thread.join(timeout)
+
+        self._socket.close()
+
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.config.socket_path)
+
+    def _emit(self, item: TrackerItem):
+        kind = kind_of(item)
+
+        if kind == EVENT:
+            self.tracker.emit_event(item)
+        elif kind == MESSAGE:
+            self.tracker.emit_message(item)
+        else:
+            self.tracker.emit_exception(item)
@@ -0,0 +1,175 @@
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .interfaces import (
+    ISetMixin,
+    ITrackerHandlerEvent,
+    ITrackerHandlerException,
+    ITrackerHandlerMessage,
+)
+
+if TYPE_CHECKING:
+    from .filtering import TrackerFilter
+
+Capture = Callable[[Any], None]
+Route = Tuple[Any, Capture]
+Instrument = Callable[[str, Any, Capture], Capture]
+
+
+class HandlerKind(Enum):
+    EXCEPTION = "exception"
+    MESSAGE = "message"
+    EVENT = "event"
+
+
+def unique_by_core(handlers: Iterable[ISetMixin]) -> Tuple[ISetMixin, ...]:
+    # Handlers sharing a core (e.g. both Sentry handlers over one SentryCore)
+    # would apply the same tags, contexts and scope once per handler.
+    unique: Dict[Hashable, ISetMixin] = {}
+
+    for handler in handlers:
+        unique.setdefault(handler.shared_core(), handler)
+
+    return tuple(unique.values())
+
+
+class DispatchPlan:
+    __slots__ = (
+        "exception_handlers",
+        "message_handlers",
+        "event_handlers",
+        "exception_routes",
+        "message_routes",
+        "event_routes",
+        "exception_table",
+        "message_table",
+        "event_table",
+        "tables",
+        "set_targets",
+        "instrument",
+        "filters",
+    )
+
+    def __init__(
+        self,
+        exception_handlers: Sequence[ITrackerHandlerException] = (),
+        message_handlers: Sequence[ITrackerHandlerMessage] = (),
+        event_handlers: Sequence[ITrackerHandlerEvent] = (),
+        instrument: Optional[Instrument] = None,
+        filters: Optional["TrackerFilter"] = None,
+    ):
+        self.exception_handlers = tuple(exception_handlers)
+        self.message_handlers = tuple(message_handlers)
+        self.event_handlers = tuple(event_handlers)
+        self.instrument = instrument
+        self.filters = filters
+
+        # Capture methods are bound once here instead of on every emit.
+        self.exception_routes = self.__routes(
+            HandlerKind.EXCEPTION, self.exception_handlers, "capture_exception"
+        )
+        self.message_routes = self.__routes(
+            HandlerKind.MESSAGE, self.message_handlers, "capture_message"
+        )
+        self.event_routes = self.__routes(
+            HandlerKind.EVENT, self.event_handlers, "capture_event"
+        )
+        self.set_targets = unique_by_core(
+            self.event_handlers + self.exception_handlers + self.message_handlers
+        )
+
+        # Routes per enum member (or exception type) after filtering, so an
+        # emit costs one dict lookup; keys the filters don't name are filled
+        # in on first use.
+        self.exception_table: Dict[Hashable, Tuple[Route, ...]] = {}
+        self.message_table: Dict[Hashable, Tuple[Route, ...]] = {}
+        self.event_table: Dict[Hashable, Tuple[Route, ...]] = {}
+        self.tables = {
+            HandlerKind.EXCEPTION: self.exception_table,
+            HandlerKind.MESSAGE: self.message_table,
+            HandlerKind.EVENT: self.event_table,
+        }
+
+        for key in filters.keys if filters else ():
+            kinds = (
+                (HandlerKind.EXCEPTION,)
+                if isinstance(key, type)
+                else (HandlerKind.MESSAGE, HandlerKind.EVENT)
+            )
+
+            for kind in kinds:
+                self.routes_for(kind, key)
+
+    def handlers(self, kind: HandlerKind) -> Tuple[Any, ...]:
+        return getattr(self, f"{kind.value}_handlers")
+
+    def routes_for(self, kind: HandlerKind, key: Hashable) -> Tuple[Route, ...]:
+        table = self.tables[kind]
+        routes = table.get(key)
+
+        if routes is None:
+            routes = table[key] = self.__filtered_routes(kind, key)
+
+        return routes
+
+    def with_handler(self, kind: HandlerKind, handler: Any) -> "DispatchPlan":
+        return self.__replace(kind, self.handlers(kind) + (handler,))
+
+    def without_handler(self, kind: HandlerKind, handler: Any) -> "DispatchPlan":
+        handlers = self.handlers(kind)
+
+        if handler not in handlers:
+            raise ValueError(f"{handler} is not a registered {kind.value} handler")
+
+        remaining = list(handlers)
+        remaining.remove(handler)
+        return self.__replace(kind, tuple(remaining))
+
+    def __routes(
+        self, kind: HandlerKind, handlers: Tuple[Any, ...], method: str
+    ) -> Tuple[Route, ...]:
+        routes = []
+
+        for handler in handlers:
+            capture = getattr(handler, method)
+
+            if self.instrument:
+                capture = self.instrument(kind.value, handler, capture)
+
+            routes.append((handler, capture))
+
+        return tuple(routes)
+
+    def __filtered_routes(self, kind: HandlerKind, key: Hashable) -> Tuple[Route, ...]:
+        routes: Tuple[Route, ...] = getattr(self, f"{kind.value}_routes")
+        filters = self.filters
+
+        if filters is None:
+            return routes
+
+        if not filters.allows(kind, key):
+            return ()
+
+        level = filters.level(kind, key)
+        return tuple(
+            route for route in routes if filters.allows_handler(route[0], level)
+        )
+
+    def __replace(self, kind: HandlerKind, handlers: Tuple[Any, ...]) -> "DispatchPlan":
+        current = {
+            "exception_handlers": self.exception_handlers,
+            "message_handlers": self.message_handlers,
+            "event_handlers": self.event_handlers,
+        }
+        current[f"{kind.value}_handlers"] = handlers
+        return DispatchPlan(**current, instrument=self.instrument, filters=self.filters)
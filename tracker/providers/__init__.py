@@ -1,17 +1,55 @@
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from .logger import (
     LoggerCore,
     LoggerEventHandler,
     LoggerExceptionHandler,
     LoggerMessageHandler,
 )
-from .sentry import SentryCore, SentryExceptionHandler, SentryMessageHandler
+
+if TYPE_CHECKING:
+    from .http import HttpCore, HttpEventHandler, PayloadFormat
+    from .sentry import (
+        SentryCore,
+        SentryEventHandler,
+        SentryExceptionHandler,
+        SentryMessageHandler,
+    )
+
+_LAZY_IMPORTS: Dict[str, str] = {
+    "HttpCore": ".http",
+    "HttpEventHandler": ".http",
+    "PayloadFormat": ".http",
+    "SentryCore": ".sentry",
+    "SentryEventHandler": ".sentry",
+    "SentryExceptionHandler": ".sentry",
+    "SentryMessageHandler": ".sentry",
+}
 
 __all__ = [
     "SentryCore",
+    "SentryEventHandler",
     "SentryMessageHandler",
     "SentryExceptionHandler",
     "LoggerCore",
     "LoggerMessageHandler",
     "LoggerExceptionHandler",
     "LoggerEventHandler",
+    "HttpCore",
+    "HttpEventHandler",
+    "PayloadFormat",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,477 @@
+import atexit
+import email.utils
+import gzip
+import http.client
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
+
+from ..dtos import TrackerEvent
+from ..forking import register_after_fork
+from ..interfaces import (
+    IQueueReporter,
+    ITrackerHandlerEvent,
+    ITrackerHandlerEventBatch,
+)
+from ..lazy import resolve, resolve_mapping
+from ..metrics import QueueStats
+from ..registry import enum_value
+from ..scopes import EMPTY_SCOPE, Scope
+from ..types import Contexts, Tags
+
+logger = logging.getLogger(__name__)
+
+_http_tags: ContextVar[Scope] = ContextVar("http_tags", default=EMPTY_SCOPE)
+_http_contexts: ContextVar[Scope] = ContextVar("http_contexts", default=EMPTY_SCOPE)
+
+_STOP = object()
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# time.time() stamp, event value, tags, contexts.
+Record = Tuple[float, Any, Mapping[str, Any], Mapping[str, Any]]
+
+_encode = json.JSONEncoder(
+    separators=(",", ":"), default=str, check_circular=False
+).encode
+
+
+class PayloadFormat(Enum):
+    NDJSON = "ndjson"
+    OTLP = "otlp"
+
+
+class ExportError(Exception):
+    def __init__(
+        self, message: str, retryable: bool = True, retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def encode_ndjson(records: List[Record]) -> bytes:
+    return "".join(
+        _encode(
+            {"timestamp": timestamp, "event": event, "tags": tags, "contexts": contexts}
+        )
+        + "\n"
+        for timestamp, event, tags, contexts in records
+    ).encode()
+
+
+def encode_otlp(records: List[Record], service_name: Optional[str] = None) -> bytes:
+    resource = (
+        {"attributes": [_attribute("service.name", service_name)]}
+        if service_name
+        else {}
+    )
+    log_records = [
+        {
+            "timeUnixNano": str(int(timestamp * 1e9)),
+            "severityNumber": 9,
+            "severityText": "INFO",
+            "body": _any_value(event),
+            "attributes": [_attribute(key, value) for key, value in tags.items()]
+            + [
+                _attribute(f"context.{name}", context)
+                for name, context in contexts.items()
+            ],
+        }
+        for timestamp, event, tags, contexts in records
+    ]
+    return _encode(
+        {
+            "resourceLogs": [
+                {
+                    "resource": resource,
+                    "scopeLogs": [
+                        {"scope": {"name": "tracker"}, "logRecords": log_records}
+                    ],
+                }
+            ]
+        }
+    ).encode()
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    return {"key": key, "value": _any_value(value)}
+
+
+def _any_value(value: Any) -> Dict[str, Any]:
+    # OTLP/JSON AnyValue; bool is checked before int since it subclasses it,
+    # and 64-bit integers are strings per the protobuf JSON mapping.
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if value is None:
+        return {}
+    if isinstance(value, Mapping):
+        return {
+            "kvlistValue": {
+                "values": [_attribute(str(key), item) for key, item in value.items()]
+            }
+        }
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_any_value(item) for item in value]}}
+    return {"stringValue": str(value)}
+
+
+def _retryable(error: Exception) -> bool:
+    return not isinstance(error, ExportError) or error.retryable
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class ConnectionPool:
+    def __init__(self, url: str, size: int, timeout: float):
+        parts = urlsplit(url)
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._connection_class = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._timeout = timeout
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(
+            size
+        )
+
+    @contextmanager
+    def connection(self) -> Iterator[http.client.HTTPConnection]:
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._connection_class(
+                self._host, self._port, timeout=self._timeout
+            )
+
+        try:
+            yield connection
+        except BaseException:
+            # The connection may be mid-response; it can't be reused.
+            connection.close()
+            raise
+
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class HttpCore(IQueueReporter):
+    @dataclass
+    class HttpConfig:
+        url: str
+        headers: Optional[Dict[str, str]] = None
+        payload_format: PayloadFormat = PayloadFormat.NDJSON
+        service_name: Optional[str] = None
+        compress: bool = True
+        compression_level: int = 6
+        max_batch_size: int = 500
+        max_batch_age: float = 1.0
+        max_queue_size: int = 10000
+        workers: int = 1
+        timeout: float = 10.0
+        max_retries: int = 5
+        backoff_base: float = 0.5
+        backoff_max: float = 30.0
+
+    def __init__(self, config: HttpConfig):
+        self.config = config
+        self.dropped = 0
+        self.exported = 0
+        self._closed = False
+        self._closing = threading.Event()
+        self._headers = self._build_headers()
+        self._start()
+        atexit.register(self.close)
+        register_after_fork(self._restart)
+
+    def queue_stats(self) -> QueueStats:
+        return QueueStats(
+            name=type(self).__name__, depth=self._queue.qsize(), dropped=self.dropped
+        )
+
+    def set_tags(self, tags: Tags):
+        _http_tags.set(_http_tags.get().push(tags))
+
+    def set_contexts(self, contexts: Contexts):
+        _http_contexts.set(_http_contexts.get().push(contexts))
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        tags_token = _http_tags.set(_http_tags.get())
+        contexts_token = _http_contexts.set(_http_contexts.get())
+
+        try:
+            yield
+        finally:
+            _http_contexts.reset(contexts_token)
+            _http_tags.reset(tags_token)
+
+    def export(self, tracker_event: TrackerEvent):
+        if self._closed:
+            self.dropped += 1
+            return
+
+        # Ambient tags and contexts are read on the caller's thread; encoding
+        # and compression happen on the exporter workers.
+        record = (
+            time.time(),
+            enum_value(tracker_event.event),
+            resolve_mapping(_http_tags.get().merged(resolve(tracker_event.tags))),
+            resolve_mapping(
+                _http_contexts.get().merged(resolve(tracker_event.contexts))
+            ),
+        )
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+
+                if remaining is not None and remaining <= 0:
+                    return False
+
+                self._queue.all_tasks_done.wait(remaining)
+
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0):
+        if self._closed:
+            return
+
+        self._closed = True
+        atexit.unregister(self.close)
+        self.flush(timeout)
+        # Batches still failing at this point get no further retries.
+        self._closing.set()
+
+        for _ in self._workers:
+            self._queue.put(_STOP)
+
+        for worker in self._workers:
+            worker.join(timeout)
+
+        self._pool.close()
+
+    def encode(self, records: List[Record]) -> bytes:
+        if self.config.payload_format is PayloadFormat.OTLP:
+            body = encode_otlp(records, self.config.service_name)
+        else:
+            body = encode_ndjson(records)
+
+        if self.config.compress:
+            body = gzip.compress(body, compresslevel=self.config.compression_level)
+
+        return body
+
+    def send(self, records: List[Record]):
+        body = self.encode(records)
+        attempt = 0
+
+        while True:
+            try:
+                self._post(body)
+                self.exported += len(records)
+                return
+            except (ExportError, OSError, http.client.HTTPException) as e:
+                exhausted = attempt >= self.config.max_retries
+
+                if exhausted or self._closing.is_set() or not _retryable(e):
+                    raise
+
+                retry_after = e.retry_after if isinstance(e, ExportError) else None
+
+                if self._closing.wait(self.retry_delay(attempt, retry_after)):
+                    raise
+
+                attempt += 1
+
+    def retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.config.backoff_max)
+
+        # Full jitter keeps workers of many processes from retrying in step.
+        ceiling = min(self.config.backoff_max, self.config.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def _post(self, body: bytes):
+        with self._pool.connection() as connection:
+            connection.request("POST", self._pool.path, body, self._headers)
+            response = connection.getresponse()
+            # Draining the body is what lets the connection be reused.
+            response.read()
+
+            if response.will_close:
+                connection.close()
+
+        if response.status < 300:
+            return
+
+        raise ExportError(
+            f"HTTP {response.status}",
+            retryable=response.status in RETRYABLE_STATUSES,
+            retry_after=parse_retry_after(response.getheader("Retry-After")),
+        )
+
+    def _build_headers(self) -> Dict[str, str]:
+        headers = {
+            "Content-Type": (
+                "application/json"
+                if self.config.payload_format is PayloadFormat.OTLP
+                else "application/x-ndjson"
+            ),
+            "Connection": "keep-alive",
+        }
+
+        if self.config.compress:
+            headers["Content-Encoding"] = "gzip"
+
+        headers.update(self.config.headers or {})
+        return headers
+
+    def _start(self):
+        self._queue: "queue.Queue[Any]" = queue.Queue(self.config.max_queue_size)
+        self._pool = ConnectionPool(
+            self.config.url, self.config.workers, self.config.timeout
+        )
+        self._workers: List[threading.Thread] = []
+
+        for index in range(self.config.workers):
+            worker = threading.Thread(
+                target=self._run, name=f"Tracker.HttpCore-{index}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _restart(self):
+        # Workers and pooled sockets belong to the parent after fork().
+        if not self._closed:
+            self._start()
+
+    def _run(self):
+        while True:
+            records, stop = self._next_batch()
+
+            if records:
+                try:
+                    self.send(records)
+                except Exception as e:
+                    self.dropped += len(records)
+                    logger.error(
+                        f"Error exporting {len(records)} events "
+                        f"to {self.config.url}: {e}"
+                    )
+
+            for _ in range(len(records) + stop):
+                self._queue.task_done()
+
+            if stop:
+                return
+
+    def _next_batch(self) -> Tuple[List[Record], bool]:
+        first = self._queue.get()
+
+        if first is _STOP:
+            return [], True
+
+        records = [first]
+        deadline = time.monotonic() + self.config.max_batch_age
+
+        while len(records) < self.config.max_batch_size:
+            remaining = deadline - time.monotonic()
+
+            try:
+                record = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+
+            if record is _STOP:
+                return records, True
+
+            records.append(record)
+
+        return records, False
+
+
+class HttpEventHandler(ITrackerHandlerEvent, ITrackerHandlerEventBatch):
+    def __init__(self, core: HttpCore):
+        self.core = core
+
+    def set_tags(self, tags: Tags):
+        self.core.set_tags(tags)
+
+    def set_contexts(self, contexts: Contexts):
+        self.core.set_contexts(contexts)
+
+    def scope(self) -> ContextManager[None]:
+        return self.core.scope()
+
+    def shared_core(self) -> Hashable:
+        return self.core
+
+    def capture_event(self, tracker_event: TrackerEvent):
+        self.core.export(tracker_event)
+
+    def capture_events_batch(self, tracker_events: List[TrackerEvent]):
+        for tracker_event in tracker_events:
+            self.core.export(tracker_event)
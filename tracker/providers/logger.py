@@ -1,48 +1,217 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Optional
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+)
 
 from ..dtos import TrackerEvent, TrackerException, TrackerMessage
-from ..helpers import default_dict
+from ..forking import register_after_fork
 from ..interfaces import (
+    IQueueReporter,
     ITrackerHandlerEvent,
     ITrackerHandlerException,
     ITrackerHandlerMessage,
 )
+from ..lazy import resolve, resolve_mapping
+from ..limits import ContextLimiter
+from ..metrics import QueueStats
+from ..registry import enum_value
+from ..scopes import EMPTY_SCOPE, Scope
+from ..tracebacks import TracebackCache
 from ..types import Contexts, Tags
 
-_logger_tags = ContextVar("logger_tags", default=default_dict)
-_logger_contexts = ContextVar("logger_contexts", default=default_dict)
-
-
-class LoggerCore:
+_logger_tags: ContextVar[Scope] = ContextVar("logger_tags", default=EMPTY_SCOPE)
+_logger_contexts: ContextVar[Scope] = ContextVar("logger_contexts", default=EMPTY_SCOPE)
+_default_formatter = logging.Formatter()
+
+
+class TrackerQueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike the stdlib default, nothing is formatted here: message and
+        # traceback rendering happen on the listener thread.
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class TrackerQueueListener(logging.handlers.QueueListener):
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        traceback_cache: Optional[TracebackCache] = None,
+    ):
+        super().__init__(
+            log_queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.traceback_cache = traceback_cache
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render once so every sink handler reuses the same message and
+        # traceback text instead of formatting them again.
+        record.message = record.getMessage()
+
+        if record.exc_info and not record.exc_text:
+            if self.traceback_cache:
+                record.exc_text = self.traceback_cache.format(record.exc_info)
+            else:
+                formatter = next(
+                    (
+                        handler.formatter
+                        for handler in self.handlers
+                        if handler.formatter
+                    ),
+                    _default_formatter,
+                )
+                record.exc_text = formatter.formatException(record.exc_info)
+
+        return record
+
+
+class LoggerCore(IQueueReporter):
     @dataclass
     class LoggerConfig:
         logger_handler: Optional[logging.Handler] = None
+        formatter: Optional[logging.Formatter] = None
+        non_blocking: bool = False
+        queue_size: int = -1
+        context_limiter: Optional[ContextLimiter] = None
+        traceback_cache: Optional[TracebackCache] = None
 
     def __init__(self, config: LoggerConfig):
         self.logger = logging.getLogger("Tracker.LoggerCore")
+        self.listener: Optional[TrackerQueueListener] = None
+        self.queue_handler: Optional[TrackerQueueHandler] = None
+        self.context_limiter = config.context_limiter
 
         if len(self.logger.handlers):
             # Avoid adding multiple handlers
             return
 
-        if config.logger_handler:
-            self.logger.addHandler(config.logger_handler)
-        else:
-            handler = logging.StreamHandler()
+        handler = config.logger_handler or logging.StreamHandler()
+
+        if config.formatter:
+            handler.setFormatter(config.formatter)
+
+        if config.traceback_cache:
+            # Set exc_text before the formatter would render it again.
+            handler.addFilter(config.traceback_cache)
+
+        if not config.non_blocking:
             self.logger.addHandler(handler)
+            return
+
+        self._start_listener(config.queue_size, (handler,), config.traceback_cache)
+        atexit.register(self.close)
+        register_after_fork(self._restart_listener)
+
+    def _start_listener(
+        self,
+        queue_size: int,
+        handlers: Tuple[logging.Handler, ...],
+        traceback_cache: Optional[TracebackCache] = None,
+    ):
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(queue_size)
+        self.listener = TrackerQueueListener(
+            log_queue,
+            *handlers,
+            respect_handler_level=True,
+            traceback_cache=traceback_cache,
+        )
+        self.listener.start()
+        self.queue_handler = TrackerQueueHandler(log_queue)
+        self.logger.addHandler(self.queue_handler)
+
+    def _restart_listener(self):
+        # The listener thread doesn't exist in a forked child and the queue's
+        # lock may have been held by another thread at fork time. Records
+        # still queued belong to the parent, which delivers them.
+        if self.listener is None or self.queue_handler is None:
+            return
+
+        self.logger.removeHandler(self.queue_handler)
+        self._start_listener(
+            self.queue_handler.queue.maxsize,
+            self.listener.handlers,
+            self.listener.traceback_cache,
+        )
+
+    def close(self):
+        if self.listener is None:
+            return
+
+        atexit.unregister(self.close)
+        self.listener.stop()
+
+        # Records logged after close go straight to the sinks instead of
+        # piling up in a queue nobody drains.
+        self.logger.removeHandler(self.queue_handler)
+        for handler in self.listener.handlers:
+            self.logger.addHandler(handler)
+
+        self.listener = None
+
+    def queue_stats(self) -> Optional[QueueStats]:
+        if self.listener is None or self.queue_handler is None:
+            return None
+
+        return QueueStats(
+            name=type(self).__name__,
+            depth=self.queue_handler.queue.qsize(),
+            dropped=self.queue_handler.dropped,
+        )
 
     def set_tags(self, tags: Tags):
-        temp_logger_tags = _logger_tags.get().copy()
-        temp_logger_tags.update(tags)
-        _logger_tags.set(temp_logger_tags)
+        _logger_tags.set(_logger_tags.get().push(tags))
 
     def set_contexts(self, contexts: Contexts):
-        temp_logger_contexts = _logger_contexts.get().copy()
-        temp_logger_contexts.update(contexts)
-        _logger_contexts.set(temp_logger_contexts)
+        _logger_contexts.set(_logger_contexts.get().push(contexts))
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        tags_token = _logger_tags.set(_logger_tags.get())
+        contexts_token = _logger_contexts.set(_logger_contexts.get())
+
+        try:
+            yield
+        finally:
+            _logger_contexts.reset(contexts_token)
+            _logger_tags.reset(tags_token)
+
+    def extra(
+        self, tags: Optional[Tags], contexts: Optional[Contexts]
+    ) -> Dict[str, Any]:
+        merged_contexts = resolve_mapping(
+            _logger_contexts.get().merged(resolve(contexts))
+        )
+
+        if self.context_limiter:
+            merged_contexts = self.context_limiter.limit(merged_contexts)
+
+        return {
+            "tags": resolve_mapping(_logger_tags.get().merged(resolve(tags))),
+            "contexts": merged_contexts,
+        }
 
 
 class LoggerMessageHandler(ITrackerHandlerMessage):
@@ -55,16 +224,16 @@ class LoggerMessageHandler(ITrackerHandlerMessage):
     def set_contexts(self, contexts: Contexts):
         self.core.set_contexts(contexts)
 
-    def capture_message(self, tracker_message: TrackerMessage):
-        extra = {"tags": _logger_tags.get(), "contexts": _logger_contexts.get()}
+    def scope(self) -> ContextManager[None]:
+        return self.core.scope()
 
-        if tracker_message.tags:
-            extra["tags"].update(tracker_message.tags)
+    def shared_core(self) -> Hashable:
+        return self.core
 
-        if tracker_message.contexts:
-            extra["contexts"].update(tracker_message.contexts)
+    def capture_message(self, tracker_message: TrackerMessage):
+        extra = self.core.extra(tracker_message.tags, tracker_message.contexts)
 
-        self.core.logger.info(tracker_message.message.value, extra=extra)
+        self.core.logger.info(enum_value(tracker_message.message), extra=extra)
 
 
 class LoggerExceptionHandler(ITrackerHandlerException):
@@ -77,17 +246,14 @@ class LoggerExceptionHandler(ITrackerHandlerException):
     def set_contexts(self, contexts: Contexts):
         self.core.set_contexts(contexts)
 
-    def capture_exception(self, tracker_exception: TrackerException):
-        extra = {
-            "tags": _logger_tags.get(),
-            "contexts": _logger_contexts.get(),
-        }
+    def scope(self) -> ContextManager[None]:
+        return self.core.scope()
 
-        if tracker_exception.tags:
-            extra["tags"].update(tracker_exception.tags)
+    def shared_core(self) -> Hashable:
+        return self.core
 
-        if tracker_exception.contexts:
-            extra["contexts"].update(tracker_exception.contexts)
+    def capture_exception(self, tracker_exception: TrackerException):
+        extra = self.core.extra(tracker_exception.tags, tracker_exception.contexts)
 
         self.core.logger.error(
             tracker_exception.exception.__class__.__name__,
@@ -106,13 +272,13 @@ class LoggerEventHandler(ITrackerHandlerEvent):
     def set_contexts(self, contexts: Contexts):
         self.core.set_contexts(contexts)
 
-    def capture_event(self, tracker_event: TrackerEvent):
-        extra = {"tags": _logger_tags.get(), "contexts": _logger_contexts.get()}
+    def scope(self) -> ContextManager[None]:
+        return self.core.scope()
 
-        if tracker_event.tags:
-            extra["tags"].update(tracker_event.tags)
+    def shared_core(self) -> Hashable:
+        return self.core
 
-        if tracker_event.contexts:
-            extra["contexts"].update(tracker_event.contexts)
+    def capture_event(self, tracker_event: TrackerEvent):
+        extra = self.core.extra(tracker_event.tags, tracker_event.contexts)
 
-        self.core.logger.info(tracker_event.event.value, extra=extra)
+        self.core.logger.info(enum_value(tracker_event.event), extra=extra)
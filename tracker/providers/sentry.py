@@ -1,14 +1,87 @@
 import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Dict, Optional, cast
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import sentry_sdk
 from sentry_sdk.integrations.logging import LoggingIntegration
 
-from ..dtos import TrackerException, TrackerMessage
-from ..interfaces import ITrackerHandlerException, ITrackerHandlerMessage
+from ..dtos import TrackerEvent, TrackerException, TrackerMessage
+from ..forking import register_after_fork
+from ..interfaces import (
+    ITrackerHandlerEvent,
+    ITrackerHandlerException,
+    ITrackerHandlerMessage,
+)
+from ..lazy import resolve, resolve_mapping
+from ..limits import ContextLimiter
+from ..registry import enum_value
+from ..scopes import EMPTY_SCOPE, Scope
 from ..types import Contexts, JSONFields, Tags
 
+# time.time() stamp, category, enum or value, tags.
+Crumb = Tuple[float, str, Any, Optional[Tags]]
+
+
+class BreadcrumbRing:
+    # Mutable holder shared by every copy of the context it was installed
+    # in, so events recorded from a copied context (executor offload,
+    # background dispatcher, batching) still reach the scope's exception.
+    __slots__ = ("size", "slots", "position", "lock")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.slots: Optional[List[Optional[Crumb]]] = None
+        self.position = 0
+        self.lock = threading.Lock()
+
+    def append(self, crumb: Crumb):
+        with self.lock:
+            if self.slots is None:
+                self.slots = [None] * self.size
+
+            self.slots[self.position % self.size] = crumb
+            self.position += 1
+
+    def items(self) -> List[Crumb]:
+        with self.lock:
+            slots = self.slots or []
+
+            if self.position <= self.size:
+                crumbs = slots[: self.position]
+            else:
+                start = self.position % self.size
+                crumbs = slots[start:] + slots[:start]
+
+        return cast(List[Crumb], crumbs)
+
+
+_sentry_breadcrumbs: ContextVar[Optional[BreadcrumbRing]] = ContextVar(
+    "sentry_breadcrumbs", default=None
+)
+# Lazy values from set_tags/set_contexts, resolved on each capture instead
+# of when they are set.
+_sentry_lazy_tags: ContextVar[Scope] = ContextVar(
+    "sentry_lazy_tags", default=EMPTY_SCOPE
+)
+_sentry_lazy_contexts: ContextVar[Scope] = ContextVar(
+    "sentry_lazy_contexts", default=EMPTY_SCOPE
+)
+
 
 class SentryCore:
     @dataclass
@@ -16,8 +89,20 @@ class SentryCore:
         dsn: str
         environment: str
         traces_sample_rate: Optional[float] = None
+        context_limiter: Optional[ContextLimiter] = None
+        breadcrumb_buffer_size: int = 100
 
     def __init__(self, config: SentryConfig):
+        self.config = config
+        # Receives events recorded outside any scope().
+        self._breadcrumbs = BreadcrumbRing(config.breadcrumb_buffer_size)
+        self._init()
+        register_after_fork(self._init)
+
+    def _init(self):
+        # Also runs in forked children (e.g. prefork servers), which must
+        # not reuse the parent's transport thread and connections.
+        config = self.config
         sentry_logging_integration = LoggingIntegration(  # pragma: no mutate
             level=logging.DEBUG,
             event_level=None,
@@ -33,19 +118,136 @@ class SentryCore:
         )
 
     def set_tags(self, tags: Tags):
+        tags = _defer_lazy(_sentry_lazy_tags, resolve(tags))
+
         for key, value in tags.items():
             sentry_sdk.set_tag(key, value)
 
     def set_contexts(self, contexts: Contexts):
-        for key, value in contexts.items():
+        contexts = _defer_lazy(_sentry_lazy_contexts, resolve(contexts))
+
+        for key, value in (self._limited(contexts) or {}).items():
             value = cast(Dict[str, JSONFields], value)  # pragma: no mutate
             sentry_sdk.set_context(key, value)
 
-    def capture_exception(self, exception: Exception):
-        sentry_sdk.capture_exception(exception)
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        # Each scope starts an empty breadcrumb buffer, installed here in
+        # the caller's context and allocated on the first recorded event.
+        token = _sentry_breadcrumbs.set(
+            BreadcrumbRing(self.config.breadcrumb_buffer_size)
+        )
+        tags_token = _sentry_lazy_tags.set(_sentry_lazy_tags.get())
+        contexts_token = _sentry_lazy_contexts.set(_sentry_lazy_contexts.get())
+
+        try:
+            with sentry_sdk.isolation_scope():
+                yield
+        finally:
+            _sentry_lazy_contexts.reset(contexts_token)
+            _sentry_lazy_tags.reset(tags_token)
+            _sentry_breadcrumbs.reset(token)
+
+    def record_breadcrumb(self, category: str, value: Any, tags: Optional[Tags]):
+        self._ring().append((time.time(), category, value, tags))
+
+    def capture_exception(
+        self,
+        exception: Exception,
+        tags: Optional[Tags] = None,
+        contexts: Optional[Contexts] = None,
+    ):
+        scope_kwargs = self._scope_kwargs(tags, contexts)
+        crumbs = self._ring().items()
+
+        if not crumbs:
+            sentry_sdk.capture_exception(exception, **scope_kwargs)
+            return
+
+        # Recorded events only become SDK breadcrumbs here, on a fork of the
+        # current scope, so the shared scope never accumulates them.
+        with sentry_sdk.new_scope() as scope:
+            for crumb in crumbs:
+                scope.add_breadcrumb(_breadcrumb(crumb))
+
+            sentry_sdk.capture_exception(exception, **scope_kwargs)
+
+    def capture_message(
+        self,
+        message: str,
+        tags: Optional[Tags] = None,
+        contexts: Optional[Contexts] = None,
+    ):
+        sentry_sdk.capture_message(message, **self._scope_kwargs(tags, contexts))
+
+    def _ring(self) -> BreadcrumbRing:
+        return _sentry_breadcrumbs.get() or self._breadcrumbs
+
+    def _limited(self, contexts: Optional[Contexts]) -> Any:
+        resolved = resolve_mapping(contexts)
+
+        if self.config.context_limiter:
+            resolved = self.config.context_limiter.limit(resolved)
+
+        return resolved
+
+    def _scope_kwargs(
+        self, tags: Optional[Tags], contexts: Optional[Contexts]
+    ) -> Dict[str, Any]:
+        # Per-event tags and contexts go on the copy of the scope the SDK
+        # makes for this one capture, so they neither cost one SDK call per
+        # key nor leak into later events.
+        scope_kwargs: Dict[str, Any] = {}
+        lazy_tags = _sentry_lazy_tags.get()
+        lazy_contexts = _sentry_lazy_contexts.get()
+
+        if lazy_tags is not EMPTY_SCOPE:
+            tags = lazy_tags.merged(resolve(tags))
+
+        if lazy_contexts is not EMPTY_SCOPE:
+            contexts = lazy_contexts.merged(resolve(contexts))
+
+        resolved_tags = resolve_mapping(tags)
+        resolved_contexts = self._limited(contexts)
 
-    def capture_message(self, message: str):
-        sentry_sdk.capture_message(message)
+        if resolved_tags:
+            scope_kwargs["tags"] = resolved_tags
+
+        if resolved_contexts:
+            scope_kwargs["contexts"] = resolved_contexts
+
+        return scope_kwargs
+
+
+def _defer_lazy(lazy_scope: ContextVar[Scope], values: Any) -> Dict[str, Any]:
+    # Splits off the lazy values for capture time and returns the ones the
+    # SDK scope can take now. An eager value for a key already set lazily
+    # is kept lazy too, so the latest set_* call still wins.
+    current = lazy_scope.get().flatten()
+    deferred = {
+        key: value
+        for key, value in (values or {}).items()
+        if callable(value) or key in current
+    }
+
+    if deferred:
+        lazy_scope.set(lazy_scope.get().push(deferred))
+        return {key: value for key, value in values.items() if key not in deferred}
+
+    return dict(values or {})
+
+
+def _breadcrumb(crumb: Crumb) -> Dict[str, Any]:
+    timestamp, category, value, tags = crumb
+
+    return {
+        "type": "default",
+        "category": category,
+        "message": str(enum_value(value)),
+        "level": "info",
+        "timestamp": datetime.fromtimestamp(timestamp, timezone.utc),
+        "data": resolve_mapping(tags) or {},
+    }
 
 
 class SentryMessageHandler(ITrackerHandlerMessage):
@@ -58,14 +260,18 @@ class SentryMessageHandler(ITrackerHandlerMessage):
     def set_contexts(self, contexts: Contexts):
         self.sentry.set_contexts(contexts)
 
-    def capture_message(self, tracker_message: TrackerMessage):
-        if tracker_message.tags:
-            self.sentry.set_tags(tracker_message.tags)
+    def scope(self) -> ContextManager[None]:
+        return self.sentry.scope()
 
-        if tracker_message.contexts:
-            self.sentry.set_contexts(tracker_message.contexts)
+    def shared_core(self) -> Hashable:
+        return self.sentry
 
-        self.sentry.capture_message(tracker_message.message.value)
+    def capture_message(self, tracker_message: TrackerMessage):
+        self.sentry.capture_message(
+            enum_value(tracker_message.message),
+            tracker_message.tags,
+            tracker_message.contexts,
+        )
 
 
 class SentryExceptionHandler(ITrackerHandlerException):
@@ -78,12 +284,45 @@ class SentryExceptionHandler(ITrackerHandlerException):
     def set_contexts(self, contexts: Contexts):
         self.sentry.set_contexts(contexts)
 
+    def scope(self) -> ContextManager[None]:
+        return self.sentry.scope()
+
+    def shared_core(self) -> Hashable:
+        return self.sentry
+
     def capture_exception(self, tracker_exception: TrackerException):
+        self.sentry.capture_exception(
+            tracker_exception.exception,
+            tracker_exception.tags,
+            tracker_exception.contexts,
+        )
 
-        if tracker_exception.tags:
-            self.sentry.set_tags(tracker_exception.tags)
 
-        if tracker_exception.contexts:
-            self.sentry.set_contexts(tracker_exception.contexts)
+class SentryEventHandler(ITrackerHandlerEvent, ITrackerHandlerMessage):
+    # Records events (and, when registered as a message handler, messages)
+    # without any SDK call; they are sent as breadcrumbs of the next
+    # exception captured by a SentryExceptionHandler in the same scope.
+    def __init__(self, sentry: SentryCore):
+        self.sentry = sentry
+
+    def set_tags(self, tags: Tags):
+        self.sentry.set_tags(tags)
+
+    def set_contexts(self, contexts: Contexts):
+        self.sentry.set_contexts(contexts)
+
+    def scope(self) -> ContextManager[None]:
+        return self.sentry.scope()
 
-        self.sentry.capture_exception(tracker_exception.exception)
+    def shared_core(self) -> Hashable:
+        return self.sentry
+
+    def capture_event(self, tracker_event: TrackerEvent):
+        self.sentry.record_breadcrumb(
+            "tracker.event", tracker_event.event, tracker_event.tags
+        )
+
+    def capture_message(self, tracker_message: TrackerMessage):
+        self.sentry.record_breadcrumb(
+            "tracker.message", tracker_message.message, tracker_message.tags
+        )
@@ -0,0 +1,70 @@
+import operator
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Type
+
+from .helpers import add_slots
+
+# Enum.value is a Python-level property; the raw _value_ slot it wraps is
+# read in C and takes a fraction of the time on the emit path.
+enum_value: Callable[[Enum], Any] = operator.attrgetter("_value_")
+
+
+@add_slots
+@dataclass(frozen=True)
+class EnumEntry:
+    member: Enum
+    value: Any
+    key: str
+
+
+class EnumRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Keyed by id(): Enum.__hash__ is implemented in Python and costs
+        # as much as a .value lookup.
+        self._entries: Dict[int, EnumEntry] = {}
+        self._keys: Dict[str, EnumEntry] = {}
+
+    def register(self, enum_class: Type[Enum]) -> Type[Enum]:
+        prefix = f"{enum_class.__module__}.{enum_class.__qualname__}"
+
+        with self._lock:
+            for member in enum_class.__members__.values():
+                entry = EnumEntry(
+                    member=member, value=member._value_, key=f"{prefix}.{member._name_}"
+                )
+                self._entries[id(member)] = entry
+                self._keys[entry.key] = entry
+
+        return enum_class
+
+    def entry(self, member: Enum) -> EnumEntry:
+        entry = self._entries.get(id(member))
+
+        if entry is None:
+            self.register(type(member))
+            entry = self._entries[id(member)]
+
+        return entry
+
+    def value(self, member: Enum) -> Any:
+        return self.entry(member).value
+
+    def key(self, member: Enum) -> str:
+        return self.entry(member).key
+
+    def resolve(self, key: str) -> Enum:
+        # Keys arrive from spool files and sockets, so only enums registered
+        # here (explicitly or by emitting one of their members) resolve;
+        # nothing is ever imported from a key.
+        entry = self._keys.get(key)
+
+        if entry is None:
+            raise KeyError(f"Enum member {key} is not registered")
+
+        return entry.member
+
+
+enum_registry = EnumRegistry()
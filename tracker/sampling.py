@@ -0,0 +1,130 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Mapping, Optional, Sequence, Tuple
+
+from .interfaces import ITrackerSampler
+from .lazy import resolve
+from .types import Tags
+
+
+class StaticSampler(ITrackerSampler):
+    def __init__(self, rates: Mapping[Hashable, float], default_rate: float = 1.0):
+        self.rates = dict(rates)
+        self.default_rate = default_rate
+
+    def should_sample(self, key: Hashable, tags: Optional[Tags]) -> bool:
+        rate = self.rates.get(key, self.default_rate)
+
+        if rate >= 1:
+            return True
+
+        return random.random() < rate
+
+
+class TokenBucketSampler(ITrackerSampler):
+    @dataclass
+    class _Bucket:
+        tokens: float
+        updated_at: float
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        tag_keys: Sequence[str] = (),
+        max_buckets: int = 10000,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.tag_keys = tuple(tag_keys)
+        self.max_buckets = max_buckets
+        self._lock = threading.Lock()
+        self._buckets: "OrderedDict[Tuple, TokenBucketSampler._Bucket]" = OrderedDict()
+
+    def should_sample(self, key: Hashable, tags: Optional[Tags]) -> bool:
+        bucket_key = (key,) + tuple(
+            resolve((resolve(tags) or {}).get(tag_key)) for tag_key in self.tag_keys
+        )
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._buckets.get(bucket_key)
+
+            if bucket is None:
+                bucket = self._Bucket(tokens=self.burst, updated_at=now)
+                self._buckets[bucket_key] = bucket
+
+                if len(self._buckets) > self.max_buckets:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(bucket_key)
+                elapsed = now - bucket.updated_at
+                bucket.tokens = min(self.burst, bucket.tokens + elapsed * self.rate)
+                bucket.updated_at = now
+
+            if bucket.tokens < 1:
+                return False
+
+            bucket.tokens -= 1
+            return True
+
+
+class AdaptiveSampler(ITrackerSampler):
+    @dataclass
+    class _Window:
+        started_at: float
+        seen: int = 0
+        rate: float = 1.0
+
+    def __init__(self, target_per_second: float, window: float = 1.0):
+        self.target_per_second = target_per_second
+        self.window = window
+        self._lock = threading.Lock()
+        self._windows: Dict[Hashable, AdaptiveSampler._Window] = {}
+
+    def should_sample(self, key: Hashable, tags: Optional[Tags]) -> bool:
+        now = time.monotonic()
+
+        with self._lock:
+            window = self._windows.get(key)
+
+            if window is None:
+                window = self._Window(started_at=now)
+                self._windows[key] = window
+            elif now - window.started_at >= self.window:
+                # The next window samples at the rate that would have kept
+                # the last one on target.
+                budget = self.target_per_second * self.window
+                window.rate = min(1.0, budget / window.seen) if window.seen else 1.0
+                window.started_at = now
+                window.seen = 0
+
+            window.seen += 1
+            rate = window.rate
+
+        return rate >= 1 or random.random() < rate
+
+
+class SamplingPolicy(ITrackerSampler):
+    def __init__(self, samplers: Sequence[ITrackerSampler]):
+        self.samplers = tuple(samplers)
+        self._lock = threading.Lock()
+        self._sampled_out: Dict[Hashable, int] = {}
+
+    @property
+    def sampled_out(self) -> Dict[Hashable, int]:
+        with self._lock:
+            return dict(self._sampled_out)
+
+    def should_sample(self, key: Hashable, tags: Optional[Tags]) -> bool:
+        for sampler in self.samplers:
+            if not sampler.should_sample(key, tags):
+                with self._lock:
+                    self._sampled_out[key] = self._sampled_out.get(key, 0) + 1
+
+                return False
+
+        return True
@@ -0,0 +1,43 @@
+from typing import Any, Dict, Mapping, Optional
+
+MAX_SCOPE_DEPTH = 32
+
+
+class Scope:
+    __slots__ = ("parent", "values", "depth", "_flat")
+
+    def __init__(
+        self,
+        parent: Optional["Scope"] = None,
+        values: Optional[Mapping[str, Any]] = None,
+    ):
+        self.parent = parent
+        self.values = values or {}
+        self.depth = parent.depth + 1 if parent else 0
+        self._flat: Optional[Dict[str, Any]] = None
+
+    def push(self, values: Mapping[str, Any]) -> "Scope":
+        if self.depth >= MAX_SCOPE_DEPTH:
+            # Squash long chains so repeated set_* calls keep lookups bounded.
+            return Scope(None, {**self.flatten(), **values})
+
+        return Scope(self, dict(values))
+
+    def flatten(self) -> Dict[str, Any]:
+        # The flattened view is computed once per layer and shared by every
+        # capture that reads it, so callers must treat it as read-only.
+        if self._flat is None:
+            flat = dict(self.parent.flatten()) if self.parent else {}
+            flat.update(self.values)
+            self._flat = flat
+
+        return self._flat
+
+    def merged(self, values: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+        if not values:
+            return self.flatten()
+
+        return {**self.flatten(), **values}
+
+
+EMPTY_SCOPE = Scope()
@@ -0,0 +1,165 @@
+import builtins
+import json
+import threading
+import traceback
+from typing import Any, Dict, Type, TypeVar, Union
+
+from .dtos import (
+    FrozenTrackerEvent,
+    FrozenTrackerException,
+    FrozenTrackerMessage,
+    TrackerEvent,
+    TrackerException,
+    TrackerMessage,
+)
+from .lazy import resolve_mapping
+from .registry import enum_registry
+
+TrackerItem = Union[TrackerEvent, TrackerMessage, TrackerException]
+ExceptionType = TypeVar("ExceptionType", bound=Type[Exception])
+
+EVENT = "event"
+MESSAGE = "message"
+EXCEPTION = "exception"
+
+_KINDS: Dict[type, str] = {
+    TrackerEvent: EVENT,
+    FrozenTrackerEvent: EVENT,
+    TrackerMessage: MESSAGE,
+    FrozenTrackerMessage: MESSAGE,
+    TrackerException: EXCEPTION,
+    FrozenTrackerException: EXCEPTION,
+}
+
+_encode = json.JSONEncoder(
+    separators=(",", ":"), default=str, check_circular=False
+).encode
+
+
+def _type_name(exception_type: type) -> str:
+    return f"{exception_type.__module__}.{exception_type.__qualname__}"
+
+
+# Records come from spool files and sockets, so only these types are ever
+# instantiated from one; anything else becomes a RemoteException.
+_exception_types_lock = threading.Lock()
+_exception_types: Dict[str, Type[Exception]] = {
+    _type_name(value): value
+    for value in vars(builtins).values()
+    if isinstance(value, type) and issubclass(value, Exception)
+}
+
+
+def register_exception(exception_type: ExceptionType) -> ExceptionType:
+    with _exception_types_lock:
+        _exception_types[_type_name(exception_type)] = exception_type
+
+    return exception_type
+
+
+class RemoteException(Exception):
+    def __init__(self, type_name: str, message: str):
+        super().__init__(message)
+        self.type_name = type_name
+
+    def __str__(self) -> str:
+        return f"{self.type_name}: {self.args[0]}"
+
+
+def kind_of(item: Any) -> str:
+    return _KINDS[type(item)]
+
+
+def to_dict(item: TrackerItem) -> Dict[str, Any]:
+    kind = kind_of(item)
+    record: Dict[str, Any] = {"kind": kind}
+
+    if kind == EVENT:
+        record["event"] = enum_registry.key(item.event)
+    elif kind == MESSAGE:
+        record["message"] = enum_registry.key(item.message)
+    else:
+        record["exception"] = _exception_to_dict(item.exception)
+
+    tags = resolve_mapping(item.tags)
+    contexts = resolve_mapping(item.contexts)
+
+    if tags is not None:
+        record["tags"] = tags
+
+    if contexts is not None:
+        record["contexts"] = contexts
+
+    return record
+
+
+def from_dict(record: Dict[str, Any]) -> TrackerItem:
+    kind = record["kind"]
+    tags = record.get("tags")
+    contexts = record.get("contexts")
+
+    if kind == EVENT:
+        return TrackerEvent(
+            event=enum_registry.resolve(record["event"]), tags=tags, contexts=contexts
+        )
+
+    if kind == MESSAGE:
+        return TrackerMessage(
+            message=enum_registry.resolve(record["message"]),
+            tags=tags,
+            contexts=contexts,
+        )
+
+    if kind == EXCEPTION:
+        return TrackerException(
+            exception=_exception_from_dict(record["exception"]),
+            tags=tags,
+            contexts=contexts,
+        )
+
+    raise ValueError(f"Unknown record kind {kind!r}")
+
+
+def serialize(item: TrackerItem) -> bytes:
+    return _encode(to_dict(item)).encode()
+
+
+def deserialize(data: bytes) -> TrackerItem:
+    return from_dict(json.loads(data))
+
+
+def _exception_to_dict(exception: BaseException) -> Dict[str, Any]:
+    exception_type = type(exception)
+    return {
+        "type": _type_name(exception_type),
+        "args": [arg if _is_json(arg) else str(arg) for arg in exception.args],
+        "traceback": "".join(
+            traceback.format_exception(
+                exception_type, exception, exception.__traceback__
+            )
+        ),
+    }
+
+
+def _exception_from_dict(record: Dict[str, Any]) -> Exception:
+    # The original traceback can't be rebuilt across processes; its text is
+    # kept as a note, which traceback rendering appends from Python 3.11.
+    exception = _rebuild_exception(record["type"], record["args"])
+    exception.__notes__ = [record["traceback"]]
+    return exception
+
+
+def _rebuild_exception(type_name: str, args: list) -> Exception:
+    exception_type = _exception_types.get(type_name)
+
+    if exception_type is not None:
+        try:
+            return exception_type(*args)
+        except Exception:
+            pass
+
+    return RemoteException(type_name, str(args[0]) if len(args) == 1 else str(args))
+
+
+def _is_json(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
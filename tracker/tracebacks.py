@@ -0,0 +1,160 @@
+import builtins
+import logging
+import threading
+import traceback
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import CodeType, TracebackType
+from typing import Any, List, Optional, Set, Tuple
+
+# Same separators traceback.format_exception uses for chained exceptions.
+CAUSE_MESSAGE = (
+    "\nThe above exception was the direct cause of the following exception:\n\n"
+)
+CONTEXT_MESSAGE = (
+    "\nDuring handling of the above exception, another exception occurred:\n\n"
+)
+TRACEBACK_HEADER = "Traceback (most recent call last):\n"
+
+_EXCEPTION_GROUP: Any = getattr(builtins, "BaseExceptionGroup", None)
+
+Fingerprint = Tuple[int, ...]
+
+
+def fingerprint(tb: TracebackType) -> Fingerprint:
+    # Without captured locals, the rendered stack depends only on the code
+    # and instruction of each frame. The instruction offset implies the line
+    # number (computed from the line table on each tb_lineno access) and
+    # tells apart expressions on the same line, which get their own carets
+    # on 3.11+. Code objects go by id, as hashing them walks their bytecode.
+    key: List[int] = []
+    append = key.append
+
+    while tb is not None:
+        append(id(tb.tb_frame.f_code))
+        append(tb.tb_lasti)
+        tb = tb.tb_next  # type: ignore[assignment]
+
+    return tuple(key)
+
+
+def frame_codes(tb: TracebackType) -> Tuple[CodeType, ...]:
+    codes = []
+
+    while tb is not None:
+        codes.append(tb.tb_frame.f_code)
+        tb = tb.tb_next  # type: ignore[assignment]
+
+    return tuple(codes)
+
+
+class TracebackCache(logging.Filter):
+    @dataclass
+    class TracebackConfig:
+        max_size: int = 256
+        # Render only the outermost and innermost N frames of each stack.
+        compact_frames: Optional[int] = None
+
+    def __init__(self, config: TracebackConfig):
+        super().__init__()
+        self.config = config
+        self.hits = 0
+        self.misses = 0
+        # Entries hold on to their code objects, so the ids in their key
+        # can't be reused by other code while they are cached.
+        self._stacks: "OrderedDict[Fingerprint, Tuple[str, Tuple[CodeType, ...]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Installed on a handler, the rendered text lands in exc_text, which
+        # formatters reuse instead of calling formatException.
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.format(record.exc_info)
+
+        return True
+
+    def format(self, exc_info: Any) -> str:
+        exc_type, exception, tb = exc_info
+
+        if exception is None:
+            lines = traceback.format_exception(exc_type, exception, tb)
+        else:
+            lines = []
+            self._render(exception, tb, lines, set())
+
+        # Same shape as logging.Formatter.formatException.
+        text = "".join(lines)
+        return text[:-1] if text.endswith("\n") else text
+
+    def _render(
+        self,
+        exception: BaseException,
+        tb: Optional[TracebackType],
+        lines: List[str],
+        seen: Set[int],
+    ):
+        if _EXCEPTION_GROUP is not None and isinstance(
+            exception, _EXCEPTION_GROUP
+        ):  # pragma: no cover - ExceptionGroup only exists from Python 3.11
+            # Nested groups have their own layout; they're rare enough to
+            # render uncached.
+            lines.extend(traceback.format_exception(type(exception), exception, tb))
+            return
+
+        seen.add(id(exception))
+        cause = exception.__cause__
+        context = exception.__context__
+
+        if cause is not None and id(cause) not in seen:
+            self._render(cause, cause.__traceback__, lines, seen)
+            lines.append(CAUSE_MESSAGE)
+        elif (
+            context is not None
+            and not exception.__suppress_context__
+            and id(context) not in seen
+        ):
+            self._render(context, context.__traceback__, lines, seen)
+            lines.append(CONTEXT_MESSAGE)
+
+        if tb is not None:
+            lines.append(TRACEBACK_HEADER)
+            lines.append(self._stack(tb))
+
+        # The message differs between occurrences, so it is never cached.
+        lines.extend(traceback.format_exception_only(type(exception), exception))
+
+    def _stack(self, tb: TracebackType) -> str:
+        key = fingerprint(tb)
+
+        with self._lock:
+            entry = self._stacks.get(key)
+
+            if entry is not None:
+                self._stacks.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+        stack = self._render_stack(tb)
+
+        with self._lock:
+            self.misses += 1
+            self._stacks[key] = (stack, frame_codes(tb))
+
+            if len(self._stacks) > self.config.max_size:
+                self._stacks.popitem(last=False)
+
+        return stack
+
+    def _render_stack(self, tb: TracebackType) -> str:
+        frames = traceback.extract_tb(tb)
+        keep = self.config.compact_frames
+
+        if keep is None or len(frames) <= 2 * keep:
+            return "".join(frames.format())
+
+        omitted = len(frames) - 2 * keep
+        head = traceback.StackSummary.from_list(frames[:keep]).format()
+        tail = traceback.StackSummary.from_list(frames[len(frames) - keep :]).format()
+        return "".join(head) + f"  ... {omitted} frames omitted ...\n" + "".join(tail)
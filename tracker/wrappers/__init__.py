@@ -0,0 +1,14 @@
+from .batching import BatchingHandler
+from .circuit_breaker import CircuitBreakerHandler, CircuitState
+from .dedup import DeduplicatingExceptionHandler, exception_fingerprint
+from .spool import FsyncPolicy, SpoolingHandler
+
+__all__ = [
+    "BatchingHandler",
+    "CircuitBreakerHandler",
+    "CircuitState",
+    "DeduplicatingExceptionHandler",
+    "exception_fingerprint",
+    "FsyncPolicy",
+    "SpoolingHandler",
+]
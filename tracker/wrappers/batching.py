@@ -0,0 +1,216 @@
+import atexit
+import contextvars
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ..dtos import TrackerEvent, TrackerException, TrackerMessage
+from ..forking import register_after_fork
+from ..interfaces import (
+    IQueueReporter,
+    ITrackerHandlerEvent,
+    ITrackerHandlerEventBatch,
+    ITrackerHandlerException,
+    ITrackerHandlerExceptionBatch,
+    ITrackerHandlerMessage,
+    ITrackerHandlerMessageBatch,
+)
+from ..metrics import QueueStats
+from ..types import Contexts, Tags
+
+logger = logging.getLogger(__name__)
+
+Entry = Tuple[contextvars.Context, Any]
+
+
+@dataclass(frozen=True)
+class _Kind:
+    name: str
+    batch_interface: type
+    batch_method: str
+    single_method: str
+
+
+_EVENT = _Kind(
+    "event", ITrackerHandlerEventBatch, "capture_events_batch", "capture_event"
+)
+_MESSAGE = _Kind(
+    "message", ITrackerHandlerMessageBatch, "capture_messages_batch", "capture_message"
+)
+_EXCEPTION = _Kind(
+    "exception",
+    ITrackerHandlerExceptionBatch,
+    "capture_exceptions_batch",
+    "capture_exception",
+)
+
+
+class BatchingHandler(
+    ITrackerHandlerEvent,
+    ITrackerHandlerMessage,
+    ITrackerHandlerException,
+    IQueueReporter,
+):
+    @dataclass
+    class BatchingConfig:
+        max_batch_size: int = 100
+        max_batch_age: Optional[float] = 1.0
+
+    def __init__(
+        self,
+        handler: Union[
+            ITrackerHandlerEvent, ITrackerHandlerMessage, ITrackerHandlerException
+        ],
+        config: BatchingConfig,
+    ):
+        self.handler = handler
+        self.config = config
+        self._stopped = threading.Event()
+        self._start()
+
+        if config.max_batch_age is not None:
+            atexit.register(self.close)
+
+        register_after_fork(self._restart)
+
+    @property
+    def pending(self) -> int:
+        return sum(len(batch) for batch in self._batches.values())
+
+    def queue_stats(self) -> QueueStats:
+        return QueueStats(name=type(self).__name__, depth=self.pending, dropped=0)
+
+    def set_tags(self, tags: Tags):
+        self.handler.set_tags(tags)
+
+    def set_contexts(self, contexts: Contexts):
+        self.handler.set_contexts(contexts)
+
+    def scope(self) -> ContextManager[None]:
+        return self.handler.scope()
+
+    def shared_core(self) -> Hashable:
+        return self.handler.shared_core()
+
+    def capture_event(self, tracker_event: TrackerEvent):
+        self._append(_EVENT, tracker_event)
+
+    def capture_message(self, tracker_message: TrackerMessage):
+        self._append(_MESSAGE, tracker_message)
+
+    def capture_exception(self, tracker_exception: TrackerException):
+        self._append(_EXCEPTION, tracker_exception)
+
+    def flush(self):
+        for kind in self._batches:
+            with self._lock:
+                entries = self._take(kind)
+
+            self._deliver(kind, entries)
+
+    def close(self):
+        if self._stopped.is_set():
+            return
+
+        self._stopped.set()
+        atexit.unregister(self.close)
+
+        if self._flusher:
+            self._flusher.join()
+
+        self.flush()
+
+    def _start(self):
+        self._lock = threading.Lock()
+        self._batches: Dict[_Kind, List[Entry]] = {
+            _EVENT: [],
+            _MESSAGE: [],
+            _EXCEPTION: [],
+        }
+        self._started_at: Dict[_Kind, float] = {}
+        self._flusher: Optional[threading.Thread] = None
+
+        if self.config.max_batch_age is not None:
+            self._flusher = threading.Thread(
+                target=self._run, name="Tracker.BatchingHandler", daemon=True
+            )
+            self._flusher.start()
+
+    def _restart(self):
+        # The flusher doesn't survive fork(); pending entries are left to
+        # the parent.
+        if not self._stopped.is_set():
+            self._start()
+
+    def _append(self, kind: _Kind, item: Any):
+        # Per-item fallbacks run later, possibly on the flusher thread, so
+        # the caller's ambient scope is kept with each item.
+        entry = (contextvars.copy_context(), item)
+
+        with self._lock:
+            batch = self._batches[kind]
+            batch.append(entry)
+
+            if len(batch) == 1:
+                self._started_at[kind] = time.monotonic()
+
+            if len(batch) < self.config.max_batch_size and not self._expired(kind):
+                return
+
+            entries = self._take(kind)
+
+        self._deliver(kind, entries)
+
+    def _expired(self, kind: _Kind) -> bool:
+        if self.config.max_batch_age is None or not self._batches[kind]:
+            return False
+
+        age = time.monotonic() - self._started_at[kind]
+        return age >= self.config.max_batch_age
+
+    def _take(self, kind: _Kind) -> List[Entry]:
+        entries = self._batches[kind]
+        self._batches[kind] = []
+        return entries
+
+    def _deliver(self, kind: _Kind, entries: List[Entry]):
+        if not entries:
+            return
+
+        if isinstance(self.handler, kind.batch_interface):
+            try:
+                getattr(self.handler, kind.batch_method)([item for _, item in entries])
+            except Exception as e:
+                logger.error(
+                    f"Error flushing {kind.name} batch for handler {self.handler}: {e}"
+                )
+            return
+
+        capture = getattr(self.handler, kind.single_method)
+
+        for context, item in entries:
+            try:
+                context.run(capture, item)
+            except Exception as e:
+                logger.error(
+                    f"Error flushing {kind.name} for handler {self.handler}: {e}"
+                )
+
+    def _run(self):
+        while not self._stopped.wait(self.config.max_batch_age):
+            for kind in self._batches:
+                with self._lock:
+                    entries = self._take(kind) if self._expired(kind) else []
+
+                self._deliver(kind, entries)
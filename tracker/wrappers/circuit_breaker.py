@@ -0,0 +1,227 @@
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from concurrent import futures
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Hashable,
+    Optional,
+    Union,
+)
+
+from ..dtos import TrackerEvent, TrackerException, TrackerMessage
+from ..forking import register_after_fork
+from ..interfaces import (
+    ICircuitReporter,
+    ITrackerHandlerEvent,
+    ITrackerHandlerException,
+    ITrackerHandlerMessage,
+)
+from ..metrics import CircuitStats
+from ..types import Contexts, Tags
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerHandler(
+    ITrackerHandlerEvent,
+    ITrackerHandlerMessage,
+    ITrackerHandlerException,
+    ICircuitReporter,
+):
+    @dataclass
+    class CircuitBreakerConfig:
+        failure_threshold: int = 5
+        window: float = 60.0
+        slow_call_threshold: Optional[float] = None
+        reset_timeout: float = 30.0
+        half_open_max_calls: int = 1
+        call_timeout: Optional[float] = None
+        timeout_workers: int = 4
+        max_pending_calls: int = 16
+        # Reported in circuit_stats(); defaults to the handler's type name.
+        name: Optional[str] = None
+
+    def __init__(
+        self,
+        handler: Union[
+            ITrackerHandlerEvent, ITrackerHandlerMessage, ITrackerHandlerException
+        ],
+        config: CircuitBreakerConfig,
+    ):
+        self.handler = handler
+        self.config = config
+        self.short_circuited = 0
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures: Deque[float] = deque()
+        self._opened_at = 0.0
+        self._probes = 0
+        self._executor: Optional[futures.ThreadPoolExecutor] = None
+        self._pending: Optional[threading.BoundedSemaphore] = None
+
+        if config.call_timeout is not None:
+            self._start_executor()
+
+        register_after_fork(self._restart)
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def circuit_stats(self) -> CircuitStats:
+        with self._lock:
+            return CircuitStats(
+                name=self.config.name or type(self.handler).__name__,
+                state=self._state.value,
+                failures=len(self._failures),
+                short_circuited=self.short_circuited,
+            )
+
+    def set_tags(self, tags: Tags):
+        self.handler.set_tags(tags)
+
+    def set_contexts(self, contexts: Contexts):
+        self.handler.set_contexts(contexts)
+
+    def scope(self) -> ContextManager[None]:
+        return self.handler.scope()
+
+    def shared_core(self) -> Hashable:
+        return self.handler.shared_core()
+
+    def capture_event(self, tracker_event: TrackerEvent):
+        self._call(self.handler.capture_event, tracker_event)
+
+    def capture_message(self, tracker_message: TrackerMessage):
+        self._call(self.handler.capture_message, tracker_message)
+
+    def capture_exception(self, tracker_exception: TrackerException):
+        self._call(self.handler.capture_exception, tracker_exception)
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    def _restart(self):
+        # In a forked child the lock may have been held by another thread at
+        # fork time, and the pool's threads are gone.
+        self._lock = threading.Lock()
+
+        if self._executor is not None:
+            self._start_executor()
+
+    def _start_executor(self):
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=self.config.timeout_workers,
+            thread_name_prefix="Tracker.CircuitBreakerHandler",
+        )
+        self._pending = threading.BoundedSemaphore(self.config.max_pending_calls)
+
+    def _call(self, capture: Callable[[Any], None], item: Any):
+        if not self._acquire():
+            return
+
+        started = time.monotonic()
+
+        try:
+            self._run(capture, item)
+        except Exception:
+            self._record(failed=True)
+            raise
+
+        threshold = self.config.slow_call_threshold
+        self._record(
+            failed=threshold is not None and time.monotonic() - started >= threshold
+        )
+
+    def _run(self, capture: Callable[[Any], None], item: Any):
+        if self._executor is None or self._pending is None:
+            capture(item)
+            return
+
+        # A call that already started keeps running on the worker after a
+        # timeout, so a slow backend could pile up work behind the breaker;
+        # submissions are capped and queued ones are cancelled on timeout.
+        pending = self._pending
+
+        if not pending.acquire(blocking=False):
+            raise RuntimeError(f"{self.config.max_pending_calls} calls already pending")
+
+        context = contextvars.copy_context()
+
+        try:
+            future = self._executor.submit(context.run, capture, item)
+        except Exception:
+            pending.release()
+            raise
+
+        future.add_done_callback(lambda _: pending.release())
+
+        try:
+            future.result(timeout=self.config.call_timeout)
+        except futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Timed out after {self.config.call_timeout}s") from None
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            if self._state is CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.config.reset_timeout:
+                    self.short_circuited += 1
+                    return False
+
+                self._state = CircuitState.HALF_OPEN
+                self._probes = 0
+
+            if self._state is CircuitState.HALF_OPEN:
+                if self._probes >= self.config.half_open_max_calls:
+                    self.short_circuited += 1
+                    return False
+
+                self._probes += 1
+
+            return True
+
+    def _record(self, failed: bool):
+        now = time.monotonic()
+
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                if failed:
+                    self._open(now)
+                else:
+                    self._state = CircuitState.CLOSED
+                    self._failures.clear()
+                    logger.warning(f"Circuit closed for handler {self.handler}")
+                return
+
+            if not failed or self._state is CircuitState.OPEN:
+                return
+
+            self._failures.append(now)
+
+            while now - self._failures[0] > self.config.window:
+                self._failures.popleft()
+
+            if len(self._failures) >= self.config.failure_threshold:
+                self._open(now)
+
+    def _open(self, now: float):
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._failures.clear()
+        logger.warning(f"Circuit opened for handler {self.handler}")
@@ -0,0 +1,205 @@
+import atexit
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import ContextManager, Hashable, List, Optional
+
+from ..dtos import TrackerException
+from ..forking import register_after_fork
+from ..interfaces import ITrackerHandlerException
+from ..lazy import resolve
+from ..types import Contexts, Tags
+
+logger = logging.getLogger(__name__)
+
+
+def exception_fingerprint(exception: BaseException) -> Hashable:
+    # Only code locations are used: walking the traceback is cheap, while
+    # rendering it (linecache, repr of locals) is what storms pay for.
+    frames = []
+    traceback = exception.__traceback__
+
+    while traceback is not None:
+        code = traceback.tb_frame.f_code
+        frames.append((code.co_filename, code.co_name, traceback.tb_lineno))
+        traceback = traceback.tb_next
+
+    exception_type = type(exception)
+    return (exception_type.__module__, exception_type.__qualname__, tuple(frames))
+
+
+class DeduplicatingExceptionHandler(ITrackerHandlerException):
+    @dataclass
+    class DeduplicationConfig:
+        window: float = 60.0
+        max_fingerprints: int = 1024
+        flush_in_background: bool = True
+
+    @dataclass
+    class _Entry:
+        window_started_at: float
+        suppressed: int = 0
+        last: Optional[TrackerException] = None
+
+    def __init__(self, handler: ITrackerHandlerException, config: DeduplicationConfig):
+        self.handler = handler
+        self.config = config
+        self._stopped = threading.Event()
+        self._start()
+
+        if config.flush_in_background:
+            atexit.register(self.close)
+
+        register_after_fork(self._restart)
+
+    def set_tags(self, tags: Tags):
+        self.handler.set_tags(tags)
+
+    def set_contexts(self, contexts: Contexts):
+        self.handler.set_contexts(contexts)
+
+    def scope(self) -> ContextManager[None]:
+        return self.handler.scope()
+
+    def shared_core(self) -> Hashable:
+        return self.handler.shared_core()
+
+    def capture_exception(self, tracker_exception: TrackerException):
+        fingerprint = exception_fingerprint(tracker_exception.exception)
+        now = time.monotonic()
+        forward: List[TrackerException] = []
+
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+
+            if entry is None:
+                self._entries[fingerprint] = self._Entry(window_started_at=now)
+                forward.append(tracker_exception)
+
+                if len(self._entries) > self.config.max_fingerprints:
+                    evicted = self._entries.popitem(last=False)
+                    forward.extend(self._drain(*evicted))
+            else:
+                self._entries.move_to_end(fingerprint)
+
+                if now - entry.window_started_at < self.config.window:
+                    entry.suppressed += 1
+                    entry.last = tracker_exception
+                elif entry.suppressed:
+                    # Report this occurrence together with the ones
+                    # suppressed since the last forward.
+                    entry.suppressed += 1
+                    entry.last = tracker_exception
+                    forward.extend(self._drain(fingerprint, entry))
+                    entry.window_started_at = now
+                else:
+                    forward.append(tracker_exception)
+                    entry.window_started_at = now
+
+        for item in forward:
+            self.handler.capture_exception(item)
+
+    def flush(self):
+        with self._lock:
+            forward = [
+                item
+                for fingerprint, entry in self._entries.items()
+                for item in self._drain(fingerprint, entry)
+            ]
+
+        self._forward_aggregates(forward)
+
+    def close(self):
+        if self._stopped.is_set():
+            return
+
+        self._stopped.set()
+        atexit.unregister(self.close)
+
+        if self._flusher:
+            self._flusher.join()
+
+        self.flush()
+
+    def _start(self):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, DeduplicatingExceptionHandler._Entry]" = (
+            OrderedDict()
+        )
+        self._flusher: Optional[threading.Thread] = None
+
+        if self.config.flush_in_background:
+            self._flusher = threading.Thread(
+                target=self._run,
+                name="Tracker.DeduplicatingExceptionHandler",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def _restart(self):
+        # The flusher doesn't survive fork() and the lock may have been held
+        # by another thread at fork time; suppressed counts recorded before
+        # the fork are reported by the parent.
+        if not self._stopped.is_set():
+            self._start()
+
+    def _run(self):
+        # A burst that simply stops would otherwise only be reported on the
+        # next occurrence, an eviction or an explicit flush().
+        while not self._stopped.wait(self.config.window):
+            self._flush_expired()
+
+    def _flush_expired(self):
+        now = time.monotonic()
+        forward: List[TrackerException] = []
+
+        with self._lock:
+            for fingerprint, entry in self._entries.items():
+                if entry.suppressed and (
+                    now - entry.window_started_at >= self.config.window
+                ):
+                    forward.extend(self._drain(fingerprint, entry))
+                    entry.window_started_at = now
+
+        self._forward_aggregates(forward)
+
+    def _forward_aggregates(self, forward: List[TrackerException]):
+        # Runs on the flusher thread, at close and at exit, where nobody
+        # would handle the error.
+        for item in forward:
+            try:
+                self.handler.capture_exception(item)
+            except Exception as e:
+                logger.error(
+                    f"Error flushing aggregate for handler {self.handler}: {e}"
+                )
+
+    def _drain(
+        self, fingerprint: Hashable, entry: "DeduplicatingExceptionHandler._Entry"
+    ) -> List[TrackerException]:
+        last = entry.last
+
+        if not entry.suppressed or last is None:
+            return []
+
+        aggregated = TrackerException(
+            exception=last.exception,
+            tags=last.tags,
+            contexts={
+                **(resolve(last.contexts) or {}),
+                "deduplication": {
+                    "fingerprint": self._digest(fingerprint),
+                    "occurrences": entry.suppressed,
+                    "window_seconds": self.config.window,
+                },
+            },
+        )
+        entry.suppressed = 0
+        entry.last = None
+        return [aggregated]
+
+    def _digest(self, fingerprint: Hashable) -> str:
+        return hashlib.sha1(repr(fingerprint).encode()).hexdigest()
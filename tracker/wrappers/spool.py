@@ -0,0 +1,436 @@
+import atexit
+import contextlib
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    BinaryIO,
+    ContextManager,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ..dtos import TrackerEvent, TrackerException, TrackerMessage
+from ..interfaces import (
+    IQueueReporter,
+    ITrackerHandlerEvent,
+    ITrackerHandlerException,
+    ITrackerHandlerMessage,
+)
+from ..metrics import QueueStats
+from ..serialization import (
+    EVENT,
+    MESSAGE,
+    TrackerItem,
+    deserialize,
+    kind_of,
+    serialize,
+)
+from ..types import Contexts, Tags
+
+logger = logging.getLogger(__name__)
+
+# Each record is framed as payload length + CRC32 of the payload, so a torn
+# write at the tail of a segment is detected instead of replayed.
+_HEADER = struct.Struct(">II")
+_SEGMENT_SUFFIX = ".seg"
+_CHECKPOINT = "checkpoint"
+_QUARANTINE = "quarantine"
+
+
+class FsyncPolicy(Enum):
+    RECORD = "record"
+    BATCH = "batch"
+    INTERVAL = "interval"
+
+
+class SpoolingHandler(
+    ITrackerHandlerEvent,
+    ITrackerHandlerMessage,
+    ITrackerHandlerException,
+    IQueueReporter,
+):
+    @dataclass
+    class SpoolConfig:
+        directory: str
+        fsync_policy: FsyncPolicy = FsyncPolicy.BATCH
+        fsync_batch_size: int = 100
+        fsync_interval: float = 1.0
+        segment_size: int = 16 * 1024 * 1024
+        max_bytes: int = 256 * 1024 * 1024
+        retry_interval: float = 1.0
+        max_delivery_attempts: int = 5
+        replay_in_background: bool = True
+
+    def __init__(
+        self,
+        handler: Union[
+            ITrackerHandlerEvent, ITrackerHandlerMessage, ITrackerHandlerException
+        ],
+        config: SpoolConfig,
+    ):
+        self.handler = handler
+        self.config = config
+        self.evicted_segments = 0
+        self.quarantined_records = 0
+        self._lock = threading.Lock()
+        self._replay_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._replayer: Optional[threading.Thread] = None
+
+        os.makedirs(config.directory, exist_ok=True)
+        self._sizes: Dict[int, int] = {
+            seq: os.path.getsize(self._path(seq)) for seq in self._existing_segments()
+        }
+        self._checkpoint = self._saved_checkpoint = self._load_checkpoint()
+
+        # Segments left by a previous process are only replayed; writing
+        # always starts a fresh segment.
+        self._file: BinaryIO
+        self._active = max(self._sizes, default=0) + 1
+        self._open_segment(self._active)
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+        # Delivery attempts of the record at the head of the spool, and
+        # when the next one is due after a failure.
+        self._failures: Tuple[Tuple[int, int], int] = ((0, 0), 0)
+        self._retry_at = 0.0
+
+        if config.replay_in_background:
+            self._replayer = threading.Thread(
+                target=self._run, name="Tracker.SpoolingHandler", daemon=True
+            )
+            self._replayer.start()
+
+        atexit.register(self.close)
+
+    @property
+    def spooled_bytes(self) -> int:
+        checkpoint_seq, offset = self._checkpoint
+
+        with self._lock:
+            pending = sum(
+                size for seq, size in self._sizes.items() if seq >= checkpoint_seq
+            )
+            return pending - offset if checkpoint_seq in self._sizes else pending
+
+    def queue_stats(self) -> QueueStats:
+        return QueueStats(
+            name=type(self).__name__,
+            depth=self.spooled_bytes,
+            dropped=self.evicted_segments,
+        )
+
+    def set_tags(self, tags: Tags):
+        self.handler.set_tags(tags)
+
+    def set_contexts(self, contexts: Contexts):
+        self.handler.set_contexts(contexts)
+
+    def scope(self) -> ContextManager[None]:
+        return self.handler.scope()
+
+    def shared_core(self) -> Hashable:
+        return self.handler.shared_core()
+
+    def capture_event(self, tracker_event: TrackerEvent):
+        self._append(tracker_event)
+
+    def capture_message(self, tracker_message: TrackerMessage):
+        self._append(tracker_message)
+
+    def capture_exception(self, tracker_exception: TrackerException):
+        self._append(tracker_exception)
+
+    def flush(self) -> int:
+        with self._lock:
+            self._sync()
+
+        return self.replay()
+
+    def close(self):
+        if self._stopped.is_set():
+            return
+
+        self._stopped.set()
+        self._wake.set()
+        atexit.unregister(self.close)
+
+        if self._replayer:
+            self._replayer.join()
+
+        with self._lock:
+            self._sync()
+            self._file.close()
+
+    def replay(self) -> int:
+        with self._replay_lock:
+            return self._replay()
+
+    def _append(self, item: TrackerItem):
+        payload = serialize(item)
+        record = _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        with self._lock:
+            # Unbuffered: every record reaches the OS in a single write, so a
+            # process crash loses nothing; fsync guards against host crashes.
+            self._file.write(record)
+            self._sizes[self._active] += len(record)
+            self._unsynced += 1
+
+            if self._should_sync():
+                self._sync()
+
+            if self._sizes[self._active] >= self.config.segment_size:
+                self._rollover()
+
+        # While backing off after a failure, new records wait for the retry
+        # instead of each forcing another attempt at the failing one.
+        if time.monotonic() >= self._retry_at:
+            self._wake.set()
+
+    def _should_sync(self) -> bool:
+        policy = self.config.fsync_policy
+
+        if policy is FsyncPolicy.RECORD:
+            return True
+
+        if policy is FsyncPolicy.BATCH:
+            return self._unsynced >= self.config.fsync_batch_size
+
+        return time.monotonic() - self._synced_at >= self.config.fsync_interval
+
+    def _sync(self):
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+        self._synced_at = time.monotonic()
+
+    def _rollover(self):
+        self._sync()
+        self._file.close()
+        self._active += 1
+        self._open_segment(self._active)
+
+        while (
+            sum(self._sizes.values()) > self.config.max_bytes and len(self._sizes) > 1
+        ):
+            oldest = min(self._sizes)
+            self._sizes.pop(oldest)
+            self._remove(oldest)
+            self.evicted_segments += 1
+            logger.warning(
+                f"Spool exceeded {self.config.max_bytes} bytes, "
+                f"evicted segment {self._path(oldest)}"
+            )
+
+    def _open_segment(self, seq: int):
+        self._file = open(self._path(seq), "ab", buffering=0)
+        self._sizes[seq] = 0
+
+    def _run(self):
+        # Also honours FsyncPolicy.INTERVAL once appends stop, since the
+        # append path only checks the interval when a record is written.
+        timeout = self.config.retry_interval
+
+        if self.config.fsync_policy is FsyncPolicy.INTERVAL:
+            timeout = min(timeout, self.config.fsync_interval)
+
+        while not self._stopped.is_set():
+            backoff = self._retry_at - time.monotonic()
+            self._wake.wait(min(timeout, backoff) if backoff > 0 else timeout)
+            self._wake.clear()
+
+            with self._lock:
+                if self._should_sync():
+                    self._sync()
+
+            if time.monotonic() >= self._retry_at:
+                self.replay()
+
+    def _replay(self) -> int:
+        delivered = 0
+
+        with self._lock:
+            segments = sorted(self._sizes)
+            active = self._active
+
+        for seq in segments:
+            checkpoint_seq, offset = self._checkpoint
+
+            if seq < checkpoint_seq:
+                self._discard(seq)
+                continue
+
+            if seq > checkpoint_seq:
+                offset = 0
+
+            for end, payload in self._read(seq, offset):
+                if not self._replay_record(seq, payload):
+                    if not self._give_up(seq, end, payload):
+                        self._save_checkpoint()
+                        return delivered
+
+                    self._checkpoint = (seq, end)
+                    continue
+
+                self._checkpoint = (seq, end)
+                delivered += 1
+
+            if seq == active:
+                break
+
+            # Segments behind the active one are complete once read.
+            self._discard(seq)
+            self._checkpoint = (seq + 1, 0)
+
+        self._save_checkpoint()
+        return delivered
+
+    def _replay_record(self, seq: int, payload: bytes) -> bool:
+        # A record that doesn't decode may only need an enum the application
+        # registers after startup, so it is retried like a failed delivery
+        # instead of being skipped.
+        try:
+            item = deserialize(payload)
+        except Exception as e:
+            logger.error(f"Error decoding spooled record in {self._path(seq)}: {e}")
+            return False
+
+        try:
+            self._deliver(item)
+        except Exception as e:
+            logger.error(
+                f"Error replaying spooled {kind_of(item)} "
+                f"for handler {self.handler}: {e}"
+            )
+            return False
+
+        return True
+
+    def _give_up(self, seq: int, end: int, payload: bytes) -> bool:
+        # A record that keeps failing would block every record behind it,
+        # so after max_delivery_attempts it is moved aside.
+        # Attempts count once per retry_interval: flush() or replay() calls
+        # during the backoff don't bring an outage closer to quarantine.
+        now = time.monotonic()
+        position, attempts = self._failures
+
+        if position == (seq, end) and now < self._retry_at:
+            return False
+
+        attempts = attempts + 1 if position == (seq, end) else 1
+        self._retry_at = now + self.config.retry_interval
+
+        if attempts < self.config.max_delivery_attempts:
+            self._failures = ((seq, end), attempts)
+            return False
+
+        self._failures = ((0, 0), 0)
+        self._retry_at = 0.0
+        self.quarantined_records += 1
+        path = os.path.join(self.config.directory, _QUARANTINE)
+
+        with open(path, "ab") as quarantine:
+            quarantine.write(_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+
+        logger.error(
+            f"Moved spooled record to {path} after {attempts} failed deliveries"
+        )
+        return True
+
+    def _read(self, seq: int, offset: int) -> Iterator[Tuple[int, bytes]]:
+        try:
+            spooled = open(self._path(seq), "rb")
+        except FileNotFoundError:
+            return
+
+        with spooled:
+            size = os.fstat(spooled.fileno()).st_size
+
+            if size <= offset:
+                return
+
+            with mmap.mmap(spooled.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                while offset + _HEADER.size <= size:
+                    length, checksum = _HEADER.unpack_from(mapped, offset)
+                    start = offset + _HEADER.size
+                    end = start + length
+
+                    if end > size:
+                        return
+
+                    payload = mapped[start:end]
+
+                    if zlib.crc32(payload) != checksum:
+                        logger.error(
+                            f"Corrupt record in {self._path(seq)} at offset {offset}"
+                        )
+                        return
+
+                    yield end, payload
+                    offset = end
+
+    def _deliver(self, item: TrackerItem):
+        kind = kind_of(item)
+
+        if kind == EVENT:
+            self.handler.capture_event(item)
+        elif kind == MESSAGE:
+            self.handler.capture_message(item)
+        else:
+            self.handler.capture_exception(item)
+
+    def _existing_segments(self) -> List[int]:
+        return sorted(
+            int(name[: -len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(self.config.directory)
+            if name.endswith(_SEGMENT_SUFFIX)
+        )
+
+    def _load_checkpoint(self) -> Tuple[int, int]:
+        try:
+            with open(os.path.join(self.config.directory, _CHECKPOINT)) as checkpoint:
+                seq, offset = checkpoint.read().split()
+                return int(seq), int(offset)
+        except (FileNotFoundError, ValueError):
+            return 0, 0
+
+    def _save_checkpoint(self):
+        if self._checkpoint == self._saved_checkpoint:
+            return
+
+        path = os.path.join(self.config.directory, _CHECKPOINT)
+        temporary = f"{path}.tmp"
+
+        with open(temporary, "w") as checkpoint:
+            checkpoint.write("%d %d" % self._checkpoint)
+
+        os.replace(temporary, path)
+        self._saved_checkpoint = self._checkpoint
+
+    def _discard(self, seq: int):
+        with self._lock:
+            self._sizes.pop(seq, None)
+
+        self._remove(seq)
+
+    def _remove(self, seq: int):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._path(seq))
+
+    def _path(self, seq: int) -> str:
+        return os.path.join(self.config.directory, f"{seq:020d}{_SEGMENT_SUFFIX}")